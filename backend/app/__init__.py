@@ -1,3 +0,0 @@
-from app.core.logger_config import setup_logging
-
-setup_logging()
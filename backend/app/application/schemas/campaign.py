@@ -1,7 +1,18 @@
-from datetime import date
-from typing import Optional
+from datetime import date, datetime
+from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
+
+
+# Line-oriented file formats used to export and import campaigns.
+CampaignFileFormat = Literal["ndjson", "csv"]
+
+CAMPAIGN_EXPORT_FIELDS = (
+    "id", "name", "description", "start_date", "end_date", "budget", "is_active"
+)
+
+# Fields of the Campaign read schema, selectable with `fields=` on reads.
+CAMPAIGN_FIELDS = CAMPAIGN_EXPORT_FIELDS + ("version", "updated_at")
 
 
 class CampaignBase(BaseModel):
@@ -51,5 +62,73 @@ def end_date_must_be_after_start_date_for_update(_, end_date: date, info: Valida
 class Campaign(CampaignBase):
     """Schema for reading campaign data, including the ID."""
     id: int
+    version: int = 1
+    updated_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
+
+
+class CampaignBulkItemError(BaseModel):
+    """Schema describing why one item of a bulk request was rejected."""
+    index: int
+    errors: List[Dict[str, Any]]
+
+
+class CampaignBulkCreateResult(BaseModel):
+    """Schema for the outcome of a bulk campaign creation."""
+    created: int
+    ids: List[int]
+    errors: List[CampaignBulkItemError]
+
+
+class CampaignImportLineError(BaseModel):
+    """Schema describing why one line of an imported file was rejected."""
+    line: int
+    errors: List[Dict[str, Any]]
+
+
+class CampaignImportResult(BaseModel):
+    """Schema for the outcome of a campaign file import."""
+    received: int
+    created: int
+    failed: int
+    errors: List[CampaignImportLineError]
+    errors_truncated: bool = False
+
+
+class CampaignSelection(BaseModel):
+    """Schema selecting campaigns for a bulk mutation (all criteria are ANDed)."""
+    ids: Optional[List[int]] = Field(None, max_length=10_000)
+    is_active: Optional[bool] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+    @model_validator(mode="after")
+    def require_a_criterion(self):
+        """Refuse empty selections, which would touch every campaign."""
+        if all(value is None for value in self.model_dump().values()):
+            raise ValueError("At least one selection criterion is required")
+        return self
+
+
+class CampaignBulkMutationResult(BaseModel):
+    """Schema for the outcome of a bulk update or delete."""
+    affected: int
+    ids: Optional[List[int]] = None
+
+
+class CampaignMonthStats(BaseModel):
+    """Schema for the campaigns starting in one month."""
+    month: date
+    count: int
+    budget_total: float
+
+
+class CampaignStats(BaseModel):
+    """Schema for campaign budget aggregates."""
+    count: int
+    active_count: int
+    inactive_count: int
+    budget_total: float
+    budget_average: Optional[float] = None
+    by_month: List[CampaignMonthStats]
@@ -1,9 +1,17 @@
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Literal, Optional, TypeVar
 from pydantic import BaseModel
 
 T = TypeVar("T")
 
+# How the `total` of a paginated response is computed:
+# "exact" counts every match, "estimate" stops counting at a configured cap,
+# and "none" skips the count entirely (total is null).
+TotalMode = Literal["exact", "estimate", "none"]
+
 class PaginatedResponse(BaseModel, Generic[T]):
     """Paginated response for requests"""
     items: List[T]
-    total: int
+    total: Optional[int]
+    # True when `total` is an estimate that hit its cap: more items match.
+    total_capped: bool = False
+    next_cursor: Optional[str] = None
@@ -1,11 +1,143 @@
-from datetime import date
-from typing import Optional, Dict, Any
+import codecs
+import csv
+import io
+import json
+import logging
+import re
+from datetime import date, datetime
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Set, Tuple
+
+from pydantic import ValidationError
 
 from app.application.schemas.campaign import Campaign as CampaignSchema
-from app.application.schemas.campaign import CampaignCreate, CampaignUpdate
+from app.application.schemas.campaign import (
+    CAMPAIGN_EXPORT_FIELDS,
+    CAMPAIGN_FIELDS,
+    CampaignCreate,
+    CampaignFileFormat,
+    CampaignSelection,
+    CampaignUpdate,
+)
+from app.application.schemas.paginated_response import TotalMode
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.pagination import CursorError, decode_cursor, encode_cursor
 from app.domain.entities.campaign import Campaign
-from app.domain.interfaces.campaign_repository import ICampaignRepository
-from app.infrastructure.database.sql_alchemy.models import Campaign as CampaignModel
+from app.domain.interfaces.campaign_repository import (
+    CampaignOrder,
+    CampaignSortField,
+    ICampaignRepository,
+    PartialCampaign,
+)
+
+logger = logging.getLogger(__name__)
+
+# Process-wide cache of list pages. Keys start with the data generation they
+# were computed at; per-key stats ignore it, so they follow a query over time.
+campaign_list_cache = TTLCache(
+    maxsize=settings.CAMPAIGN_LIST_CACHE_MAXSIZE,
+    ttl=settings.CAMPAIGN_LIST_CACHE_TTL_SECONDS,
+    stats_key=lambda key: key[1:],
+)
+# Encoded bodies of hot list responses, keyed like `campaign_list_cache`.
+campaign_response_cache = TTLCache(
+    maxsize=settings.CAMPAIGN_RESPONSE_CACHE_MAXSIZE,
+    ttl=settings.CAMPAIGN_LIST_CACHE_TTL_SECONDS,
+)
+
+
+class PreconditionFailedError(Exception):
+    """Custom exception for writes whose expected campaign version is outdated."""
+
+
+class InvalidFieldsError(Exception):
+    """Custom exception for `fields` selections naming unknown campaign fields."""
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Turns a comma-separated `fields` parameter into campaign field names, in
+    schema order and always including the id. None selects every field.
+
+    Raises:
+        InvalidFieldsError: If a name is not a campaign field.
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested.difference(CAMPAIGN_FIELDS)
+    if unknown:
+        raise InvalidFieldsError(f"Unknown campaign fields: {', '.join(sorted(unknown))}")
+    return tuple(name for name in CAMPAIGN_FIELDS if name in requested or name == "id")
+
+
+def _cached_by_generation(
+    repo: ICampaignRepository,
+    key: Tuple[Any, ...],
+    load: Callable[[], Any],
+    cache: TTLCache = campaign_list_cache,
+) -> Any:
+    """
+    Returns `load()`, cached in `cache` under `key` and the repository's
+    current data generation. Not cached when the repository does not track
+    its writes or the list cache is disabled.
+    """
+    generation = repo.data_generation() if settings.CAMPAIGN_LIST_CACHE_ENABLED else None
+    if generation is None:
+        return load()
+
+    value = cache.get((generation, *key))
+    if value is None:
+        value = load()
+        cache.set((generation, *key), value)
+    return value
+
+
+def get_cached_response(
+    repo: ICampaignRepository, key: Tuple[Any, ...], render: Callable[[], bytes]
+) -> bytes:
+    """
+    Returns `render()`, an encoded list response body, cached in
+    `campaign_response_cache` under `key` and the data generation: like
+    list pages, it is dropped by any write through this process.
+    """
+    if not settings.CAMPAIGN_RESPONSE_CACHE_ENABLED:
+        return render()
+    return _cached_by_generation(repo, key, render, campaign_response_cache)
+
+
+def _normalize_search(search: Optional[str]) -> Optional[str]:
+    """
+    Lowercases and collapses the whitespace of a search. A search without
+    any word to match (blank or only punctuation) filters nothing: None.
+    """
+    if search is None or not re.search(r"\w", search):
+        return None
+    return " ".join(search.lower().split())
+
+
+def _decode_keyset(cursor: str, sort: CampaignSortField) -> Tuple[Any, int]:
+    """Turns a cursor back into the (sort value, id) of the last row seen."""
+    values = decode_cursor(cursor)
+    if len(values) != 3 or values[0] != sort or not isinstance(values[2], int):
+        raise CursorError("Cursor does not match the requested sort")
+
+    sort_value = values[1]
+    try:
+        if sort in ("start_date", "end_date"):
+            sort_value = date.fromisoformat(sort_value)
+        elif sort == "budget":
+            sort_value = float(sort_value)
+        elif sort == "name" and not isinstance(sort_value, str):
+            raise TypeError("Campaign names are strings")
+        elif sort == "id" and (
+            isinstance(sort_value, bool) or not isinstance(sort_value, int)
+        ):
+            raise TypeError("Campaign ids are integers")
+    except (TypeError, ValueError) as e:
+        raise CursorError("Invalid cursor") from e
+
+    return sort_value, values[2]
 
 
 def get_campaigns(
@@ -16,53 +148,491 @@ def get_campaigns(
     is_active: Optional[bool] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    search: Optional[str] = None,
+    sort: Optional[CampaignOrder] = None,
+    cursor: Optional[str] = None,
+    total_mode: TotalMode = "exact",
+    fields: Optional[Tuple[str, ...]] = None,
 ) -> Dict[str, Any]:
-    items = repo.get_multi_filtered(
-        skip=skip,
-        limit=limit,
+    """
+    Returns a page of campaigns and the total number of matches.
+
+    With `fields` (see `parse_fields`), only those columns are read and the
+    items are dictionaries of them.
+
+    `search` restricts the page to campaigns whose name or description match
+    it. Searches are sorted by relevance unless `sort` says otherwise; other
+    listings default to id order. Relevance pages are offset-based only.
+
+    Without a cursor the page is located with `skip`; with a cursor the query
+    seeks directly past the last row of the previous page, so deep pages cost
+    the same as the first one. `next_cursor` is set whenever more rows follow.
+
+    An exact total for an offset page is fetched in the same statement as the
+    page. `total_mode="estimate"` stops counting at CAMPAIGN_COUNT_ESTIMATE_CAP
+    and sets `total_capped` when more rows match, in which case the total is
+    only a lower bound. `total_mode="none"` skips the count altogether.
+
+    Pages are cached in `campaign_list_cache` under the normalized request
+    and the repository's data generation, so any write through this process
+    makes every cached page unreachable at once.
+
+    Raises:
+        CursorError: If the cursor is malformed, was issued for another sort,
+            or the page is sorted by relevance.
+    """
+    search = _normalize_search(search)
+    if sort is None or (sort == "relevance" and not search):
+        sort = "relevance" if search else "id"
+    if sort == "relevance" and cursor:
+        raise CursorError("Cursors are not supported when sorting by relevance")
+
+    filters = {
+        "is_active": is_active,
+        "start_date": start_date,
+        "end_date": end_date,
+        "search": search,
+    }
+    if cursor:
+        skip = 0
+
+    page = _cached_by_generation(
+        repo,
+        ("page", skip, limit, *filters.values(), sort, cursor, total_mode, fields),
+        lambda: _load_campaigns_page(
+            repo,
+            skip=skip,
+            limit=limit,
+            filters=filters,
+            sort=sort,
+            cursor=cursor,
+            total_mode=total_mode,
+            fields=fields,
+        ),
+    )
+    return {**page, "items": list(page["items"])}
+
+
+def _load_campaigns_page(
+    repo: ICampaignRepository,
+    *,
+    skip: int,
+    limit: int,
+    filters: Dict[str, Any],
+    sort: CampaignOrder,
+    cursor: Optional[str],
+    total_mode: TotalMode,
+    fields: Optional[Tuple[str, ...]],
+) -> Dict[str, Any]:
+    after = _decode_keyset(cursor, sort) if cursor else None
+
+    # The sort value of the last row is needed for the next cursor.
+    columns = fields
+    if fields is not None and sort != "relevance" and sort not in fields:
+        columns = fields + (sort,)
+
+    total = None
+    total_capped = False
+    if after is None and total_mode == "exact" and sort != "relevance":
+        items, total = repo.get_multi_filtered_with_total(
+            skip=skip, limit=limit + 1, sort=sort, fields=columns, **filters
+        )
+    else:
+        items = repo.get_multi_filtered(
+            skip=skip, limit=limit + 1, sort=sort, after=after, fields=columns, **filters
+        )
+        if total_mode == "exact":
+            total = repo.count_filtered(**filters)
+        elif total_mode == "estimate":
+            # One row past the cap tells a capped total from an exact one.
+            cap = settings.CAMPAIGN_COUNT_ESTIMATE_CAP
+            total = repo.count_filtered(**filters, max_count=cap + 1)
+            total_capped = total > cap
+            total = min(total, cap)
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        if items and sort != "relevance":
+            last = items[-1]
+            if fields is None:
+                next_cursor = encode_cursor([sort, getattr(last, sort), last.id])
+            else:
+                next_cursor = encode_cursor([sort, last[sort], last["id"]])
+
+    if columns is not fields:
+        for item in items:
+            del item[sort]
+
+    return {
+        "items": items,
+        "total": total,
+        "total_capped": total_capped,
+        "next_cursor": next_cursor,
+    }
+
+def export_campaigns(
+    repo: ICampaignRepository,
+    *,
+    export_format: CampaignFileFormat,
+    is_active: Optional[bool] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    search: Optional[str] = None,
+    batch_size: int = 1000,
+) -> Iterator[bytes]:
+    """
+    Yields the matching campaigns encoded as NDJSON or CSV (with a header
+    row), one chunk per `batch_size` campaigns. Only the current chunk is
+    held in memory.
+    """
+    campaigns = repo.iter_filtered(
         is_active=is_active,
         start_date=start_date,
         end_date=end_date,
+        search=_normalize_search(search),
+        batch_size=batch_size,
     )
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if export_format == "csv":
+        writer.writerow(CAMPAIGN_EXPORT_FIELDS)
+
+    pending = 0
+    for campaign in campaigns:
+        values = [getattr(campaign, field) for field in CAMPAIGN_EXPORT_FIELDS]
+        if export_format == "csv":
+            writer.writerow(values)
+        else:
+            buffer.write(json.dumps(dict(zip(CAMPAIGN_EXPORT_FIELDS, values)), default=str))
+            buffer.write("\n")
+
+        pending += 1
+        if pending == batch_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
 
-    total = repo.count_filtered(
+def create_campaign(repo: ICampaignRepository, dto: CampaignCreate) -> Campaign:
+    entity = Campaign(**dto.model_dump())
+    return repo.create(entity=entity)
+
+
+INSERT_FAILED = {"type": "insert_failed", "msg": "Could not save campaign"}
+
+
+def _insert_batch(
+    repo: ICampaignRepository, entities: List[Campaign]
+) -> Optional[List[Campaign]]:
+    """Inserts `entities` in one transaction; returns None if it failed."""
+    try:
+        return repo.create_many(entities=entities)
+    except Exception as e:
+        logger.error(f"Bulk insert of {len(entities)} campaigns failed: {e}", exc_info=True)
+        return None
+
+
+def create_campaigns(
+    repo: ICampaignRepository, payloads: List[Any], *, chunk_size: int
+) -> Dict[str, Any]:
+    """
+    Validates raw campaign payloads and inserts the valid ones in chunks of
+    `chunk_size`, one transaction per chunk.
+
+    Invalid payloads and payloads of a chunk whose insert failed are reported
+    by their position in `payloads`; they never prevent other items from
+    being created.
+    """
+    errors: List[Dict[str, Any]] = []
+    pending: List[Tuple[int, Campaign]] = []
+
+    for index, payload in enumerate(payloads):
+        try:
+            dto = CampaignCreate.model_validate(payload)
+        except ValidationError as e:
+            errors.append(
+                {"index": index, "errors": e.errors(include_url=False, include_context=False)}
+            )
+            continue
+        pending.append((index, Campaign(**dto.model_dump())))
+
+    ids: List[int] = []
+    for start in range(0, len(pending), chunk_size):
+        chunk = pending[start:start + chunk_size]
+        created = _insert_batch(repo, [entity for _, entity in chunk])
+        if created is None:
+            errors.extend({"index": index, "errors": [INSERT_FAILED]} for index, _ in chunk)
+            continue
+        ids.extend(entity.id for entity in created)
+
+    errors.sort(key=lambda error: error["index"])
+    return {"created": len(ids), "ids": ids, "errors": errors}
+
+
+def _iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    """
+    Decodes a stream of UTF-8 byte chunks into text lines (newlines kept).
+    Only the current incomplete line is buffered between chunks.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    tail = ""
+    for chunk in chunks:
+        *lines, tail = (tail + decoder.decode(chunk)).split("\n")
+        for line in lines:
+            yield line + "\n"
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _iter_records(
+    lines: Iterable[str], file_format: CampaignFileFormat
+) -> Iterator[Tuple[int, Any, Optional[List[Dict[str, Any]]]]]:
+    """
+    Parses NDJSON or CSV (header row first) lines into
+    `(line, payload, parse_errors)` tuples. `line` is the 1-based line where
+    the record starts. Blank lines are skipped. Empty CSV cells become None.
+    """
+    if file_format == "ndjson":
+        for line, text in enumerate(lines, start=1):
+            if not text.strip():
+                continue
+            try:
+                yield line, json.loads(text), None
+            except ValueError as e:
+                yield line, None, [{"type": "json_invalid", "msg": str(e)}]
+        return
+
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    line = reader.line_num + 1
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            yield line, None, [{"type": "csv_invalid", "msg": str(e)}]
+            line = reader.line_num + 1
+            continue
+
+        if len(row) == len(header):
+            yield line, {key: value or None for key, value in zip(header, row)}, None
+        elif any(row):
+            yield line, None, [{
+                "type": "csv_invalid",
+                "msg": f"Expected {len(header)} fields, got {len(row)}",
+            }]
+        line = reader.line_num + 1
+
+
+def import_campaigns(
+    repo: ICampaignRepository,
+    chunks: Iterable[bytes],
+    *,
+    file_format: CampaignFileFormat,
+    batch_size: int,
+    max_errors: int,
+) -> Dict[str, Any]:
+    """
+    Imports campaigns from an NDJSON or CSV byte stream.
+
+    The stream is parsed incrementally and validated against `CampaignCreate`;
+    valid rows are inserted `batch_size` at a time, one transaction per batch,
+    so memory use does not depend on the size of the file. Rejected lines are
+    reported by line number, keeping the first `max_errors` of them.
+    """
+    result: Dict[str, Any] = {"received": 0, "created": 0, "failed": 0, "errors": []}
+
+    def reject(line: int, line_errors: List[Dict[str, Any]]) -> None:
+        result["failed"] += 1
+        if len(result["errors"]) < max_errors:
+            result["errors"].append({"line": line, "errors": line_errors})
+
+    def flush(batch: List[Tuple[int, Campaign]]) -> None:
+        created = _insert_batch(repo, [entity for _, entity in batch])
+        if created is None:
+            for line, _ in batch:
+                reject(line, [INSERT_FAILED])
+        else:
+            result["created"] += len(created)
+        batch.clear()
+
+    batch: List[Tuple[int, Campaign]] = []
+    for line, payload, parse_errors in _iter_records(_iter_lines(chunks), file_format):
+        result["received"] += 1
+        if parse_errors:
+            reject(line, parse_errors)
+            continue
+        try:
+            dto = CampaignCreate.model_validate(payload)
+        except ValidationError as e:
+            reject(line, e.errors(include_url=False, include_context=False))
+            continue
+        batch.append((line, Campaign(**dto.model_dump())))
+        if len(batch) == batch_size:
+            flush(batch)
+
+    if batch:
+        flush(batch)
+
+    result["errors_truncated"] = result["failed"] > len(result["errors"])
+    return result
+
+
+def set_campaigns_active(
+    repo: ICampaignRepository,
+    selection: CampaignSelection,
+    *,
+    active: bool,
+    return_ids: bool = False,
+) -> Dict[str, Any]:
+    affected, ids = repo.set_active_filtered(
+        active=active, returning=return_ids, **selection.model_dump()
+    )
+    return {"affected": affected, "ids": ids}
+
+
+def delete_campaigns(
+    repo: ICampaignRepository, selection: CampaignSelection, *, return_ids: bool = False
+) -> Dict[str, Any]:
+    affected, ids = repo.remove_filtered(returning=return_ids, **selection.model_dump())
+    return {"affected": affected, "ids": ids}
+
+
+def get_campaign_stats(
+    repo: ICampaignRepository,
+    *,
+    is_active: Optional[bool] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    search: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Returns campaign counts and budget totals overall, per activity state and
+    per start month, for the campaigns matching the list filters.
+    """
+    rows = repo.get_monthly_stats(
         is_active=is_active,
         start_date=start_date,
         end_date=end_date,
+        search=_normalize_search(search),
     )
 
+    counts = {True: 0, False: 0}
+    budget_total = 0.0
+    by_month: Dict[date, Dict[str, Any]] = {}
+    for month, active, count, budget in rows:
+        counts[active] += count
+        budget_total += budget
+        totals = by_month.setdefault(month, {"month": month, "count": 0, "budget_total": 0.0})
+        totals["count"] += count
+        totals["budget_total"] += budget
+
+    count = counts[True] + counts[False]
+    for totals in by_month.values():
+        totals["budget_total"] = round(totals["budget_total"], 2)
     return {
-        "items": items,
-        "total": total,
+        "count": count,
+        "active_count": counts[True],
+        "inactive_count": counts[False],
+        "budget_total": round(budget_total, 2),
+        "budget_average": round(budget_total / count, 2) if count else None,
+        "by_month": [by_month[month] for month in sorted(by_month)],
     }
 
-def create_campaign(repo: ICampaignRepository, dto: CampaignCreate) -> Campaign:
-    entity = Campaign(**dto.model_dump())
-    return repo.create(entity=entity)
+
+def rebuild_campaign_stats(repo: ICampaignRepository) -> Dict[str, Any]:
+    """Recomputes the monthly rollup from the campaigns table and returns it."""
+    repo.rebuild_stats()
+    return get_campaign_stats(repo)
 
 
 def get_campaign(repo: ICampaignRepository, campaign_id: int) -> Optional[Campaign]:
     return repo.get(id=campaign_id)
 
 
+def get_campaign_fields(
+    repo: ICampaignRepository, campaign_id: int, fields: Tuple[str, ...]
+) -> Optional[PartialCampaign]:
+    return repo.get_fields(id=campaign_id, fields=fields)
+
+
+def get_campaign_version(
+    repo: ICampaignRepository, campaign_id: int
+) -> Optional[Tuple[int, datetime]]:
+    return repo.get_version(id=campaign_id)
+
+
+def _check_version(
+    repo: ICampaignRepository, campaign_id: int, expected_versions: Optional[Set[int]]
+) -> bool:
+    """
+    Returns False if the campaign does not exist. Raises
+    PreconditionFailedError if `expected_versions` is given and does not
+    contain its current version.
+    """
+    current = repo.get_version(id=campaign_id)
+    if current is None:
+        return False
+    if expected_versions is not None and current[0] not in expected_versions:
+        raise PreconditionFailedError("Campaign has been modified")
+    return True
+
+
 def update_campaign(
-    repo: ICampaignRepository, campaign_id: int, dto: CampaignUpdate
+    repo: ICampaignRepository,
+    campaign_id: int,
+    dto: CampaignUpdate,
+    expected_versions: Optional[Set[int]] = None,
 ) -> Optional[Campaign]:
-    db_obj: Optional[CampaignModel] = repo.get(id=campaign_id)
-    if not db_obj:
-        return None
+    """
+    Applies the fields set in `dto` with one column-targeted UPDATE.
+
+    Raises:
+        PreconditionFailedError: If the campaign's version is not in
+            `expected_versions`.
+    """
     update_data = dto.model_dump(exclude_unset=True)
+    if not update_data:
+        if not _check_version(repo, campaign_id, expected_versions):
+            return None
+        return get_campaign(repo, campaign_id)
 
-    for field, value in update_data.items():
-        setattr(db_obj, field, value)
+    updated = repo.update_fields(
+        id=campaign_id, values=update_data, expected_versions=expected_versions
+    )
+    if updated is None:
+        if expected_versions is not None:
+            # Tell a missing campaign from a version mismatch (raises on the latter).
+            _check_version(repo, campaign_id, expected_versions)
+        return None
+    return CampaignSchema.model_validate(updated)
 
-    updated_db_obj = repo.update(id=campaign_id, entity=db_obj)
 
-    if updated_db_obj:
-        return CampaignSchema.model_validate(updated_db_obj)
-    
-    return None
+def set_campaign_active(
+    repo: ICampaignRepository,
+    campaign_id: int,
+    active: bool,
+    expected_versions: Optional[Set[int]] = None,
+) -> Optional[Campaign]:
+    return update_campaign(
+        repo, campaign_id, CampaignUpdate(is_active=active), expected_versions
+    )
 
 
-def delete_campaign(repo: ICampaignRepository, campaign_id: int) -> Optional[Campaign]:
-    return repo.remove(id=campaign_id)
+def delete_campaign(
+    repo: ICampaignRepository,
+    campaign_id: int,
+    expected_versions: Optional[Set[int]] = None,
+) -> Optional[Campaign]:
+    deleted = repo.remove(id=campaign_id, expected_versions=expected_versions)
+    if deleted is None and expected_versions is not None:
+        _check_version(repo, campaign_id, expected_versions)
+    return deleted
@@ -0,0 +1,160 @@
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class TTLCache:  # pylint: disable=too-many-instance-attributes
+    """
+    Thread-safe, bounded LRU cache whose entries also expire `ttl` seconds
+    after they were stored.
+
+    Invalidations bump a generation counter. A value loaded from the source of
+    truth is only stored if no invalidation happened since the load started
+    (see `generation` and `set`), so a slow reader cannot put back a value a
+    concurrent writer has just replaced.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+        stats_key: Optional[Callable[[Hashable], Hashable]] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._counters = Counter()
+        # Optional per-key hit/miss counters, grouped by `stats_key(key)` and
+        # bounded like the entries themselves.
+        self._stats_key = stats_key
+        self._key_counters: "OrderedDict[Hashable, Counter]" = OrderedDict()
+
+    @property
+    def generation(self) -> int:
+        """Token to read before loading a value, then pass to `set`."""
+        return self._generation
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the cached value for `key`, or `default` on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self._count(key, "hits")
+                    return value
+                del self._entries[key]
+                self._counters["expirations"] += 1
+            self._count(key, "misses")
+            return default
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Like `get`, without touching the LRU order or the counters."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                return entry[1]
+            return default
+
+    def _count(self, key: Hashable, counter: str) -> None:
+        self._counters[counter] += 1
+        if self._stats_key is None or self.maxsize <= 0:
+            return
+        group = self._stats_key(key)
+        counters = self._key_counters.get(group)
+        if counters is None:
+            counters = self._key_counters[group] = Counter()
+        self._key_counters.move_to_end(group)
+        counters[counter] += 1
+        while len(self._key_counters) > self.maxsize:
+            self._key_counters.popitem(last=False)
+
+    def set(self, key: Hashable, value: Any, *, generation: Optional[int] = None) -> bool:
+        """
+        Stores `value`, evicting the least recently used entries beyond
+        `maxsize`. When `generation` is given and an invalidation happened
+        since it was read, nothing is stored and False is returned.
+        """
+        if self.maxsize <= 0:
+            return False
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+            return True
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drops `key` and voids every load started before this call."""
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drops every entry and voids every load started before this call."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def reset_stats(self) -> None:
+        """Zeroes the hit/miss/eviction/expiration counters."""
+        with self._lock:
+            self._counters.clear()
+            self._key_counters.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the current size, limits and hit/miss/eviction counters."""
+        with self._lock:
+            hits, misses = self._counters["hits"], self._counters["misses"]
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else None,
+                "evictions": self._counters["evictions"],
+                "expirations": self._counters["expirations"],
+            }
+
+    def key_stats(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Returns hit/miss counters of the `limit` most requested key groups."""
+        with self._lock:
+            groups = sorted(
+                self._key_counters.items(),
+                key=lambda item: item[1]["hits"] + item[1]["misses"],
+                reverse=True,
+            )[:limit]
+            return [
+                {"key": repr(group), "hits": counters["hits"], "misses": counters["misses"]}
+                for group, counters in groups
+            ]
+
+
+class Generation:
+    """Thread-safe counter identifying the current version of a data set."""
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> int:
+        """The current generation."""
+        return self._value
+
+    def bump(self) -> int:
+        """Marks the data set as changed and returns the new value."""
+        with self._lock:
+            self._value += 1
+            return self._value
@@ -0,0 +1,18 @@
+from typing import Any, Callable, TypeVar
+
+from anyio import to_thread
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+
+T = TypeVar("T")
+
+
+def run_blocking(fn: Callable[..., T], *args: Any) -> T:
+    """
+    Calls the CPU-bound `fn(*args)`. Sync code run through
+    `AsyncSession.run_sync` executes on the event loop thread: there the call
+    is moved to a worker thread, so it does not stall every other request.
+    """
+    if in_greenlet():
+        return await_only(to_thread.run_sync(fn, *args))
+    return fn(*args)
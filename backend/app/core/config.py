@@ -1,6 +1,6 @@
 # ./backend/app/core/config.py
 import os
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -12,9 +12,87 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     DATABASE_URL: str
+    # Serve routes on an AsyncSession (aiosqlite / asyncpg driver derived from
+    # DATABASE_URL) instead of sync sessions run in worker threads.
+    DATABASE_ASYNC: bool = False
+    # Read replicas serving GET routes, each read session going to the least
+    # busy one. For DATABASE_READ_YOUR_WRITES_SECONDS after a write, a client
+    # reads from the primary instead (cookie set on write responses). Reads
+    # then bypass the process-wide campaign caches, which replicas could
+    # fill with rows older than the client's last write.
+    DATABASE_READ_REPLICA_URLS: list[str] = []
+    DATABASE_READ_YOUR_WRITES_SECONDS: float = 5.0
+    # Worker threads serving sync code (AnyIO's default limiter).
+    THREAD_POOL_SIZE: int = 40
+    # Connection pool of the database engines (SQLite in-memory databases
+    # keep their single-connection pool). The size defaults to
+    # THREAD_POOL_SIZE, so worker threads never queue for a connection.
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    # Seconds after which a connection is replaced; -1 keeps it.
+    DB_POOL_RECYCLE: int = -1
+    # Test connections on checkout. Default: on, except for SQLite.
+    DB_POOL_PRE_PING: Optional[bool] = None
+    # Checkouts that waited longer for a connection are logged as warnings.
+    DB_POOL_WAIT_WARN_SECONDS: float = 0.1
+    # Connections each worker opens at startup, per pool.
+    DB_POOL_WARMUP_CONNECTIONS: int = 4
+    # Worker processes take turns running the startup bootstrap (tables,
+    # superuser, fixtures) under a lock: a PostgreSQL advisory lock, or this
+    # file (default: next to a SQLite database, or in the temp directory).
+    BOOTSTRAP_LOCK_FILE: Optional[str] = None
+    # SQLite file databases: connection pragmas applied to every connection.
+    # WAL lets readers run alongside the writer; NORMAL synchronous is safe
+    # in WAL mode (a power loss can only drop the last commits).
+    SQLITE_JOURNAL_MODE: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST"] = "WAL"
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5_000
+    # Page cache of each connection, while the memory map is shared by all.
+    SQLITE_CACHE_SIZE_KIB: int = 8_192
+    SQLITE_MMAP_SIZE_MB: int = 256
+    SQLITE_TEMP_STORE: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    # Interval of the `PRAGMA optimize` runs refreshing planner statistics;
+    # 0 disables them.
+    SQLITE_OPTIMIZE_INTERVAL_SECONDS: float = 3_600.0
+    # Serve GET routes from a second, read-only (mode=ro) engine. SQLite
+    # replicas are opened read-only too.
+    SQLITE_READ_ONLY_ENGINE: bool = True
     FIRST_SUPERUSER_EMAIL: Optional[str] = None
     FIRST_SUPERUSER_PASSWORD: Optional[str] = None
     BACKEND_CORS_ORIGINS: list[str] = ["*"]
+    # Seed an empty database with demo campaigns at startup (development).
+    SEED_DEMO_DATA: bool = False
+    # Upper bound used when a list request asks for an estimated total.
+    CAMPAIGN_COUNT_ESTIMATE_CAP: int = 10_000
+    # On SQLite, date windows up to this many days are resolved through the
+    # campaigns R*Tree index; wider or open-ended windows use the B-tree plan.
+    # Set to 0 to disable the R*Tree lookup.
+    CAMPAIGN_DATE_RTREE_MAX_WINDOW_DAYS: int = 92
+    # Number of campaigns inserted per statement/transaction by bulk creation.
+    CAMPAIGN_BULK_CHUNK_SIZE: int = 1_000
+    # Rejected lines listed in an import report (the rest are only counted).
+    CAMPAIGN_IMPORT_MAX_ERRORS: int = 1_000
+    # Rows fetched from the database and flushed to the client per export chunk.
+    CAMPAIGN_EXPORT_BATCH_SIZE: int = 1_000
+    # In-process read-through cache of campaigns by id (GET /campaigns/{id}).
+    CAMPAIGN_CACHE_ENABLED: bool = True
+    CAMPAIGN_CACHE_MAXSIZE: int = 10_000
+    CAMPAIGN_CACHE_TTL_SECONDS: float = 60.0
+    # Cache of GET /campaigns/ pages. Entries are dropped by any write made
+    # through this process; the TTL bounds how long writes made by other
+    # worker processes can go unseen. Requires CAMPAIGN_CACHE_ENABLED.
+    CAMPAIGN_LIST_CACHE_ENABLED: bool = True
+    CAMPAIGN_LIST_CACHE_MAXSIZE: int = 1_000
+    CAMPAIGN_LIST_CACHE_TTL_SECONDS: float = 5.0
+    # Encoded (and compressed) bodies of first list pages, the most requested
+    # ones, served as bytes. Invalidated and expired like list pages.
+    # Requires CAMPAIGN_LIST_CACHE_ENABLED.
+    CAMPAIGN_RESPONSE_CACHE_ENABLED: bool = True
+    CAMPAIGN_RESPONSE_CACHE_MAXSIZE: int = 256
+    # List responses at least this large are compressed when the client
+    # accepts gzip (or zstd, with the zstandard package installed).
+    RESPONSE_COMPRESSION_MIN_SIZE: int = 1024
 
     model_config = SettingsConfigDict(
         env_file=f".env.{os.getenv('ENV', 'dev')}",
@@ -5,7 +5,29 @@ import os
 
 
 def setup_logging():
-    """Configures application-wide logging."""
+    """
+    Configures application-wide logging: to the console, and to the daily
+    rotated LOG_FILE (default app.log; empty to disable), opened on the
+    first record.
+    """
+    log_file = os.getenv("LOG_FILE", "app.log")
+    handlers = {
+        "console": {
+            "class": "logging.StreamHandler",
+            "formatter": "standard",
+            "level": os.getenv("LOG_LEVEL", "DEBUG"),
+        },
+    }
+    if log_file:
+        handlers["file"] = {
+            "class": "logging.handlers.TimedRotatingFileHandler",
+            "formatter": "json",
+            "filename": log_file,
+            "delay": True,
+            "when": "midnight",
+            "backupCount": 7,
+            "level": os.getenv("LOG_LEVEL", "INFO"),
+        }
     logging_config = {
         "version": 1,
         "disable_existing_loggers": False,
@@ -22,24 +44,10 @@ def setup_logging():
                 )
             },
         },
-        "handlers": {
-            "console": {
-                "class": "logging.StreamHandler",
-                "formatter": "standard",
-                "level": os.getenv("LOG_LEVEL", "DEBUG"),
-            },
-            "file": {
-                "class": "logging.handlers.TimedRotatingFileHandler",
-                "formatter": "json",
-                "filename": "app.log",
-                "when": "midnight",
-                "backupCount": 7,
-                "level": os.getenv("LOG_LEVEL", "INFO"),
-            },
-        },
+        "handlers": handlers,
         "loggers": {
             "": {
-                "handlers": ["console", "file"],
+                "handlers": list(handlers),
                 "level": os.getenv("LOG_LEVEL", "DEBUG"),
                 "propagate": False,
             },
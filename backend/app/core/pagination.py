@@ -0,0 +1,47 @@
+import base64
+import binascii
+import json
+from typing import Any, List
+
+
+class CursorError(Exception):
+    """Custom exception for malformed or mismatched pagination cursors."""
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    Encode keyset values into an opaque, URL-safe cursor string.
+
+    Args:
+        values: JSON-serializable values identifying the last row of a page.
+            Dates are serialized using their ISO format.
+
+    Returns:
+        A base64url string without padding.
+    """
+    raw = json.dumps(values, default=str, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor: The opaque cursor string sent back by the client.
+
+    Returns:
+        The list of keyset values stored in the cursor.
+
+    Raises:
+        CursorError: If the cursor cannot be decoded.
+    """
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (binascii.Error, ValueError) as e:
+        raise CursorError("Invalid cursor") from e
+
+    if not isinstance(values, list):
+        raise CursorError("Invalid cursor")
+    return values
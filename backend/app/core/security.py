@@ -5,6 +5,7 @@ import secrets
 import bcrypt
 from jose import JWTError, jwt
 
+from app.core.concurrency import run_blocking
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -16,14 +17,14 @@ class TokenError(Exception):
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifies a plain password against a hashed password."""
-    return bcrypt.checkpw(
-        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+    return run_blocking(
+        bcrypt.checkpw, plain_password.encode("utf-8"), hashed_password.encode("utf-8")
     )
 
 
 def get_password_hash(password: str) -> str:
     """Hashes a password using bcrypt."""
-    hashed_password = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+    hashed_password = run_blocking(bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt())
     return hashed_password.decode("utf-8")
 
 
@@ -1,20 +1,19 @@
-from datetime import date
+from dataclasses import KW_ONLY, dataclass
+from datetime import date, datetime
+from typing import Optional
 
 
-class Campaign:
+@dataclass(slots=True, eq=False)
+class Campaign:  # pylint: disable=too-many-instance-attributes
     """Represents an advertising campaign within the domain."""
-    def __init__(
-        self,
-        name: str,
-        description: str,
-        start_date: date,
-        end_date: date,
-        budget: float,
-        is_active: bool,
-    ):
-        self.name = name
-        self.description = description
-        self.start_date = start_date
-        self.end_date = end_date
-        self.budget = budget
-        self.is_active = is_active
+    name: str
+    description: str
+    start_date: date
+    end_date: date
+    budget: float
+    is_active: bool
+    _: KW_ONLY
+    id: Optional[int] = None
+    # Row version, bumped by every change, and time of the last change.
+    version: int = 1
+    updated_at: Optional[datetime] = None
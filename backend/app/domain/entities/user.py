@@ -1,16 +1,16 @@
+from dataclasses import KW_ONLY, dataclass
+from typing import Optional
+
+
+@dataclass(slots=True, eq=False)
 class User:
     """Represents a user within the domain."""
-    def __init__(
-        self,
-        email: str,
-        hashed_password: str,
-        is_active: bool = True,
-        is_superuser: bool = False,
-    ):
-        self.email = email
-        self.hashed_password = hashed_password
-        self.is_active = is_active
-        self.is_superuser = is_superuser
+    email: str
+    hashed_password: str
+    is_active: bool = True
+    is_superuser: bool = False
+    _: KW_ONLY
+    id: Optional[int] = None
 
     def activate(self):
         """Activates the user."""
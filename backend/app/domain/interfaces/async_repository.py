@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Generic, TypeVar
+
+RepositoryType = TypeVar("RepositoryType")
+ResultType = TypeVar("ResultType")
+
+
+class IAsyncRepository(Generic[RepositoryType], ABC):
+    """
+    Async access to a repository (or to a service built on repositories)
+    bound to the request's database session. Sync services and repositories
+    serve async routes unchanged: `run` awaits one call of them.
+    """
+    @abstractmethod
+    async def run(
+        self, fn: Callable[..., ResultType], *args: Any, **kwargs: Any
+    ) -> ResultType:
+        """Awaits `fn(repository, *args, **kwargs)`."""
@@ -1,16 +1,61 @@
 from abc import abstractmethod
-from datetime import date
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Literal, Optional, Sequence, Set, Tuple, Union
 
 from app.domain.entities.campaign import Campaign
 from app.domain.interfaces.base_repository import IRepository
 
+# Columns campaigns can be sorted and keyset-paginated on. Each of them is
+# indexed, so seeking on (sort_key, id) never requires a table scan.
+CampaignSortField = Literal["id", "name", "start_date", "end_date", "budget"]
+
+# List orderings: the sort fields plus search relevance (best bm25 score
+# first), which only applies to searches and cannot be keyset-paginated.
+CampaignOrder = Union[CampaignSortField, Literal["relevance"]]
+
+# A campaign reduced to some of its fields, keyed by field name.
+PartialCampaign = Dict[str, Any]
+
 
 class ICampaignRepository(IRepository[Campaign]):
     """Interface for Campaign data persistence operations."""
 
+    def data_generation(self) -> Optional[int]:
+        """
+        Returns a counter that changes whenever campaigns are written through
+        this process, or None if this repository does not track its writes.
+        """
+        return None
+
+    @abstractmethod
+    def get_multi_filtered(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search: Optional[str] = None,
+        sort: CampaignOrder = "id",
+        after: Optional[Tuple[Any, int]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Union[Campaign, PartialCampaign]]:
+        """
+        Retrieves multiple campaigns with optional filtering, ordered by
+        (sort, id). When `after` holds the (sort value, id) of the last row
+        already seen, only rows strictly after it are returned.
+
+        `search` keeps campaigns whose name or description contains every
+        word of it, as a word prefix. `sort="relevance"` ranks those matches
+        and ignores `after`.
+
+        With `fields`, only those columns are read and each campaign is
+        returned as a PartialCampaign.
+        """
+
     @abstractmethod
-    def get_multi_filtered(
+    def get_multi_filtered_with_total(  # pylint: disable=too-many-arguments
         self,
         *,
         skip: int = 0,
@@ -18,8 +63,19 @@ class ICampaignRepository(IRepository[Campaign]):
         is_active: Optional[bool] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-    ) -> List[Campaign]:
-        """Retrieves multiple campaigns with optional filtering."""
+        search: Optional[str] = None,
+        sort: CampaignSortField = "id",
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Union[Campaign, PartialCampaign]], int]:
+        """
+        Retrieves a page of campaigns together with the total number of
+        matches, in a single round-trip. `fields` works as in
+        `get_multi_filtered`.
+        """
+
+    @abstractmethod
+    def get_fields(self, id: Any, fields: Sequence[str]) -> Optional[PartialCampaign]:
+        """Reads only `fields` of one campaign, or returns None if it does not exist."""
 
     @abstractmethod
     def count_filtered(
@@ -28,5 +84,113 @@ class ICampaignRepository(IRepository[Campaign]):
         is_active: Optional[bool] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        search: Optional[str] = None,
+        max_count: Optional[int] = None,
     ) -> int:
-        """Returns the total number of campaigns matching the filters."""
+        """
+        Returns the total number of campaigns matching the filters. When
+        `max_count` is given, counting stops once that many rows are found.
+        """
+
+    @abstractmethod
+    def get_version(self, id: Any) -> Optional[Tuple[int, datetime]]:
+        """
+        Returns the (version, updated_at) of a campaign without loading it,
+        or None if it does not exist.
+        """
+
+    @abstractmethod
+    def iter_filtered(
+        self,
+        *,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Campaign]:
+        """
+        Streams every matching campaign in id order, fetching `batch_size`
+        rows at a time so memory use does not depend on the number of matches.
+        """
+
+    @abstractmethod
+    def create_many(self, *, entities: List[Campaign]) -> List[Campaign]:
+        """
+        Creates several campaigns in a single transaction and returns them
+        with their ids, in input order. Nothing is persisted if any insert fails.
+        """
+
+    @abstractmethod
+    def update_fields(
+        self,
+        *,
+        id: Any,
+        values: Dict[str, Any],
+        expected_versions: Optional[Set[int]] = None,
+    ) -> Optional[Campaign]:
+        """
+        Sets only the given columns of one campaign and bumps its version, in
+        a single UPDATE ... RETURNING. Returns the updated campaign, or None
+        if it does not exist or its version is not in `expected_versions`.
+        """
+
+    @abstractmethod
+    def remove(
+        self, *, id: Any, expected_versions: Optional[Set[int]] = None
+    ) -> Optional[Campaign]:
+        """
+        Deletes one campaign and returns it, or None if it does not exist or
+        its version is not in `expected_versions`.
+        """
+
+    @abstractmethod
+    def set_active_filtered(
+        self,
+        *,
+        active: bool,
+        ids: Optional[List[int]] = None,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        returning: bool = False,
+    ) -> Tuple[int, Optional[List[int]]]:
+        """
+        Sets `is_active` on every matching campaign not already in that state,
+        in one statement. Returns the affected count and, if `returning`, the
+        affected ids.
+        """
+
+    @abstractmethod
+    def remove_filtered(
+        self,
+        *,
+        ids: Optional[List[int]] = None,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        returning: bool = False,
+    ) -> Tuple[int, Optional[List[int]]]:
+        """
+        Deletes every matching campaign in one statement. Returns the deleted
+        count and, if `returning`, the deleted ids.
+        """
+
+    @abstractmethod
+    def get_monthly_stats(
+        self,
+        *,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search: Optional[str] = None,
+    ) -> List[Tuple[date, bool, int, float]]:
+        """
+        Returns `(start_month, is_active, campaign_count, budget_total)` for
+        every month and state with matching campaigns. Served from the
+        incrementally maintained rollup unless date or search filters apply.
+        """
+
+    @abstractmethod
+    def rebuild_stats(self) -> None:
+        """Recomputes the monthly rollup from scratch."""
@@ -0,0 +1,110 @@
+from contextlib import AsyncExitStack
+from functools import lru_cache
+from typing import AsyncGenerator
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+from app.infrastructure.database.sql_alchemy.pool import instrumented_engine
+from app.infrastructure.database.sql_alchemy.routing import ReadRouter, read_targets
+from app.infrastructure.database.sql_alchemy.sqlite import apply_sqlite_profile
+
+# Async drivers used for the sync DATABASE_URL dialects.
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+
+def async_database_url(url: str) -> str:
+    """Rewrites a database URL to use the async driver of its dialect."""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for {parsed.get_backend_name()}")
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}").render_as_string(
+        hide_password=False
+    )
+
+
+@lru_cache(maxsize=None)
+def get_async_engine() -> AsyncEngine:
+    """
+    The process-wide async engine, created on first use so deployments
+    without DATABASE_ASYNC do not need the async driver installed.
+    """
+    engine = instrumented_engine(
+        create_async_engine,
+        async_database_url(settings.DATABASE_URL),
+        "async",
+        queue_pool=AsyncAdaptedQueuePool,
+    )
+    apply_sqlite_profile(engine)
+    return engine
+
+
+@lru_cache(maxsize=None)
+def get_async_read_router() -> ReadRouter:
+    """Async counterpart of `session.read_router`."""
+    engines = []
+    for name, url, read_only in read_targets(settings.DATABASE_URL):
+        engine = instrumented_engine(
+            create_async_engine,
+            async_database_url(url),
+            f"async_{name}",
+            queue_pool=AsyncAdaptedQueuePool,
+        )
+        apply_sqlite_profile(engine, read_only=read_only)
+        engines.append(engine)
+    return ReadRouter(engines or [get_async_engine()])
+
+
+@lru_cache(maxsize=None)
+def get_async_sessionmaker() -> async_sessionmaker:
+    return async_sessionmaker(
+        get_async_engine(), autoflush=False, expire_on_commit=False
+    )
+
+
+@lru_cache(maxsize=None)
+def get_async_read_sessionmaker() -> async_sessionmaker:
+    return async_sessionmaker(autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get an async database session.
+    Ensures the session is closed after the request.
+    """
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get an async session on the least busy read engine."""
+    async with get_async_read_sessionmaker()(bind=get_async_read_router().pick()) as db:
+        yield db
+
+
+async def warm_up_async_engines(connections: int) -> None:
+    """Async counterpart of `pool.warm_up`, for the async engines."""
+    for engine in {get_async_engine(), *get_async_read_router().engines}:
+        pool = engine.sync_engine.pool
+        if not isinstance(pool, QueuePool):
+            continue
+        async with AsyncExitStack() as stack:
+            for _ in range(min(connections, pool.size())):
+                await stack.enter_async_context(engine.connect())
+
+
+async def dispose_async_engine() -> None:
+    """Closes the pooled connections of the async engines that were created."""
+    if get_async_read_router.cache_info().currsize:
+        for engine in get_async_read_router().engines:
+            await engine.dispose()
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
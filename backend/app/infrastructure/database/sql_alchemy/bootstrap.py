@@ -0,0 +1,76 @@
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine, make_url
+
+from app.core.config import settings
+from app.infrastructure.database.sql_alchemy.sqlite import is_sqlite_file
+
+try:  # POSIX only: elsewhere, startups are not serialized.
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Key of the PostgreSQL advisory lock taken by `bootstrap_lock` ("ad_boot").
+BOOTSTRAP_ADVISORY_LOCK_KEY = 0x61645F626F6F74
+
+
+def bootstrap_lock_path(url: str) -> Optional[str]:
+    """
+    File locked by `bootstrap_lock`: BOOTSTRAP_LOCK_FILE, or one next to a
+    SQLite database file, or one in the temp directory named after the URL.
+    None for in-memory SQLite databases, which a single process uses.
+    """
+    if settings.BOOTSTRAP_LOCK_FILE:
+        return settings.BOOTSTRAP_LOCK_FILE
+    parsed = make_url(url)
+    if is_sqlite_file(url):
+        return f"{parsed.database}.bootstrap.lock"
+    if parsed.get_backend_name() == "sqlite":
+        return None
+    digest = hashlib.sha256(url.encode()).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"ad-campaigns-bootstrap-{digest}.lock")
+
+
+@contextmanager
+def bootstrap_lock(engine: Engine) -> Iterator[None]:
+    """
+    Lets one worker process at a time run the startup bootstrap on
+    `engine`'s database: a PostgreSQL advisory lock, or an exclusive lock on
+    `bootstrap_lock_path` (for workers sharing a host or volume).
+    """
+    started = time.perf_counter()
+    if engine.dialect.name == "postgresql":
+        with engine.connect() as connection:
+            connection.execute(
+                text("SELECT pg_advisory_lock(:key)"), {"key": BOOTSTRAP_ADVISORY_LOCK_KEY}
+            )
+            logger.info("Bootstrap lock acquired in %.3f s", time.perf_counter() - started)
+            try:
+                yield
+            finally:
+                connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": BOOTSTRAP_ADVISORY_LOCK_KEY},
+                )
+        return
+
+    path = bootstrap_lock_path(engine.url.render_as_string(hide_password=False))
+    if path is None or fcntl is None:
+        yield
+        return
+    with open(path, "a+b") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        logger.info("Bootstrap lock acquired in %.3f s", time.perf_counter() - started)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -1,2 +1,3 @@
 from .campaign import Campaign
+from .campaign_stats import CampaignMonthlyStats
 from .user import User
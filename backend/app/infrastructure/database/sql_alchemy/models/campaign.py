@@ -1,10 +1,31 @@
 import datetime
 
-from sqlalchemy import Boolean, Date, Float, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    event,
+    inspect,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.infrastructure.database.sql_alchemy.models.base import Base
 
+# date.toordinal() + JULIAN_DAY_OFFSET equals SQLite's CAST(julianday(date) AS INTEGER).
+JULIAN_DAY_OFFSET = 1721424
+
+
+def utcnow() -> datetime.datetime:
+    """Timezone-aware current UTC time, used for `updated_at`."""
+    return datetime.datetime.now(datetime.timezone.utc)
+
 
 class Campaign(Base):
     """SQLAlchemy model representing the 'campaigns' table."""
@@ -12,9 +33,153 @@ class Campaign(Base):
 
     name: Mapped[str] = mapped_column(String(255), index=True, nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
-    start_date: Mapped[datetime.date] = mapped_column(Date, nullable=False)
-    end_date: Mapped[datetime.date] = mapped_column(Date, nullable=False)
-    budget: Mapped[float] = mapped_column(Float, nullable=False)
+    start_date: Mapped[datetime.date] = mapped_column(Date, index=True, nullable=False)
+    end_date: Mapped[datetime.date] = mapped_column(Date, index=True, nullable=False)
+    budget: Mapped[float] = mapped_column(Float, index=True, nullable=False)
     is_active: Mapped[bool] = mapped_column(
         Boolean, default=False, index=True
     )
+    # Optimistic-locking row version: ORM flushes update `WHERE version = ?`
+    # and increment it. Statement-level writes bump it explicitly.
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=utcnow, onupdate=utcnow
+    )
+
+    __mapper_args__ = {"version_id_col": version}
+
+
+# Columns added after the first release, with the DDL that adds them to an
+# existing `campaigns` table (create_all never alters tables).
+_ADDED_COLUMNS = {
+    "version": "ALTER TABLE campaigns ADD COLUMN version INTEGER NOT NULL DEFAULT 1",
+    "updated_at": (
+        "ALTER TABLE campaigns ADD COLUMN updated_at TIMESTAMP NOT NULL "
+        "DEFAULT '1970-01-01 00:00:00'"
+    ),
+}
+
+
+@event.listens_for(Base.metadata, "before_create")
+def add_missing_campaign_columns(_target, connection, **_kw) -> None:
+    """Adds columns introduced since an existing `campaigns` table was created."""
+    inspector = inspect(connection)
+    if not inspector.has_table("campaigns"):
+        return
+    existing = {column["name"] for column in inspector.get_columns("campaigns")}
+    for name, ddl in _ADDED_COLUMNS.items():
+        if name not in existing:
+            connection.exec_driver_sql(ddl)
+
+
+# SQLite R*Tree over each campaign's [start_date, end_date] interval, stored as
+# julian day numbers and kept in sync by triggers. It is a virtual table, so it
+# is declared on its own MetaData: create_all must never emit a plain CREATE
+# TABLE for it.
+sqlite_virtual_metadata = MetaData()
+
+campaign_date_rtree = Table(
+    "campaigns_date_rtree",
+    sqlite_virtual_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("start_day", Integer),
+    Column("end_day", Integer),
+)
+
+_JULIAN_DAY = "CAST(julianday({column}) AS INTEGER)"
+
+_DATE_RTREE_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS campaigns_date_rtree "
+    "USING rtree_i32(id, start_day, end_day)",
+    "CREATE TRIGGER IF NOT EXISTS campaigns_date_rtree_ai AFTER INSERT ON campaigns BEGIN "
+    "INSERT INTO campaigns_date_rtree (id, start_day, end_day) VALUES "
+    "(NEW.id, {interval}); END",
+    "CREATE TRIGGER IF NOT EXISTS campaigns_date_rtree_ad AFTER DELETE ON campaigns BEGIN "
+    "DELETE FROM campaigns_date_rtree WHERE id = OLD.id; END",
+    "CREATE TRIGGER IF NOT EXISTS campaigns_date_rtree_au "
+    "AFTER UPDATE OF start_date, end_date ON campaigns BEGIN "
+    "DELETE FROM campaigns_date_rtree WHERE id = OLD.id; "
+    "INSERT INTO campaigns_date_rtree (id, start_day, end_day) VALUES "
+    "(NEW.id, {interval}); END",
+)
+
+_DATE_RTREE_BACKFILL = (
+    "INSERT INTO campaigns_date_rtree (id, start_day, end_day) "
+    "SELECT campaigns.id, {interval} FROM campaigns"
+)
+
+
+# FTS5 index over campaign names and descriptions. It is an external-content
+# table: the text lives only in `campaigns`, and triggers keep the index in
+# sync. The column named after the table is FTS5's hidden column, the left
+# operand of MATCH and the first argument of bm25().
+campaign_fts = Table(
+    "campaigns_fts",
+    sqlite_virtual_metadata,
+    Column("rowid", Integer, primary_key=True),
+    Column("name", Text),
+    Column("description", Text),
+    Column("campaigns_fts", Text),
+)
+
+_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS campaigns_fts USING fts5("
+    "name, description, content='campaigns', content_rowid='id')",
+    "CREATE TRIGGER IF NOT EXISTS campaigns_fts_ai AFTER INSERT ON campaigns BEGIN "
+    "INSERT INTO campaigns_fts (rowid, name, description) "
+    "VALUES (NEW.id, NEW.name, NEW.description); END",
+    "CREATE TRIGGER IF NOT EXISTS campaigns_fts_ad AFTER DELETE ON campaigns BEGIN "
+    "INSERT INTO campaigns_fts (campaigns_fts, rowid, name, description) "
+    "VALUES ('delete', OLD.id, OLD.name, OLD.description); END",
+    "CREATE TRIGGER IF NOT EXISTS campaigns_fts_au "
+    "AFTER UPDATE OF name, description ON campaigns BEGIN "
+    "INSERT INTO campaigns_fts (campaigns_fts, rowid, name, description) "
+    "VALUES ('delete', OLD.id, OLD.name, OLD.description); "
+    "INSERT INTO campaigns_fts (rowid, name, description) "
+    "VALUES (NEW.id, NEW.name, NEW.description); END",
+)
+
+_FTS_BACKFILL = "INSERT INTO campaigns_fts (campaigns_fts) VALUES ('rebuild')"
+
+
+def _interval(row: str) -> str:
+    start = _JULIAN_DAY.format(column=f"{row}.start_date")
+    end = _JULIAN_DAY.format(column=f"{row}.end_date")
+    # min/max keep the R*Tree valid even for rows whose end precedes their start.
+    return f"min({start}, {end}), max({start}, {end})"
+
+
+# Part of the schema fingerprint (see `schema.schema_fingerprint`).
+Base.metadata.info.setdefault("ddl", []).extend(
+    [*_ADDED_COLUMNS.values(), *_DATE_RTREE_DDL, _DATE_RTREE_BACKFILL, *_FTS_DDL]
+)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def create_sqlite_campaign_indexes(_target, connection, **_kw) -> None:
+    """
+    Installs the SQLite-only campaign indexes after `create_all`.
+
+    Every statement is idempotent, so this also upgrades databases whose
+    `campaigns` table predates the indexes; existing rows are backfilled the
+    first time each virtual table is created.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+
+    def installed(table: str) -> bool:
+        return connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).first() is not None
+
+    rtree_installed = installed("campaigns_date_rtree")
+    for statement in _DATE_RTREE_DDL:
+        connection.exec_driver_sql(statement.format(interval=_interval("NEW")))
+    if not rtree_installed:
+        connection.exec_driver_sql(_DATE_RTREE_BACKFILL.format(interval=_interval("campaigns")))
+
+    fts_installed = installed("campaigns_fts")
+    for statement in _FTS_DDL:
+        connection.exec_driver_sql(statement)
+    if not fts_installed:
+        connection.exec_driver_sql(_FTS_BACKFILL)
@@ -0,0 +1,47 @@
+import datetime
+
+from sqlalchemy import Boolean, Date, Float, Integer, UniqueConstraint, cast, event, func, insert, select
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.database.sql_alchemy.models.base import Base
+from app.infrastructure.database.sql_alchemy.models.campaign import Campaign
+
+
+class CampaignMonthlyStats(Base):
+    """
+    SQLAlchemy model for the 'campaign_monthly_stats' rollup: the number and
+    total budget of campaigns per start month and activity state.
+    """
+    __tablename__ = "campaign_monthly_stats"
+    __table_args__ = (UniqueConstraint("start_month", "is_active"),)
+
+    start_month: Mapped[datetime.date] = mapped_column(Date, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    campaign_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    budget_total: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+
+def month_start(column, dialect_name: str):
+    """SQL expression truncating a date column to the first day of its month."""
+    if dialect_name == "sqlite":
+        return func.date(column, "start of month", type_=Date)
+    return cast(func.date_trunc("month", column), Date)
+
+
+def recompute_campaign_stats(dialect_name: str):
+    """INSERT ... SELECT filling the rollup from the `campaigns` table."""
+    month = month_start(Campaign.start_date, dialect_name)
+    is_active = func.coalesce(Campaign.is_active, False)
+    return insert(CampaignMonthlyStats).from_select(
+        ["start_month", "is_active", "campaign_count", "budget_total"],
+        select(month, is_active, func.count(), func.sum(Campaign.budget)).group_by(
+            month, is_active
+        ),
+    )
+
+
+@event.listens_for(Base.metadata, "after_create")
+def backfill_campaign_stats(_target, connection, tables=(), **_kw) -> None:
+    """Fills the rollup from existing campaigns when `create_all` creates it."""
+    if CampaignMonthlyStats.__table__ in tables:
+        connection.execute(recompute_campaign_stats(connection.dialect.name))
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, Table
+
+from app.infrastructure.database.sql_alchemy.models.base import Base
+
+# Facts about the database schema itself, such as the fingerprint of the
+# schema it was last created for (see `schema.ensure_schema`).
+schema_meta = Table(
+    "schema_meta",
+    Base.metadata,
+    Column("key", String(64), primary_key=True),
+    Column("value", String(255), nullable=False),
+)
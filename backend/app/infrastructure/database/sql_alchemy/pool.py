@@ -0,0 +1,219 @@
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, Tuple, Type, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import Pool, QueuePool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EngineType = TypeVar("EngineType")
+
+# Instrumented engines by name, with their metrics (see `instrumented_engine`).
+_engines: Dict[str, Tuple[Any, "PoolMetrics"]] = {}
+
+
+class PoolMetrics:
+    """
+    Live counters of one engine's connection pool: connections opened and
+    invalidated, checkouts and checkins, peak overflow, and how long
+    checkouts waited for a free connection.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._counters = Counter()
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._peak_overflow = 0
+
+    def count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def record_overflow(self, overflow: int) -> None:
+        with self._lock:
+            self._peak_overflow = max(self._peak_overflow, overflow)
+
+    def record_wait(self, seconds: float, status: Callable[[], str]) -> None:
+        """Records a checkout wait; waits above DB_POOL_WAIT_WARN_SECONDS are logged."""
+        slow = seconds >= settings.DB_POOL_WAIT_WARN_SECONDS
+        with self._lock:
+            self._counters["waits"] += 1
+            self._counters["slow_waits"] += slow
+            self._wait_total += seconds
+            self._wait_max = max(self._wait_max, seconds)
+        if slow:
+            logger.warning(
+                "Pool %s: checkout waited %.3f s for a connection (%s)",
+                self.name, seconds, status(),
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._wait_total = self._wait_max = 0.0
+            self._peak_overflow = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waits = self._counters["waits"]
+            return {
+                "connects": self._counters["connects"],
+                "checkouts": self._counters["checkouts"],
+                "checkins": self._counters["checkins"],
+                "invalidations": self._counters["invalidations"],
+                "soft_invalidations": self._counters["soft_invalidations"],
+                "peak_overflow": self._peak_overflow,
+                "waits": waits,
+                "slow_waits": self._counters["slow_waits"],
+                "wait_avg_ms": self._wait_total / waits * 1000 if waits else None,
+                "wait_max_ms": self._wait_max * 1000,
+            }
+
+
+def _timed_pool(base: Type[QueuePool], metrics: PoolMetrics) -> Type[QueuePool]:
+    """
+    `base` subclass timing how long each checkout waits in `_do_get`. The
+    engine keeps the class when it recreates its pool (`dispose`).
+    """
+    class TimedPool(base):  # pylint: disable=too-few-public-methods
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                # Timeouts are recorded too, as the longest waits.
+                metrics.record_wait(time.perf_counter() - started, self.status)
+
+    # SQLAlchemy names pool loggers after the class: keep them under its
+    # "sqlalchemy" logger, whose level it manages.
+    TimedPool.__module__ = base.__module__
+    TimedPool.__name__ = TimedPool.__qualname__ = f"Timed{base.__name__}"
+    return TimedPool
+
+
+def _is_memory_database(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and (
+        parsed.database in (None, "", ":memory:") or parsed.query.get("mode") == "memory"
+    )
+
+
+def pool_options(
+    url: str, metrics: PoolMetrics, queue_pool: Type[QueuePool] = QueuePool
+) -> Dict[str, Any]:
+    """
+    Engine keyword arguments for the pool settings. In-memory SQLite
+    databases keep their single-connection pool; pre-ping defaults to on for
+    network databases only, a local SQLite file never drops a connection.
+    """
+    pre_ping = settings.DB_POOL_PRE_PING
+    if pre_ping is None:
+        pre_ping = make_url(url).get_backend_name() != "sqlite"
+    options: Dict[str, Any] = {"pool_pre_ping": pre_ping, "pool_logging_name": metrics.name}
+    if _is_memory_database(url):
+        return options
+    return {
+        **options,
+        "poolclass": _timed_pool(queue_pool, metrics),
+        "pool_size": settings.DB_POOL_SIZE or settings.THREAD_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+
+def instrumented_engine(
+    create: Callable[..., EngineType],
+    url: str,
+    name: str,
+    *,
+    queue_pool: Type[QueuePool] = QueuePool,
+    **kwargs: Any,
+) -> EngineType:
+    """
+    Creates an engine with `create` (create_engine / create_async_engine),
+    pooled per the settings (`kwargs` take precedence), and tracks its pool
+    under `name` through pool events (see `pool_stats`).
+    """
+    metrics = PoolMetrics(name)
+    engine = create(url, **{**pool_options(url, metrics, queue_pool), **kwargs})
+    sync_engine: Engine = getattr(engine, "sync_engine", engine)
+
+    def on_checkout(*_args) -> None:
+        metrics.count("checkouts")
+        if isinstance(sync_engine.pool, QueuePool):
+            metrics.record_overflow(max(sync_engine.pool.overflow(), 0))
+
+    event.listen(sync_engine, "connect", lambda *_: metrics.count("connects"))
+    event.listen(sync_engine, "checkout", on_checkout)
+    event.listen(sync_engine, "checkin", lambda *_: metrics.count("checkins"))
+    event.listen(sync_engine, "invalidate", lambda *_: metrics.count("invalidations"))
+    event.listen(
+        sync_engine, "soft_invalidate", lambda *_: metrics.count("soft_invalidations")
+    )
+    _engines[name] = (sync_engine, metrics)
+    return engine
+
+
+def _describe(pool: Pool) -> Dict[str, Any]:
+    if not isinstance(pool, QueuePool):
+        return {"pool": type(pool).__name__}
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "timeout": pool.timeout(),
+    }
+
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Current state and counters of every instrumented pool, by engine name."""
+    return {
+        name: {**_describe(engine.pool), **metrics.stats()}
+        for name, (engine, metrics) in _engines.items()
+    }
+
+
+def reset_pool_stats() -> None:
+    for _, metrics in _engines.values():
+        metrics.reset()
+
+
+def warm_up(connections: int) -> None:
+    """
+    Opens up to `connections` connections in the pool of each sync engine,
+    so that the first requests of a worker do not pay for them.
+    """
+    for engine, _ in _engines.values():
+        if engine.dialect.is_async or not isinstance(engine.pool, QueuePool):
+            continue
+        with ExitStack() as stack:
+            for _ in range(min(connections, engine.pool.size())):
+                stack.enter_context(engine.connect())
+
+
+def _dispose_after_fork() -> None:
+    """
+    Forked worker processes must not share their parent's connections: the
+    child's engines start over with empty pools, the parent's connections
+    are left to it.
+    """
+    for engine, metrics in _engines.values():
+        engine.dispose(close=False)
+        metrics.reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_dispose_after_fork)
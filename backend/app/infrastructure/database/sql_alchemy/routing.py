@@ -0,0 +1,53 @@
+import itertools
+from typing import Any, List, NamedTuple, Sequence
+
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+from app.infrastructure.database.sql_alchemy.sqlite import read_only_url
+
+
+class ReadTarget(NamedTuple):
+    name: str
+    url: str
+    read_only: bool
+
+
+def read_targets(primary_url: str) -> List[ReadTarget]:
+    """
+    Engines to create for reads: the DATABASE_READ_REPLICA_URLS, or else a
+    read-only engine on a SQLite file primary. Empty when reads go to the
+    primary engine. SQLite files are opened read-only (SQLITE_READ_ONLY_ENGINE).
+    """
+    replicas = settings.DATABASE_READ_REPLICA_URLS
+    urls = [(f"replica{i}", url) for i, url in enumerate(replicas, 1)] or [("read", primary_url)]
+    targets = []
+    for name, url in urls:
+        ro_url = read_only_url(url) if settings.SQLITE_READ_ONLY_ENGINE else None
+        if ro_url is not None:
+            targets.append(ReadTarget(name, ro_url, True))
+        elif replicas:
+            targets.append(ReadTarget(name, url, False))
+    return targets
+
+
+def _checked_out(engine: Any) -> int:
+    pool = getattr(engine, "sync_engine", engine).pool
+    return pool.checkedout() if isinstance(pool, QueuePool) else 0
+
+
+class ReadRouter:
+    """
+    Spreads read sessions over `engines` (sync or async): each goes to the
+    engine with the fewest checked-out connections, ties taken in turn.
+    """
+
+    def __init__(self, engines: Sequence[Any]):
+        self.engines = list(engines)
+        self._turns = itertools.count()
+
+    def pick(self) -> Any:
+        if len(self.engines) == 1:
+            return self.engines[0]
+        start = next(self._turns) % len(self.engines)
+        return min(self.engines[start:] + self.engines[:start], key=_checked_out)
@@ -0,0 +1,53 @@
+import hashlib
+import logging
+
+from sqlalchemy import MetaData, delete, exc, insert, select
+from sqlalchemy.engine import Dialect, Engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.infrastructure.database.sql_alchemy.models.base import Base
+from app.infrastructure.database.sql_alchemy.models.schema_meta import schema_meta
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_KEY = "schema_fingerprint"
+
+
+def schema_fingerprint(metadata: MetaData, dialect: Dialect) -> str:
+    """
+    Hash of the DDL of `metadata` for `dialect`: its tables and indexes, and
+    the statements its `create_all` events run (listed in `metadata.info["ddl"]`).
+    """
+    digest = hashlib.sha256()
+    for table in metadata.sorted_tables:
+        digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda index: index.name or ""):
+            digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+    for statement in metadata.info.get("ddl", ()):
+        digest.update(statement.encode())
+    return digest.hexdigest()
+
+
+def ensure_schema(engine: Engine, metadata: MetaData = Base.metadata) -> bool:
+    """
+    Runs `create_all` unless the database records the fingerprint of this
+    schema, then records it: warm boots read one row instead of reflecting
+    every table. Returns whether `create_all` ran.
+    """
+    fingerprint = schema_fingerprint(metadata, engine.dialect)
+    with engine.connect() as connection:
+        try:
+            stored = connection.execute(
+                select(schema_meta.c.value).where(schema_meta.c.key == FINGERPRINT_KEY)
+            ).scalar()
+        except exc.DBAPIError:  # No schema_meta table yet.
+            stored = None
+    if stored == fingerprint:
+        logger.info("Schema fingerprint matches, skipping create_all.")
+        return False
+
+    with engine.begin() as connection:
+        metadata.create_all(bind=connection)
+        connection.execute(delete(schema_meta).where(schema_meta.c.key == FINGERPRINT_KEY))
+        connection.execute(insert(schema_meta).values(key=FINGERPRINT_KEY, value=fingerprint))
+    return True
@@ -4,6 +4,9 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
+from app.infrastructure.database.sql_alchemy.pool import instrumented_engine
+from app.infrastructure.database.sql_alchemy.routing import ReadRouter, read_targets
+from app.infrastructure.database.sql_alchemy.sqlite import apply_sqlite_profile
 
 # Check if DATABASE_URL starts with sqlite
 is_sqlite = settings.DATABASE_URL.startswith("sqlite")
@@ -11,12 +14,26 @@ is_sqlite = settings.DATABASE_URL.startswith("sqlite")
 # Adjust connect_args for SQLite
 connect_args = {"check_same_thread": False} if is_sqlite else {}
 
-engine = create_engine(
-    settings.DATABASE_URL, pool_pre_ping=True, connect_args=connect_args
+engine = instrumented_engine(
+    create_engine, settings.DATABASE_URL, "primary", connect_args=connect_args
 )
+apply_sqlite_profile(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def _read_engine(name: str, url: str, read_only: bool):
+    read_engine = instrumented_engine(create_engine, url, name, connect_args=connect_args)
+    apply_sqlite_profile(read_engine, read_only=read_only)
+    return read_engine
+
+
+# Replicas or read-only SQLite engine; the primary one when there is none.
+read_router = ReadRouter(
+    [_read_engine(*target) for target in read_targets(settings.DATABASE_URL)] or [engine]
+)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency to get a database session.
@@ -27,3 +44,15 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    Dependency to get a session for read-only requests, on the least busy
+    read engine (see `read_router`).
+    """
+    db = ReadSessionLocal(bind=read_router.pick())
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,85 @@
+import logging
+from typing import List, Optional
+from urllib.parse import quote
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine, make_url
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def is_sqlite_file(url: str) -> bool:
+    """True for SQLite databases stored in a file (not in memory)."""
+    parsed = make_url(url)
+    return (
+        parsed.get_backend_name() == "sqlite"
+        and parsed.database not in (None, "", ":memory:")
+        and parsed.query.get("mode") != "memory"
+    )
+
+
+def read_only_url(url: str) -> Optional[str]:
+    """
+    URL opening the SQLite file database of `url` read-only (`mode=ro` URI),
+    or None when `url` is not one.
+    """
+    if not is_sqlite_file(url):
+        return None
+    parsed = make_url(url)
+    database = parsed.database
+    if not database.startswith("file:"):
+        database = f"file:{quote(database)}"
+    return parsed.set(
+        database=database, query={**parsed.query, "mode": "ro", "uri": "true"}
+    ).render_as_string(hide_password=False)
+
+
+def connection_pragmas(read_only: bool = False) -> List[str]:
+    """
+    Per-connection pragmas of the SQLite profile. The journal mode is stored
+    in the database file, so read-only connections leave it alone.
+    """
+    pragmas = [
+        f"PRAGMA busy_timeout = {settings.SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}",
+        # Negative sizes are in KiB rather than pages.
+        f"PRAGMA cache_size = -{settings.SQLITE_CACHE_SIZE_KIB}",
+        f"PRAGMA mmap_size = {settings.SQLITE_MMAP_SIZE_MB * 1024 * 1024}",
+        f"PRAGMA temp_store = {settings.SQLITE_TEMP_STORE}",
+    ]
+    if not read_only:
+        pragmas.insert(0, f"PRAGMA journal_mode = {settings.SQLITE_JOURNAL_MODE}")
+    return pragmas
+
+
+def apply_sqlite_profile(engine, read_only: bool = False) -> None:
+    """
+    Runs `connection_pragmas` on every connection `engine` (sync or async)
+    opens, when it is a SQLite file database.
+    """
+    sync_engine: Engine = getattr(engine, "sync_engine", engine)
+    if not is_sqlite_file(sync_engine.url.render_as_string(hide_password=False)):
+        return
+    pragmas = connection_pragmas(read_only)
+
+    def on_connect(dbapi_connection, _record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    event.listen(sync_engine, "connect", on_connect)
+
+
+def optimize(engine: Engine) -> None:
+    """
+    Runs `PRAGMA optimize`, which refreshes the query planner statistics of
+    the tables whose contents changed enough since the last run.
+    """
+    with engine.connect() as connection:
+        connection.execute(text("PRAGMA optimize"))
+    logger.debug("PRAGMA optimize ran on %s", engine.url)
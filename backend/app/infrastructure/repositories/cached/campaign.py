@@ -0,0 +1,271 @@
+import copy
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from app.core.cache import Generation, TTLCache
+from app.core.config import settings
+from app.domain.entities.campaign import Campaign
+from app.domain.interfaces.campaign_repository import (
+    CampaignOrder,
+    CampaignSortField,
+    ICampaignRepository,
+    PartialCampaign,
+)
+
+# Process-wide cache of campaigns by id, shared by every request.
+campaign_cache = TTLCache(
+    maxsize=settings.CAMPAIGN_CACHE_MAXSIZE, ttl=settings.CAMPAIGN_CACHE_TTL_SECONDS
+)
+# Bumped after every campaign write made through this process.
+campaign_generation = Generation()
+
+
+class CachedCampaignRepository(ICampaignRepository):
+    """
+    Read-through cache around another campaign repository.
+
+    `get` is served from `cache` when possible; every write through this
+    repository invalidates the campaigns it touched once the write is
+    committed. Cached entities are copied on the way in and out, so callers
+    can never mutate a cached campaign.
+
+    Every write also bumps `generation`, which callers caching derived
+    results (such as list pages) read through `data_generation`.
+    """
+    def __init__(
+        self,
+        inner: ICampaignRepository,
+        cache: TTLCache = campaign_cache,
+        generation: Generation = campaign_generation,
+    ):
+        self.inner = inner
+        self.cache = cache
+        self.generation = generation
+
+    def data_generation(self) -> Optional[int]:
+        return self.generation.value
+
+    def get(self, id: Any) -> Optional[Campaign]:
+        cached = self.cache.get(id)
+        if cached is not None:
+            return copy.copy(cached)
+
+        generation = self.cache.generation
+        entity = self.inner.get(id)
+        if entity is not None:
+            self.cache.set(id, copy.copy(entity), generation=generation)
+        return entity
+
+    def get_fields(self, id: Any, fields: Sequence[str]) -> Optional[PartialCampaign]:
+        cached = self.cache.peek(id)
+        if cached is not None:
+            return {"id": cached.id, **{field: getattr(cached, field) for field in fields}}
+        # Partial rows are not cached: a later full read could not use them.
+        return self.inner.get_fields(id, fields)
+
+    def get_version(self, id: Any) -> Optional[Tuple[int, datetime]]:
+        current = self.inner.get_version(id)
+        cached = self.cache.peek(id)
+        # The probe always reads the database: drop a copy it proves outdated,
+        # e.g. one changed by another process.
+        if cached is not None and (current is None or cached.version != current[0]):
+            self.cache.invalidate(id)
+        return current
+
+    def get_multi(self, *, skip: int = 0, limit: int = 100) -> List[Campaign]:
+        return self.inner.get_multi(skip=skip, limit=limit)
+
+    def create(self, *, entity: Campaign) -> Campaign:
+        try:
+            return self.inner.create(entity=entity)
+        finally:
+            self.generation.bump()
+
+    def update(self, *, id: Any, entity: Campaign) -> Campaign:
+        try:
+            return self.inner.update(id=id, entity=entity)
+        finally:
+            self.cache.invalidate(id)
+            self.generation.bump()
+
+    def update_fields(
+        self,
+        *,
+        id: Any,
+        values: Dict[str, Any],
+        expected_versions: Optional[Set[int]] = None,
+    ) -> Optional[Campaign]:
+        try:
+            return self.inner.update_fields(
+                id=id, values=values, expected_versions=expected_versions
+            )
+        finally:
+            self.cache.invalidate(id)
+            self.generation.bump()
+
+    def remove(
+        self, *, id: Any, expected_versions: Optional[Set[int]] = None
+    ) -> Optional[Campaign]:
+        try:
+            return self.inner.remove(id=id, expected_versions=expected_versions)
+        finally:
+            self.cache.invalidate(id)
+            self.generation.bump()
+
+    def get_multi_filtered(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search: Optional[str] = None,
+        sort: CampaignOrder = "id",
+        after: Optional[Tuple[Any, int]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Union[Campaign, PartialCampaign]]:
+        return self.inner.get_multi_filtered(
+            skip=skip,
+            limit=limit,
+            is_active=is_active,
+            start_date=start_date,
+            end_date=end_date,
+            search=search,
+            sort=sort,
+            after=after,
+            fields=fields,
+        )
+
+    def get_multi_filtered_with_total(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search: Optional[str] = None,
+        sort: CampaignSortField = "id",
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Union[Campaign, PartialCampaign]], int]:
+        return self.inner.get_multi_filtered_with_total(
+            skip=skip,
+            limit=limit,
+            is_active=is_active,
+            start_date=start_date,
+            end_date=end_date,
+            search=search,
+            sort=sort,
+            fields=fields,
+        )
+
+    def count_filtered(
+        self,
+        *,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search: Optional[str] = None,
+        max_count: Optional[int] = None,
+    ) -> int:
+        return self.inner.count_filtered(
+            is_active=is_active,
+            start_date=start_date,
+            end_date=end_date,
+            search=search,
+            max_count=max_count,
+        )
+
+    def iter_filtered(
+        self,
+        *,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Campaign]:
+        return self.inner.iter_filtered(
+            is_active=is_active,
+            start_date=start_date,
+            end_date=end_date,
+            search=search,
+            batch_size=batch_size,
+        )
+
+    def create_many(self, *, entities: List[Campaign]) -> List[Campaign]:
+        try:
+            return self.inner.create_many(entities=entities)
+        finally:
+            self.generation.bump()
+
+    def _invalidate_bulk(self, ids: Optional[List[int]]) -> None:
+        # Without the affected ids, any cached campaign may be stale.
+        if ids is None:
+            self.cache.clear()
+        else:
+            for campaign_id in ids:
+                self.cache.invalidate(campaign_id)
+        self.generation.bump()
+
+    def set_active_filtered(
+        self,
+        *,
+        active: bool,
+        ids: Optional[List[int]] = None,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        returning: bool = False,
+    ) -> Tuple[int, Optional[List[int]]]:
+        affected_ids = None
+        try:
+            affected, affected_ids = self.inner.set_active_filtered(
+                active=active,
+                ids=ids,
+                is_active=is_active,
+                start_date=start_date,
+                end_date=end_date,
+                returning=returning,
+            )
+        finally:
+            self._invalidate_bulk(affected_ids)
+        return affected, affected_ids
+
+    def remove_filtered(
+        self,
+        *,
+        ids: Optional[List[int]] = None,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        returning: bool = False,
+    ) -> Tuple[int, Optional[List[int]]]:
+        affected_ids = None
+        try:
+            affected, affected_ids = self.inner.remove_filtered(
+                ids=ids,
+                is_active=is_active,
+                start_date=start_date,
+                end_date=end_date,
+                returning=returning,
+            )
+        finally:
+            self._invalidate_bulk(affected_ids)
+        return affected, affected_ids
+
+    def get_monthly_stats(
+        self,
+        *,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search: Optional[str] = None,
+    ) -> List[Tuple[date, bool, int, float]]:
+        return self.inner.get_monthly_stats(
+            is_active=is_active, start_date=start_date, end_date=end_date, search=search
+        )
+
+    def rebuild_stats(self) -> None:
+        self.inner.rebuild_stats()
@@ -0,0 +1,62 @@
+import functools
+from typing import Any, Callable
+
+from anyio import to_thread
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.domain.interfaces.async_repository import (
+    IAsyncRepository,
+    RepositoryType,
+    ResultType,
+)
+
+
+def _unit_of_work(
+    db: Session, fn: Callable[..., ResultType], *args: Any, **kwargs: Any
+) -> ResultType:
+    """
+    Calls `fn` and ends the transaction it opened. A request awaits between
+    two calls: holding a pooled connection meanwhile would let the pool (or,
+    with threads, the thread pool) run dry while its owners wait their turn.
+    """
+    result = fn(*args, **kwargs)
+    db.commit()
+    return result
+
+
+class ThreadedRepository(IAsyncRepository[RepositoryType]):
+    """Runs each call on a sync Session, in a worker thread."""
+    def __init__(self, db: Session, repository: RepositoryType):
+        self.db = db
+        self.repository = repository
+
+    async def run(
+        self, fn: Callable[..., ResultType], *args: Any, **kwargs: Any
+    ) -> ResultType:
+        return await to_thread.run_sync(
+            functools.partial(_unit_of_work, self.db, fn, self.repository, *args, **kwargs)
+        )
+
+
+class AsyncSessionRepository(IAsyncRepository[RepositoryType]):
+    """
+    Runs each call on the event loop through `AsyncSession.run_sync`: the sync
+    repository code runs in a greenlet and every database round trip is
+    awaited on the async driver (aiosqlite, asyncpg), so a request waiting on
+    the database does not hold a thread.
+
+    The repository is built once, by `factory`, on the Session that
+    `run_sync` hands to every call. Each call is a unit of work, as with
+    `ThreadedRepository`.
+    """
+    def __init__(self, session: AsyncSession, factory: Callable[[Session], RepositoryType]):
+        self.session = session
+        self.repository = factory(session.sync_session)
+
+    async def run(
+        self, fn: Callable[..., ResultType], *args: Any, **kwargs: Any
+    ) -> ResultType:
+        return await self.session.run_sync(
+            _unit_of_work, fn, self.repository, *args, **kwargs
+        )
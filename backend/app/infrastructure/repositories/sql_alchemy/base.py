@@ -26,12 +26,17 @@ class SQLAlchemyBaseRepository(Generic[ModelType, EntityType], IRepository[Entit
     def _from_entity(self, entity: EntityType) -> ModelType:
         raise NotImplementedError
 
+    def _on_write(self, old: Optional[Any], new: Optional[Any]) -> None:
+        """
+        Hook run inside every create/update/remove transaction, just before
+        the commit, with the row's previous values (None on create) and its
+        new values (None on remove). No-op by default.
+        """
+
     def _to_entity(self, db_obj: Optional[ModelType]) -> Optional[EntityType]:
         if db_obj is None:
             return None
-        entity_instance = self._create_entity_instance(db_obj)
-        entity_instance.id = db_obj.id
-        return entity_instance
+        return self._create_entity_instance(db_obj)
 
     def get(self, id: Any) -> Optional[EntityType]:
         db_obj = self.db.query(self.model).filter(self.model.id == id).first()
@@ -44,6 +49,7 @@ class SQLAlchemyBaseRepository(Generic[ModelType, EntityType], IRepository[Entit
     def create(self, *, entity: EntityType) -> EntityType:
         db_obj = self._from_entity(entity)
         self.db.add(db_obj)
+        self._on_write(None, db_obj)
         self.db.commit()
         self.db.refresh(db_obj)
         return self._to_entity(db_obj)
@@ -53,6 +59,7 @@ class SQLAlchemyBaseRepository(Generic[ModelType, EntityType], IRepository[Entit
         if not db_obj:
             raise ValueError(f"Entity with id {id} not found")
 
+        old = self._to_entity(db_obj)
         update_model_instance = self._from_entity(entity)
         update_data = update_model_instance.__dict__
 
@@ -62,6 +69,7 @@ class SQLAlchemyBaseRepository(Generic[ModelType, EntityType], IRepository[Entit
         for key, value in update_data.items():
             setattr(db_obj, key, value)
 
+        self._on_write(old, db_obj)
         self.db.commit()
         self.db.refresh(db_obj)
         return self._to_entity(db_obj)
@@ -71,6 +79,7 @@ class SQLAlchemyBaseRepository(Generic[ModelType, EntityType], IRepository[Entit
         if db_obj:
             entity = self._to_entity(db_obj)
             self.db.delete(db_obj)
+            self._on_write(entity, None)
             self.db.commit()
             return entity
         return None
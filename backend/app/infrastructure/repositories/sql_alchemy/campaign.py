@@ -1,16 +1,58 @@
-from datetime import date
-from typing import List, Optional
+import re
+from datetime import date, datetime, timezone
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union,
+)
 
-from sqlalchemy import and_
+from sqlalchemy import and_, delete, false, func, insert, select, true, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.functions import coalesce
 
+from app.core.config import settings
 from app.domain.entities.campaign import Campaign
-from app.domain.interfaces.campaign_repository import ICampaignRepository
+from app.domain.interfaces.campaign_repository import (
+    CampaignOrder,
+    CampaignSortField,
+    ICampaignRepository,
+    PartialCampaign,
+)
 from app.infrastructure.database.sql_alchemy.models.campaign import (
+    JULIAN_DAY_OFFSET,
     Campaign as CampaignModel,
+    campaign_date_rtree,
+    campaign_fts,
+    utcnow,
+)
+from app.infrastructure.database.sql_alchemy.models.campaign_stats import (
+    CampaignMonthlyStats,
+    month_start,
+    recompute_campaign_stats,
 )
 from app.infrastructure.repositories.sql_alchemy.base import SQLAlchemyBaseRepository
 
+# (start month or any day of it, is_active, campaign count, budget total).
+StatsRow = Tuple[date, bool, int, float]
+
+# Columns of a full campaign read, in the order `_from_row` unpacks them.
+_ENTITY_FIELDS = (
+    "id", "name", "description", "start_date", "end_date", "budget", "is_active",
+    "version", "updated_at",
+)
+
+# Columns the monthly rollup is keyed or summed on.
+_STATS_COLUMNS = frozenset({"start_date", "is_active", "budget"})
+
+# bm25 column weights: a hit in the name counts ten times one in the description.
+_FTS_WEIGHTS = (10.0, 1.0)
+
+
+def _as_utc(moment: Optional[datetime]) -> Optional[datetime]:
+    # SQLite hands timestamps back without their timezone; they are stored in UTC.
+    if moment is not None and moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment
+
 
 class CampaignSqlAlchemyRepository(
     SQLAlchemyBaseRepository[CampaignModel, Campaign], ICampaignRepository
@@ -19,15 +61,19 @@ class CampaignSqlAlchemyRepository(
     def __init__(self, db: Session):
         super().__init__(db, CampaignModel, Campaign)
 
-    def _build_filtered_query(
+    def _build_filters(
         self,
         *,
         is_active: Optional[bool] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-    ):
+        search: Optional[str] = None,
+    ) -> list:
         filters = []
 
+        if search is not None:
+            filters.append(self._search_filter(search))
+
         if is_active is not None:
             filters.append(self.model.is_active == is_active)
 
@@ -43,13 +89,132 @@ class CampaignSqlAlchemyRepository(
         elif end_date:
             filters.append(self.model.start_date <= end_date)
 
-        query = self.db.query(self.model)
-        if filters:
-            query = query.filter(and_(*filters))
+        if start_date and end_date and self._use_date_rtree(start_date, end_date):
+            filters.append(
+                self.model.id.in_(
+                    select(campaign_date_rtree.c.id).where(
+                        campaign_date_rtree.c.start_day
+                        <= end_date.toordinal() + JULIAN_DAY_OFFSET,
+                        campaign_date_rtree.c.end_day
+                        >= start_date.toordinal() + JULIAN_DAY_OFFSET,
+                    )
+                )
+            )
+
+        return filters
+
+    def _use_date_rtree(self, start_date: date, end_date: date) -> bool:
+        # The R*Tree returns every overlapping interval before ordering, so it
+        # only pays off for windows narrow enough to match few campaigns.
+        # The plain overlap predicate is kept alongside it as the exact check.
+        return (
+            self.db.get_bind().dialect.name == "sqlite"
+            and 0 <= (end_date - start_date).days < settings.CAMPAIGN_DATE_RTREE_MAX_WINDOW_DAYS
+        )
+
+    @staticmethod
+    def _search_terms(search: str) -> List[str]:
+        return re.findall(r"\w+", search)
+
+    def _use_fts(self) -> bool:
+        return self.db.get_bind().dialect.name == "sqlite"
+
+    def _search_filter(self, search: str):
+        terms = self._search_terms(search)
+        if not terms:
+            return false()
+
+        if self._use_fts():
+            return self.model.id.in_(
+                select(campaign_fts.c.rowid).where(
+                    campaign_fts.c.campaigns_fts.match(self._fts_query(terms))
+                )
+            )
+
+        # Portable fallback: every term must appear in the name or description.
+        return and_(
+            *(
+                self.model.name.icontains(term, autoescape=True)
+                | self.model.description.icontains(term, autoescape=True)
+                for term in terms
+            )
+        )
+
+    @staticmethod
+    def _fts_query(terms: List[str]) -> str:
+        # Each term becomes a quoted prefix query, so user input can never be
+        # read as FTS5 syntax (operators, column filters, NEAR groups...).
+        return " ".join(f'"{term}"*' for term in terms)
+
+    def _search_rank(self, search: str):
+        """Returns a (rowid, rank) subquery of FTS matches, or None without FTS."""
+        terms = self._search_terms(search)
+        if not terms or not self._use_fts():
+            return None
+        return (
+            select(
+                campaign_fts.c.rowid,
+                func.bm25(campaign_fts.c.campaigns_fts, *_FTS_WEIGHTS).label("rank"),
+            )
+            .where(campaign_fts.c.campaigns_fts.match(self._fts_query(terms)))
+            .subquery()
+        )
+
+    def _read_columns(self, fields: Optional[Sequence[str]] = None) -> list:
+        # The id is always read first: it identifies the row and breaks sort ties.
+        return [self.model.id] + [
+            getattr(self.model, field) for field in fields or _ENTITY_FIELDS if field != "id"
+        ]
 
-        return query
+    def _read(self, stmt):
+        """
+        Runs a read on the session's connection: rows stay plain tuples, with
+        no ORM loading, identity map or instance state.
+        """
+        return self.db.connection().execute(stmt)
 
-    def get_multi_filtered(
+    @staticmethod
+    def _from_row(row, fields: Optional[Sequence[str]] = None, offset: int = 0):
+        """Maps the columns of `_read_columns(fields)`, from `offset` on, by position."""
+        if fields is not None:
+            names = ["id", *(field for field in fields if field != "id")]
+            partial = dict(zip(names, row[offset:]))
+            if "updated_at" in partial:
+                partial["updated_at"] = _as_utc(partial["updated_at"])
+            return partial
+
+        (
+            campaign_id, name, description, start_date, end_date, budget, is_active,
+            version, updated_at,
+        ) = row[offset:]
+        return Campaign(
+            name, description, start_date, end_date, budget, is_active,
+            version=version, updated_at=_as_utc(updated_at), id=campaign_id,
+        )
+
+    @staticmethod
+    def _sort_columns(entity, sort: CampaignSortField) -> list:
+        if sort == "id":
+            return [entity.id]
+        return [getattr(entity, sort), entity.id]
+
+    def _apply_keyset(
+        self,
+        query,
+        *,
+        sort: CampaignSortField,
+        after: Optional[Tuple[Any, int]],
+    ):
+        if after is not None:
+            if sort == "id":
+                query = query.filter(self.model.id > after[1])
+            else:
+                query = query.filter(
+                    tuple_(getattr(self.model, sort), self.model.id) > tuple_(*after)
+                )
+        return query.order_by(*self._sort_columns(self.model, sort))
+
+    def get_multi_filtered(  # pylint: disable=too-many-arguments
         self,
         *,
         skip: int = 0,
@@ -57,13 +222,78 @@ class CampaignSqlAlchemyRepository(
         is_active: Optional[bool] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-    ) -> List[Campaign]:
-        query = self._build_filtered_query(
-            is_active=is_active, start_date=start_date, end_date=end_date
+        search: Optional[str] = None,
+        sort: CampaignOrder = "id",
+        after: Optional[Tuple[Any, int]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Union[Campaign, PartialCampaign]]:
+        rank = self._search_rank(search) if sort == "relevance" and search else None
+        # The ranked matches filter on the search themselves.
+        filters = self._build_filters(
+            is_active=is_active,
+            start_date=start_date,
+            end_date=end_date,
+            search=search if rank is None else None,
+        )
+        # Read path: a Core select of plain columns. Rows map straight to
+        # entities, with no identity map, ORM instance or instance state.
+        stmt = select(*self._read_columns(fields)).where(*filters)
+        if rank is None:
+            # Without FTS there is no score to rank by: fall back to id order.
+            stmt = self._apply_keyset(
+                stmt, sort="id" if sort == "relevance" else sort, after=after
+            )
+        else:
+            # Joining the ranked matches both filters and scores the campaigns.
+            stmt = stmt.join(rank, rank.c.rowid == self.model.id).order_by(
+                rank.c.rank, self.model.id
+            )
+
+        rows = self._read(stmt.offset(skip).limit(limit))
+        return [self._from_row(row, fields) for row in rows]
+
+    def get_multi_filtered_with_total(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search: Optional[str] = None,
+        sort: CampaignSortField = "id",
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Union[Campaign, PartialCampaign]], int]:
+        filters = self._build_filters(
+            is_active=is_active, start_date=start_date, end_date=end_date, search=search
+        )
+
+        # One statement: a single-row count LEFT JOINed to the page, so the
+        # total comes back even when the page itself is empty.
+        total = (
+            select(func.count().label("total"))
+            .select_from(self.model)
+            .where(*filters)
+            .subquery()
+        )
+        page = (
+            select(*self._read_columns(fields))
+            .where(*filters)
+            .order_by(*self._sort_columns(self.model, sort))
+            .offset(skip)
+            .limit(limit)
+            .subquery()
+        )
+        stmt = (
+            select(total.c.total, *page.c)
+            .select_from(total)
+            .outerjoin(page, true())
+            .order_by(*self._sort_columns(page.c, sort))
         )
 
-        results = query.offset(skip).limit(limit).all()
-        return [self._to_entity(obj) for obj in results if obj is not None]
+        rows = self._read(stmt).all()
+        items = [self._from_row(row, fields, offset=1) for row in rows if row.id is not None]
+        return items, rows[0].total
 
     def count_filtered(
         self,
@@ -71,13 +301,366 @@ class CampaignSqlAlchemyRepository(
         is_active: Optional[bool] = None,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
+        search: Optional[str] = None,
+        max_count: Optional[int] = None,
     ) -> int:
-        query = self._build_filtered_query(
+        filters = self._build_filters(
+            is_active=is_active, start_date=start_date, end_date=end_date, search=search
+        )
+
+        if max_count is None:
+            stmt = select(func.count()).select_from(self.model).where(*filters)
+        else:
+            matches = select(self.model.id).where(*filters).limit(max_count).subquery()
+            stmt = select(func.count()).select_from(matches)
+
+        return self.db.execute(stmt).scalar_one()
+
+    def get_fields(self, id: Any, fields: Sequence[str]) -> Optional[PartialCampaign]:
+        row = self._read(select(*self._read_columns(fields)).where(self.model.id == id)).first()
+        return self._from_row(row, fields) if row is not None else None
+
+    def get_version(self, id: Any) -> Optional[Tuple[int, datetime]]:
+        row = self.db.execute(
+            select(self.model.version, self.model.updated_at).where(self.model.id == id)
+        ).first()
+        if row is None:
+            return None
+        return row.version, _as_utc(row.updated_at)
+
+    def iter_filtered(
+        self,
+        *,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Campaign]:
+        filters = self._build_filters(
+            is_active=is_active, start_date=start_date, end_date=end_date, search=search
+        )
+        # Plain column rows streamed with yield_per: no ORM instances enter the
+        # identity map, and only one batch is buffered at a time.
+        stmt = (
+            select(*self._read_columns())
+            .where(*filters)
+            .order_by(self.model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        for row in self._read(stmt):
+            yield self._from_row(row)
+
+    def create_many(self, *, entities: List[Campaign]) -> List[Campaign]:
+        if not entities:
+            return []
+
+        now = utcnow()
+        rows = [
+            {
+                "version": 1,
+                "updated_at": now,
+                "name": entity.name,
+                "description": entity.description,
+                "start_date": entity.start_date,
+                "end_date": entity.end_date,
+                "budget": entity.budget,
+                "is_active": entity.is_active,
+            }
+            for entity in entities
+        ]
+        # Core insert: executemany batched into multi-row INSERT ... RETURNING,
+        # with no ORM instances, identity map or per-row refresh.
+        stmt = insert(self.model.__table__).returning(
+            self.model.__table__.c.id, sort_by_parameter_order=True
+        )
+        try:
+            ids = self.db.execute(stmt, rows).scalars().all()
+            self._apply_stats_deltas(
+                (row["start_date"], row["is_active"], 1, row["budget"]) for row in rows
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        for entity, new_id in zip(entities, ids):
+            entity.id = new_id
+            entity.version = 1
+            entity.updated_at = now
+        return entities
+
+    def _version_filters(self, id: Any, expected_versions: Optional[Set[int]]) -> list:
+        filters = [self.model.id == id]
+        if expected_versions is not None:
+            filters.append(self.model.version.in_(expected_versions))
+        return filters
+
+    def update_fields(
+        self,
+        *,
+        id: Any,
+        values: Dict[str, Any],
+        expected_versions: Optional[Set[int]] = None,
+    ) -> Optional[Campaign]:
+        filters = self._version_filters(id, expected_versions)
+        stats_columns = _STATS_COLUMNS & values.keys()
+        toggle = values.keys() == {"is_active"}
+        if toggle:
+            # Rows already in the target state (NULL counting as inactive)
+            # are left untouched, so a returned row was in the other state.
+            filters.append(
+                self.model.is_active.is_not(True)
+                if values["is_active"]
+                else self.model.is_active.is_(True)
+            )
+
+        while True:
+            old = None
+            stmt = (
+                update(self.model)
+                .where(*filters)
+                .values(**values, version=self.model.version + 1, updated_at=utcnow())
+                .returning(*self.model.__table__.c)
+            )
+            if stats_columns and not toggle:
+                # RETURNING only sees the new row: the rollup needs the old
+                # month and budget. The update only applies to the version
+                # read here, so a write committed in between (SQLite ignores
+                # FOR UPDATE) sends us back to read the row again.
+                old = self.db.execute(
+                    select(
+                        self.model.start_date,
+                        self.model.is_active,
+                        self.model.budget,
+                        self.model.version,
+                    ).where(*filters)
+                ).first()
+                if old is None:
+                    return None
+                stmt = stmt.where(self.model.version == old.version)
+            try:
+                new = self.db.execute(stmt).first()
+                if new is None and old is not None:
+                    self.db.rollback()
+                    continue
+                if new is None:
+                    if toggle:
+                        # Nothing to change: hand back the campaign as it is.
+                        return self._to_entity(
+                            self.db.execute(
+                                select(*self.model.__table__.c).where(
+                                    *self._version_filters(id, expected_versions)
+                                )
+                            ).first()
+                        )
+                    return None
+                deltas = []
+                if stats_columns:
+                    if old is None:
+                        deltas.append((new.start_date, not new.is_active, -1, -new.budget))
+                    else:
+                        deltas.append((old.start_date, old.is_active, -1, -old.budget))
+                    deltas.append((new.start_date, new.is_active, 1, new.budget))
+                self._apply_stats_deltas(deltas)
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+            return self._to_entity(new)
+
+    def remove(
+        self, *, id: Any, expected_versions: Optional[Set[int]] = None
+    ) -> Optional[Campaign]:
+        # DELETE ... RETURNING hands back the removed row: no prior SELECT.
+        stmt = (
+            delete(self.model)
+            .where(*self._version_filters(id, expected_versions))
+            .returning(*self.model.__table__.c)
+        )
+        try:
+            old = self.db.execute(stmt).first()
+            if old is not None:
+                self._apply_stats_deltas([(old.start_date, old.is_active, -1, -old.budget)])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return self._to_entity(old)
+
+    def _execute_bulk(
+        self,
+        stmt,
+        *,
+        returning: bool,
+        stats_deltas: Callable[[Any], Iterable[StatsRow]],
+    ) -> Tuple[int, Optional[List[int]]]:
+        # The rollup deltas come from the rows the statement changed, as
+        # RETURNING reports them: rows changed by a concurrent write between
+        # an earlier read and this statement cannot make the rollup drift.
+        stmt = stmt.returning(
+            self.model.id, self.model.start_date, self.model.is_active, self.model.budget
+        )
+        try:
+            rows = self.db.execute(stmt).all()
+            self._apply_stats_deltas(delta for row in rows for delta in stats_deltas(row))
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return len(rows), ([row.id for row in rows] if returning else None)
+
+    def set_active_filtered(
+        self,
+        *,
+        active: bool,
+        ids: Optional[List[int]] = None,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        returning: bool = False,
+    ) -> Tuple[int, Optional[List[int]]]:
+        filters = self._build_filters(
+            is_active=is_active, start_date=start_date, end_date=end_date
+        )
+        if ids is not None:
+            filters.append(self.model.id.in_(ids))
+        # Rows already in the target state (NULL counting as inactive, as in
+        # the rollup) are left untouched and not counted, so every updated
+        # row moves from `not active` to `active`.
+        filters.append(
+            self.model.is_active.is_not(True) if active else self.model.is_active.is_(True)
+        )
+
+        stmt = (
+            update(self.model)
+            .where(*filters)
+            .values(is_active=active, version=self.model.version + 1, updated_at=utcnow())
+        )
+        return self._execute_bulk(
+            stmt,
+            returning=returning,
+            stats_deltas=lambda row: (
+                (row.start_date, not active, -1, -row.budget),
+                (row.start_date, active, 1, row.budget),
+            ),
+        )
+
+    def remove_filtered(
+        self,
+        *,
+        ids: Optional[List[int]] = None,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        returning: bool = False,
+    ) -> Tuple[int, Optional[List[int]]]:
+        filters = self._build_filters(
             is_active=is_active, start_date=start_date, end_date=end_date
         )
+        if ids is not None:
+            filters.append(self.model.id.in_(ids))
+
+        stmt = delete(self.model).where(*filters)
+        return self._execute_bulk(
+            stmt,
+            returning=returning,
+            stats_deltas=lambda row: ((row.start_date, row.is_active, -1, -row.budget),),
+        )
 
-        return query.count()
+    def _grouped_stats(self, filters: list) -> List[StatsRow]:
+        """Live count and budget of the matching campaigns per month and state."""
+        month = month_start(self.model.start_date, self.db.get_bind().dialect.name)
+        is_active = coalesce(self.model.is_active, False)
+        stmt = (
+            select(month, is_active, func.count(), func.sum(self.model.budget))
+            .where(*filters)
+            .group_by(month, is_active)
+        )
+        return [tuple(row) for row in self.db.execute(stmt)]
+
+    def _apply_stats_deltas(self, deltas: Iterable[StatsRow]) -> None:
+        """
+        Adds count/budget deltas to the monthly rollup with one upsert, in the
+        caller's transaction.
+        """
+        merged: Dict[Tuple[date, bool], List[float]] = {}
+        for day, is_active, count, budget in deltas:
+            totals = merged.setdefault((day.replace(day=1), bool(is_active)), [0, 0.0])
+            totals[0] += count
+            totals[1] += budget
+
+        rows = [
+            {
+                "start_month": month,
+                "is_active": is_active,
+                "campaign_count": count,
+                "budget_total": budget,
+            }
+            for (month, is_active), (count, budget) in merged.items()
+            if count or budget
+        ]
+        if not rows:
+            return
+
+        dialect_insert = (
+            postgresql.insert
+            if self.db.get_bind().dialect.name == "postgresql"
+            else sqlite.insert
+        )
+        stats = CampaignMonthlyStats
+        stmt = dialect_insert(stats).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[stats.start_month, stats.is_active],
+            set_={
+                "campaign_count": stats.campaign_count + stmt.excluded.campaign_count,
+                "budget_total": stats.budget_total + stmt.excluded.budget_total,
+            },
+        )
+        self.db.execute(stmt)
+
+    def _on_write(self, old: Optional[Any], new: Optional[Any]) -> None:
+        deltas = []
+        if old is not None:
+            deltas.append((old.start_date, old.is_active, -1, -old.budget))
+        if new is not None:
+            deltas.append((new.start_date, new.is_active, 1, new.budget))
+        self._apply_stats_deltas(deltas)
+
+    def get_monthly_stats(
+        self,
+        *,
+        is_active: Optional[bool] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        search: Optional[str] = None,
+    ) -> List[StatsRow]:
+        if start_date is None and end_date is None and search is None:
+            # The rollup is keyed by (start_month, is_active), so it answers
+            # every other filter combination without touching `campaigns`.
+            stats = CampaignMonthlyStats
+            stmt = select(
+                stats.start_month, stats.is_active, stats.campaign_count, stats.budget_total
+            ).where(stats.campaign_count > 0)
+            if is_active is not None:
+                stmt = stmt.where(stats.is_active == is_active)
+            return [tuple(row) for row in self.db.execute(stmt)]
+
+        return self._grouped_stats(
+            self._build_filters(
+                is_active=is_active, start_date=start_date, end_date=end_date, search=search
+            )
+        )
 
+    def rebuild_stats(self) -> None:
+        try:
+            self.db.execute(delete(CampaignMonthlyStats))
+            self.db.execute(recompute_campaign_stats(self.db.get_bind().dialect.name))
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
 
     def _create_entity_instance(self, db_obj: CampaignModel) -> Campaign:
         return Campaign(
@@ -87,11 +670,14 @@ class CampaignSqlAlchemyRepository(
             end_date=db_obj.end_date,
             budget=db_obj.budget,
             is_active=db_obj.is_active,
+            version=db_obj.version,
+            updated_at=_as_utc(db_obj.updated_at),
+            id=db_obj.id,
         )
 
     def _from_entity(self, entity: Campaign) -> CampaignModel:
         return CampaignModel(
-            id=getattr(entity, "id", None),
+            id=entity.id,
             name=entity.name,
             description=entity.description,
             start_date=entity.start_date,
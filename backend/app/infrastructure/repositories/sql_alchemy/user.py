@@ -25,11 +25,12 @@ class SQLAlchemyUserRepository(
             hashed_password=db_obj.hashed_password,
             is_active=db_obj.is_active,
             is_superuser=db_obj.is_superuser,
+            id=db_obj.id,
         )
 
     def _from_entity(self, entity: User) -> UserModel:
         return UserModel(
-            id=getattr(entity, "id", None),
+            id=entity.id,
             email=entity.email,
             hashed_password=entity.hashed_password,
             is_active=entity.is_active,
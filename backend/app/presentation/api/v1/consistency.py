@@ -0,0 +1,54 @@
+"""
+Read-your-writes over read replicas: a successful write response sets a
+cookie telling how long its client keeps reading from the primary, until
+the replicas have caught up with the write.
+"""
+import math
+import time
+
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+READ_PRIMARY_COOKIE = "read_primary_until"
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+def reads_from_primary(connection: HTTPConnection) -> bool:
+    """True while the client's last write may not have reached the replicas."""
+    try:
+        until = float(connection.cookies.get(READ_PRIMARY_COOKIE, 0))
+    except ValueError:
+        return False
+    return until > time.time()
+
+
+def read_primary_cookie(window: float) -> bytes:
+    """Set-Cookie header value of a write made now."""
+    return (
+        f"{READ_PRIMARY_COOKIE}={time.time() + window:.3f}; Max-Age={math.ceil(window)}; "
+        "Path=/; HttpOnly; SameSite=Lax"
+    ).encode("latin-1")
+
+
+class ReadYourWritesMiddleware:
+    """Sets the read-primary cookie on the successful responses to writes."""
+
+    def __init__(self, app: ASGIApp, window: float | None = None):
+        self.app = app
+        self.window = settings.DATABASE_READ_YOUR_WRITES_SECONDS if window is None else window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in WRITE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = list(message.get("headers", []))
+                headers.append((b"set-cookie", read_primary_cookie(self.window)))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -6,12 +6,14 @@ from jose import JWTError
 from sqlalchemy.orm import Session
 
 from app.application.use_cases.auth.services import AuthService
+from app.application.use_cases.user import services as user_services
 from app.core.security import TokenError, decode_access_token
 from app.domain.entities.user import User as DomainUser
-from app.domain.interfaces.token_repository import ITokenRepository
+from app.domain.interfaces.async_repository import IAsyncRepository
 from app.domain.interfaces.user_repository import IUserRepository
-from app.infrastructure.database.sql_alchemy.session import get_db
 from app.presentation.api.v1.dependencies.repositories import (
+    async_repository,
+    get_async_user_reader,
     get_token_repository,
     get_user_repository,
 )
@@ -33,12 +35,10 @@ revoked_token_exception = HTTPException(
 )
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    users: IAsyncRepository[IUserRepository] = Depends(get_async_user_reader),
 ) -> DomainUser:
-    token_repo = get_token_repository(db)
-    user_repo = get_user_repository(db)
-
     try:
         payload = decode_access_token(token)
         email: str | None = payload.get("sub")
@@ -52,13 +52,23 @@ def get_current_user(
         logger.error(f"Unexpected error during token decode: {e}", exc_info=True)
         raise credentials_exception
 
-    user = user_repo.get_by_email(email=email)
+    user = await users.run(user_services.get_user_by_email, email)
     if user is None:
         raise credentials_exception
     return user
 
-def get_auth_service(
-    user_repo: IUserRepository = Depends(get_user_repository),
-    token_repo: ITokenRepository = Depends(get_token_repository)
-) -> AuthService:
-    return AuthService(user_repo=user_repo, token_repo=token_repo)
\ No newline at end of file
+
+async def get_current_superuser(user: DomainUser = Depends(get_current_user)) -> DomainUser:
+    if not user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough privileges"
+        )
+    return user
+
+def build_auth_service(db: Session) -> AuthService:
+    return AuthService(
+        user_repo=get_user_repository(db), token_repo=get_token_repository(db)
+    )
+
+
+get_async_auth_service = async_repository(build_auth_service)
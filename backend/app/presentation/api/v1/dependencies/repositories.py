@@ -1,19 +1,72 @@
-from fastapi import Depends
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Awaitable, Callable, Generator
+
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.domain.interfaces.async_repository import IAsyncRepository, RepositoryType
 from app.domain.interfaces.campaign_repository import ICampaignRepository
 from app.domain.interfaces.token_repository import ITokenRepository
 from app.domain.interfaces.user_repository import IUserRepository
-from app.infrastructure.database.sql_alchemy.session import get_db
+from app.infrastructure.database.sql_alchemy.async_session import (
+    get_async_db,
+    get_async_read_db,
+)
+from app.infrastructure.database.sql_alchemy.session import get_db, get_read_db
+from app.infrastructure.repositories.cached.campaign import CachedCampaignRepository
+from app.infrastructure.repositories.sql_alchemy.async_repository import (
+    AsyncSessionRepository,
+    ThreadedRepository,
+)
 from app.infrastructure.repositories.sql_alchemy.campaign import (
     CampaignSqlAlchemyRepository,
 )
 from app.infrastructure.repositories.sql_alchemy.token import SQLAlchemyTokenRepository
 from app.infrastructure.repositories.sql_alchemy.user import SQLAlchemyUserRepository
+from app.presentation.api.v1.consistency import reads_from_primary
+
+# `Session.info` key set to False on sessions whose reads must bypass the
+# process-wide campaign caches (see `get_read_session`).
+SHARED_CACHES = "shared_caches"
+
+
+def _reads_share_caches() -> bool:
+    # Replica rows may lag: once cached, they would also answer the reads a
+    # client makes on the primary to see its own writes.
+    return not settings.DATABASE_READ_REPLICA_URLS
+
+
+def get_read_session(request: Request) -> Generator[Session, None, None]:
+    """
+    Session of read-only requests: on a read engine, or on the primary right
+    after a write of the same client (read-your-writes).
+    """
+    sessions = get_db if reads_from_primary(request) else get_read_db
+    with contextmanager(sessions)() as db:
+        db.info[SHARED_CACHES] = _reads_share_caches()
+        yield db
+
+
+async def get_async_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Async counterpart of `get_read_session`."""
+    sessions = get_async_db if reads_from_primary(request) else get_async_read_db
+    async with asynccontextmanager(sessions)() as db:
+        db.info[SHARED_CACHES] = _reads_share_caches()
+        yield db
 
 
 def get_campaign_repository(db: Session = Depends(get_db)) -> ICampaignRepository:
-    return CampaignSqlAlchemyRepository(db)
+    repo = CampaignSqlAlchemyRepository(db)
+    if settings.CAMPAIGN_CACHE_ENABLED and db.info.get(SHARED_CACHES, True):
+        return CachedCampaignRepository(repo)
+    return repo
+
+
+def get_campaign_reader(db: Session = Depends(get_read_session)) -> ICampaignRepository:
+    """Campaign repository of read-only requests (see `get_read_session`)."""
+    return get_campaign_repository(db)
 
 
 def get_user_repository(db: Session = Depends(get_db)) -> IUserRepository:
@@ -22,3 +75,51 @@ def get_user_repository(db: Session = Depends(get_db)) -> IUserRepository:
 
 def get_token_repository(db: Session = Depends(get_db)) -> ITokenRepository:
     return SQLAlchemyTokenRepository(db)
+
+
+AsyncRepositoryDependency = Callable[..., Awaitable[IAsyncRepository[RepositoryType]]]
+
+
+def on_worker_threads(
+    factory: Callable[[Session], RepositoryType],
+    get_session: Callable = get_db,
+) -> AsyncRepositoryDependency:
+    """Dependency running `factory(db)` on a sync session in worker threads."""
+    async def dependency(
+        db: Session = Depends(get_session),
+    ) -> IAsyncRepository[RepositoryType]:
+        return ThreadedRepository(db, factory(db))
+
+    return dependency
+
+
+def on_async_session(
+    factory: Callable[[Session], RepositoryType],
+    get_session: Callable = get_async_db,
+) -> AsyncRepositoryDependency:
+    """Dependency running `factory(db)` on an AsyncSession, on the event loop."""
+    async def dependency(
+        db: AsyncSession = Depends(get_session),
+    ) -> IAsyncRepository[RepositoryType]:
+        return AsyncSessionRepository(db, factory)
+
+    return dependency
+
+
+def async_repository(
+    factory: Callable[[Session], RepositoryType],
+    read_only: bool = False,
+) -> AsyncRepositoryDependency:
+    """
+    Async access to `factory(db)`, on an AsyncSession when DATABASE_ASYNC is
+    set. `read_only` dependencies use read sessions (see `get_read_session`).
+    """
+    if settings.DATABASE_ASYNC:
+        return on_async_session(factory, get_async_read_session if read_only else get_async_db)
+    return on_worker_threads(factory, get_read_session if read_only else get_db)
+
+
+get_async_campaign_repository = async_repository(get_campaign_repository)
+get_async_campaign_reader = async_repository(get_campaign_repository, read_only=True)
+get_async_user_repository = async_repository(get_user_repository)
+get_async_user_reader = async_repository(get_user_repository, read_only=True)
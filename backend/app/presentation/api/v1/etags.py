@@ -0,0 +1,99 @@
+"""HTTP validators (ETag / Last-Modified) and conditional request helpers."""
+import hashlib
+import re
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Set
+
+from fastapi import Request
+
+_ETAG = re.compile(r'\s*((?:W/)?"[^"]*")\s*(?:,|$)')
+_CAMPAIGN_ETAG = re.compile(r'^"campaign-(\d+)-v(\d+)"$')
+
+
+def campaign_etag(campaign_id: int, version: int) -> str:
+    """Strong ETag of one campaign: it changes with every row version."""
+    return f'"campaign-{campaign_id}-v{version}"'
+
+
+def list_etag(body: bytes, *parts: Any) -> str:
+    """Weak ETag of a list page, derived from its request `parts` and its body."""
+    digest = hashlib.sha256(repr(parts).encode("utf-8"))
+    digest.update(body)
+    return f'W/"{digest.hexdigest()[:32]}"'
+
+
+def parse_etags(header: Optional[str]) -> Optional[List[str]]:
+    """Parses an If-Match / If-None-Match value; ["*"] for the wildcard."""
+    if header is None:
+        return None
+    if header.strip() == "*":
+        return ["*"]
+    return _ETAG.findall(header)
+
+
+def _opaque(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def none_match(request: Request, etag: str) -> Optional[bool]:
+    """
+    Evaluates If-None-Match with the weak comparison (RFC 9110 13.1.2).
+    Returns None when the header is absent, else whether `etag` matched.
+    """
+    tags = parse_etags(request.headers.get("if-none-match"))
+    if tags is None:
+        return None
+    return "*" in tags or _opaque(etag) in {_opaque(tag) for tag in tags}
+
+
+def not_modified(
+    request: Request, etag: str, last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    True if a GET can be answered with 304. If-None-Match takes precedence;
+    If-Modified-Since is only consulted without it.
+    """
+    matched = none_match(request, etag)
+    if matched is not None:
+        return matched
+
+    since = request.headers.get("if-modified-since")
+    if since is None or last_modified is None:
+        return False
+    try:
+        since_date = parsedate_to_datetime(since)
+    except (TypeError, ValueError):
+        return False
+    if since_date.tzinfo is None:
+        since_date = since_date.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since_date
+
+
+def is_conditional(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def matched_versions(header: Optional[str], campaign_id: int) -> Optional[Set[int]]:
+    """
+    Turns an If-Match value into the campaign versions it accepts. None means
+    no precondition (header absent or "*"). Weak tags never match If-Match.
+    """
+    tags = parse_etags(header)
+    if tags is None or "*" in tags:
+        return None
+    versions = set()
+    for tag in tags:
+        match = _CAMPAIGN_ETAG.match(tag)
+        if match and int(match.group(1)) == campaign_id:
+            versions.add(int(match.group(2)))
+    return versions
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    return headers
@@ -1,18 +1,29 @@
+import asyncio
 from datetime import date, timedelta
 import logging
-from contextlib import asynccontextmanager
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Iterator
 
+from anyio import to_thread
 from fastapi import FastAPI
-from faker import Faker
 from app.application.schemas.campaign import CampaignCreate
 from app.application.use_cases.campaign.services import create_campaign
+from app.core.config import settings
 from app.domain.interfaces.campaign_repository import ICampaignRepository
 from app.infrastructure.database.sql_alchemy.init_db import init_db
-from app.infrastructure.database.sql_alchemy.models.base import Base
 from app.infrastructure.database.sql_alchemy.models.campaign import Campaign  # noqa: F401
 from app.infrastructure.database.sql_alchemy.models.user import User  # noqa: F401
 from app.infrastructure.database.sql_alchemy.models.token import RefreshTokenModel   # noqa: F401
+from app.infrastructure.database.sql_alchemy.async_session import (
+    dispose_async_engine,
+    warm_up_async_engines,
+)
+from app.infrastructure.database.sql_alchemy.bootstrap import bootstrap_lock
+from app.infrastructure.database.sql_alchemy.pool import warm_up
+from app.infrastructure.database.sql_alchemy.schema import ensure_schema
 from app.infrastructure.database.sql_alchemy.session import SessionLocal, engine
+from app.infrastructure.database.sql_alchemy.sqlite import is_sqlite_file, optimize
 from app.presentation.api.v1.dependencies.repositories import get_campaign_repository
 from app.application.schemas.campaign import CampaignCreate
 
@@ -22,33 +33,97 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Application starting up...")
+    # GET /ready answers 503 until the startup below has completed.
+    app.state.ready = False
+    timings = app.state.startup_timings = {}
+    started = time.perf_counter()
+    # The database pool is sized after this limit (see DB_POOL_SIZE).
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREAD_POOL_SIZE
 
-    try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created or already exist.")
-    except Exception as e:
-        logger.error(f"Error creating tables: {e}")
-        raise
-    try:
-        with SessionLocal() as db:
-            init_db(db)
-        logger.info("Database initialization complete.")
-    except Exception as e:
-        logger.error(f"Error initializing database: {e}")
-        raise
-
-    repo = get_campaign_repository(SessionLocal())
-
-    if repo.count_filtered() == 0:
-        create_campaign_fixtures(repo)
-        logger.info("Campaign fixtures created.")
+    bootstrap_database(timings)
+    with startup_phase(timings, "warm_up"):
+        # Each worker process fills its own pools (see `pool._dispose_after_fork`).
+        await to_thread.run_sync(warm_up, settings.DB_POOL_WARMUP_CONNECTIONS)
+        if settings.DATABASE_ASYNC:
+            await warm_up_async_engines(settings.DB_POOL_WARMUP_CONNECTIONS)
+
+    optimizer = None
+    if settings.SQLITE_OPTIMIZE_INTERVAL_SECONDS > 0 and is_sqlite_file(settings.DATABASE_URL):
+        optimizer = asyncio.create_task(
+            optimize_periodically(settings.SQLITE_OPTIMIZE_INTERVAL_SECONDS)
+        )
+
+    timings["total"] = time.perf_counter() - started
+    logger.info("Application started in %.3f s", timings["total"])
+    app.state.ready = True
 
     yield
 
+    app.state.ready = False
     logger.info("Application shutting down...")
+    if optimizer is not None:
+        optimizer.cancel()
+        # SQLite advises a last run before closing long-lived connections.
+        await to_thread.run_sync(optimize, engine)
+    await dispose_async_engine()
+
+
+@contextmanager
+def startup_phase(timings: Dict[str, float], name: str) -> Iterator[None]:
+    """Times a startup phase into `timings` (reported by GET /ready) and logs it."""
+    started = time.perf_counter()
+    yield
+    timings[name] = time.perf_counter() - started
+    logger.info("Startup phase %s took %.3f s", name, timings[name])
+
+
+def bootstrap_database(timings: Dict[str, float]) -> None:
+    """
+    Creates the tables, the first superuser and, with SEED_DEMO_DATA, the
+    campaign fixtures when missing. Worker processes starting together take
+    turns (see `bootstrap_lock`): the first one does the work, the next ones
+    find it done.
+    """
+    with bootstrap_lock(engine):
+        with startup_phase(timings, "schema"):
+            try:
+                if ensure_schema(engine):
+                    logger.info("Database tables created or already exist.")
+            except Exception as e:
+                logger.error(f"Error creating tables: {e}")
+                raise
+        with startup_phase(timings, "init_db"):
+            try:
+                with SessionLocal() as db:
+                    init_db(db)
+                logger.info("Database initialization complete.")
+            except Exception as e:
+                logger.error(f"Error initializing database: {e}")
+                raise
+
+        if not settings.SEED_DEMO_DATA:
+            return
+        with startup_phase(timings, "seed_demo_data"), SessionLocal() as db:
+            repo = get_campaign_repository(db)
+            if repo.count_filtered() == 0:
+                create_campaign_fixtures(repo)
+                logger.info("Campaign fixtures created.")
+
+
+async def optimize_periodically(interval: float) -> None:
+    """Runs `PRAGMA optimize` on the primary engine every `interval` seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await to_thread.run_sync(optimize, engine)
+        except Exception as e:
+            logger.error(f"Error optimizing the database: {e}")
 
 
 def create_campaign_fixtures(repo: ICampaignRepository, count: int = 50):
+    # Development only: Faker is not imported by the serving path.
+    from faker import Faker  # pylint: disable=import-outside-toplevel
+
     fake = Faker()
     today = date.today()
     
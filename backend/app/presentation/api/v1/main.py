@@ -6,9 +6,12 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.config import settings
+from app.core.logger_config import setup_logging
+from app.presentation.api.v1.consistency import ReadYourWritesMiddleware
 from app.presentation.api.v1.lifespan import lifespan
-from app.presentation.api.v1.routes import auth, campaign, user
+from app.presentation.api.v1.routes import auth, campaign, metrics, user
 
+setup_logging()
 logger = logging.getLogger(__name__)
 
 app = FastAPI(lifespan=lifespan)
@@ -45,6 +48,7 @@ app.include_router(
     campaign.router, prefix=f"{api_prefix}/campaigns", tags=["Campaigns"]
 )
 app.include_router(auth.router, prefix=f"{api_prefix}/auth", tags=["Authentication"])
+app.include_router(metrics.router, prefix=f"{api_prefix}/metrics", tags=["Metrics"])
 
 app.add_middleware(
     CORSMiddleware,
@@ -54,9 +58,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.DATABASE_READ_REPLICA_URLS:
+    app.add_middleware(ReadYourWritesMiddleware)
+
 logger.info("Fast Api router initialized")
 
 
 @app.get("/")
 def read_root():
     return {"message": "Welcome to the DDD-style FastAPI ad campaign management 🚀"}
+
+
+@app.get("/ready")
+def read_readiness(request: Request):
+    """Readiness probe: 503 until the application startup has completed."""
+    if not getattr(request.app.state, "ready", False):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content={"status": "starting"}
+        )
+    return {"status": "ready", "startup_seconds": request.app.state.startup_timings}
@@ -0,0 +1,112 @@
+"""
+JSON encoding and content-coding for responses built from domain entities
+and plain data.
+"""
+import gzip
+from typing import Any, Dict, Optional
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:  # Listed in requirements.txt; pydantic-core encodes when it is missing.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:  # Optional: zstd is only offered when zstandard is installed.
+    import zstandard
+except ImportError:
+    zstandard = None
+
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encodes dicts, lists, dataclasses, dates and pydantic models to compact
+    JSON, formatted like pydantic's `model_dump_json`.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+    return pydantic_core.to_json(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse encoded with `dumps`. Meant for content whose shape already
+    matches the response model (e.g. slotted domain entities mirroring their
+    read schema): it is serialized once, without building the model.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+def supported_encodings() -> tuple:
+    """Content-codings `compress` can produce, most preferred first."""
+    return ("zstd", "gzip") if zstandard is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Picks the content-coding of a response from an Accept-Encoding value
+    (RFC 9110 12.5.3): the supported coding with the highest q-value, ties
+    going to the preferred one. None means identity.
+    """
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        weight = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding.strip().lower()] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for coding in supported_encodings():
+        weight = weights.get(coding, wildcard)
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    Compresses `body` with one of `supported_encodings`. The gzip output
+    does not embed a timestamp, so equal bodies give equal bytes.
+    """
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+    raise ValueError(f"Unsupported content-coding: {encoding}")
+
+
+def encoded_response(
+    body: bytes, encoding: Optional[str], headers: Dict[str, str]
+) -> FastJSONResponse:
+    """
+    JSON response for an already encoded body, compressed with `encoding`
+    unless it is None. The body varies with Accept-Encoding either way.
+    """
+    headers = {**headers, "Vary": "Accept-Encoding"}
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return FastJSONResponse(body, headers=headers)
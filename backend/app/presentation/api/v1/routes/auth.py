@@ -10,7 +10,8 @@ from app.application.use_cases.auth.services import (
     AuthorizationError,
 )
 
-from app.presentation.api.v1.dependencies.auth import get_auth_service
+from app.domain.interfaces.async_repository import IAsyncRepository
+from app.presentation.api.v1.dependencies.auth import get_async_auth_service
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +23,13 @@ class LoginRequest(BaseModel):
 
 
 @router.post("/login", response_model=TokenResponseSchema)
-def login(
+async def login(
     credentials: LoginRequest,
-    auth_service: AuthService = Depends(get_auth_service)
+    auth_service: IAsyncRepository[AuthService] = Depends(get_async_auth_service)
 ):
     try:
-        tokens = auth_service.login_user(
-            email=credentials.email, password=credentials.password
+        tokens = await auth_service.run(
+            AuthService.login_user, email=credentials.email, password=credentials.password
         )
         return tokens
     except AuthenticationError as e:
@@ -47,13 +48,13 @@ def login(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error during login.")
 
 @router.post("/refresh", response_model=TokenResponseSchema)
-def refresh_token(
+async def refresh_token(
     request: RefreshTokenRequest,
-    auth_service: AuthService = Depends(get_auth_service) # Inject service
+    auth_service: IAsyncRepository[AuthService] = Depends(get_async_auth_service)
 ):
     try:
-        new_tokens = auth_service.refresh_access_token(
-            refresh_token_value=request.refresh_token
+        new_tokens = await auth_service.run(
+            AuthService.refresh_access_token, refresh_token_value=request.refresh_token
         )
         return new_tokens
     except AuthenticationError as e:
@@ -70,10 +71,12 @@ def refresh_token(
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 async def logout(
     request: RefreshTokenRequest,
-    auth_service: AuthService = Depends(get_auth_service)
+    auth_service: IAsyncRepository[AuthService] = Depends(get_async_auth_service)
 ):
     try:
-        auth_service.logout_user(refresh_token_value=request.refresh_token)
+        await auth_service.run(
+            AuthService.logout_user, refresh_token_value=request.refresh_token
+        )
     except Exception as e:
          logger.error(f"Unexpected logout error: {e}", exc_info=True)
          raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal server error during logout.")
@@ -1,80 +1,422 @@
 from datetime import date
-from typing import List, Optional
+from typing import Any, Awaitable, Callable, Iterator, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException
+from anyio import from_thread
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 
-from app.application.schemas.campaign import Campaign, CampaignCreate, CampaignUpdate
+from app.application.schemas.campaign import (
+    Campaign,
+    CampaignBulkCreateResult,
+    CampaignBulkMutationResult,
+    CampaignCreate,
+    CampaignFileFormat,
+    CampaignImportResult,
+    CampaignSelection,
+    CampaignStats,
+    CampaignUpdate,
+)
 from app.application.use_cases.campaign import services as campaign_services
-from app.application.schemas.paginated_response import PaginatedResponse
+from app.application.use_cases.campaign.services import (
+    InvalidFieldsError,
+    PreconditionFailedError,
+)
+from app.application.schemas.paginated_response import PaginatedResponse, TotalMode
+from app.core.config import settings
+from app.core.pagination import CursorError
+from app.domain.entities.campaign import Campaign as DomainCampaign
 from app.domain.entities.user import User as DomainUser
-from app.domain.interfaces.campaign_repository import ICampaignRepository
-from app.presentation.api.v1.dependencies.auth import get_current_user
-from app.presentation.api.v1.dependencies.repositories import get_campaign_repository
+from app.domain.interfaces.async_repository import IAsyncRepository
+from app.domain.interfaces.campaign_repository import CampaignOrder, ICampaignRepository
+from app.presentation.api.v1.dependencies.auth import get_current_superuser, get_current_user
+from app.presentation.api.v1 import etags, responses
+from app.presentation.api.v1.responses import FastJSONResponse
+from app.presentation.api.v1.dependencies.repositories import (
+    get_async_campaign_reader,
+    get_async_campaign_repository,
+    get_campaign_reader,
+    get_campaign_repository,
+)
 
 router = APIRouter()
 
 
+def _parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    try:
+        return campaign_services.parse_fields(fields)
+    except InvalidFieldsError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _encoded_page(
+    repo: ICampaignRepository,
+    not_modified: Callable[[str], Optional[bool]],
+    encoding: Optional[str],
+    **query: Any,
+) -> Tuple[Optional[bytes], str, Optional[str]]:
+    """
+    Encodes a list page, compressed with `encoding` when it is large enough.
+    Returns the body (None when `not_modified(etag)`), its ETag and the
+    content-coding used (None for identity).
+    """
+    def render() -> Tuple[bytes, str]:
+        try:
+            page = campaign_services.get_campaigns(repo, **query)
+        except CursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        # Entities mirror the Campaign schema and partial items are a subset
+        # of it: both are encoded once, as they are, without building models.
+        body = responses.dumps(page)
+        # The ETag is derived from the page itself: no separate pass over
+        # the matching rows, which the page statement has already counted.
+        return body, etags.list_etag(body, *query.values())
+
+    # First pages take most of the traffic: their bodies, plain and
+    # compressed, are cached as bytes under the request (and data generation).
+    def cached(variant: Optional[str], load):
+        if query["skip"] or query["cursor"]:
+            return load()
+        return campaign_services.get_cached_response(repo, (*query.values(), variant), load)
+
+    body, etag = cached(None, render)
+    if not_modified(etag):
+        return None, etag, None
+    if encoding is None or len(body) < settings.RESPONSE_COMPRESSION_MIN_SIZE:
+        return body, etag, None
+    return cached(encoding, lambda: responses.compress(body, encoding)), etag, encoding
+
+
 @router.get("/", response_model=PaginatedResponse[Campaign])
-def list_campaigns(
+async def list_campaigns(
+    request: Request,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(100, ge=1),
     is_active: Optional[bool] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    repo: ICampaignRepository = Depends(get_campaign_repository),
+    q: Optional[str] = Query(None, max_length=200),
+    sort: Optional[CampaignOrder] = None,
+    cursor: Optional[str] = None,
+    total: TotalMode = "exact",
+    fields: Optional[str] = None,
+    campaigns: IAsyncRepository[ICampaignRepository] = Depends(get_async_campaign_reader),
     _: DomainUser = Depends(get_current_user),
 ):
-    return campaign_services.get_campaigns(
-        repo,
+    body, etag, encoding = await campaigns.run(
+        _encoded_page,
+        lambda etag: etags.none_match(request, etag),
+        responses.negotiate_encoding(request.headers.get("accept-encoding")),
         skip=skip,
         limit=limit,
         is_active=is_active,
         start_date=start_date,
         end_date=end_date,
+        search=q,
+        sort=sort,
+        cursor=cursor,
+        total_mode=total,
+        fields=_parse_fields(fields),
+    )
+    headers = {**etags.validator_headers(etag), "Vary": "Accept-Encoding"}
+    if body is None:
+        return Response(status_code=304, headers=headers)
+    return responses.encoded_response(body, encoding, headers)
+
+
+@router.get("/stats", response_model=CampaignStats)
+async def get_campaign_stats(
+    is_active: Optional[bool] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    q: Optional[str] = Query(None, max_length=200),
+    campaigns: IAsyncRepository[ICampaignRepository] = Depends(get_async_campaign_reader),
+    _: DomainUser = Depends(get_current_user),
+):
+    return await campaigns.run(
+        campaign_services.get_campaign_stats,
+        is_active=is_active,
+        start_date=start_date,
+        end_date=end_date,
+        search=q,
+    )
+
+
+@router.post("/stats/rebuild", response_model=CampaignStats)
+async def rebuild_campaign_stats(
+    campaigns: IAsyncRepository[ICampaignRepository] = Depends(get_async_campaign_repository),
+    _: DomainUser = Depends(get_current_superuser),
+):
+    return await campaigns.run(campaign_services.rebuild_campaign_stats)
+
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+@router.get("/export")
+def export_campaigns(
+    export_format: CampaignFileFormat = Query("ndjson", alias="format"),
+    is_active: Optional[bool] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    q: Optional[str] = Query(None, max_length=200),
+    repo: ICampaignRepository = Depends(get_campaign_reader),
+    _: DomainUser = Depends(get_current_user),
+):
+    # The chunks are read while the response streams, on `repo`'s session:
+    # FastAPI (pinned in requirements.txt) closes yield dependencies only
+    # once the response has been sent.
+    chunks = campaign_services.export_campaigns(
+        repo,
+        export_format=export_format,
+        is_active=is_active,
+        start_date=start_date,
+        end_date=end_date,
+        search=q,
+        batch_size=settings.CAMPAIGN_EXPORT_BATCH_SIZE,
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="campaigns.{export_format}"'
+        },
     )
 
 
 @router.get("/{campaign_id}", response_model=Campaign)
-def get_campaign(
+async def get_campaign(
     campaign_id: int,
-    repo: ICampaignRepository = Depends(get_campaign_repository),
+    request: Request,
+    fields: Optional[str] = None,
+    campaigns: IAsyncRepository[ICampaignRepository] = Depends(get_async_campaign_reader),
     _: DomainUser = Depends(get_current_user),
 ):
-    campaign = campaign_services.get_campaign(repo, campaign_id)
+    selected = _parse_fields(fields)
+    if etags.is_conditional(request):
+        # Probe the version only: a match is answered without loading the row.
+        current = await campaigns.run(campaign_services.get_campaign_version, campaign_id)
+        if current is None:
+            raise HTTPException(status_code=404, detail="Campaign not found")
+        version, updated_at = current
+        etag = etags.campaign_etag(campaign_id, version)
+        if etags.not_modified(request, etag, updated_at):
+            return Response(status_code=304, headers=etags.validator_headers(etag, updated_at))
+
+    if selected is not None:
+        partial = await campaigns.run(
+            campaign_services.get_campaign_fields,
+            campaign_id,
+            tuple(dict.fromkeys(selected + ("version", "updated_at"))),
+        )
+        if partial is None:
+            raise HTTPException(status_code=404, detail="Campaign not found")
+        headers = etags.validator_headers(
+            etags.campaign_etag(campaign_id, partial["version"]), partial["updated_at"]
+        )
+        content = {field: partial[field] for field in selected}
+        return FastJSONResponse(content, headers=headers)
+
+    campaign = await campaigns.run(campaign_services.get_campaign, campaign_id)
     if campaign is None:
         raise HTTPException(status_code=404, detail="Campaign not found")
-    return campaign
+    return FastJSONResponse(
+        campaign,
+        headers=etags.validator_headers(
+            etags.campaign_etag(campaign.id, campaign.version), campaign.updated_at
+        ),
+    )
 
 
 @router.post("/", response_model=Campaign, status_code=201)
-def create_campaign(
+async def create_campaign(
     campaign_in: CampaignCreate,
-    repo: ICampaignRepository = Depends(get_campaign_repository),
+    campaigns: IAsyncRepository[ICampaignRepository] = Depends(get_async_campaign_repository),
     _: DomainUser = Depends(get_current_user),
 ):
-    return campaign_services.create_campaign(repo, campaign_in)
+    return await campaigns.run(campaign_services.create_campaign, campaign_in)
 
 
-@router.put("/{campaign_id}", response_model=Campaign)
-def update_campaign(
-    campaign_id: int,
-    campaign_in: CampaignUpdate,
+@router.post("/bulk", response_model=CampaignBulkCreateResult)
+async def create_campaigns_bulk(
+    payloads: List[Any] = Body(...),
+    chunk_size: Optional[int] = Query(None, ge=1),
+    campaigns: IAsyncRepository[ICampaignRepository] = Depends(get_async_campaign_repository),
+    _: DomainUser = Depends(get_current_user),
+):
+    return await campaigns.run(
+        campaign_services.create_campaigns,
+        payloads,
+        chunk_size=chunk_size or settings.CAMPAIGN_BULK_CHUNK_SIZE,
+    )
+
+
+def _iter_body(request: Request) -> Iterator[bytes]:
+    """
+    Reads the request body chunk by chunk from a worker thread, so sync
+    services can consume an upload without it being buffered in memory.
+    """
+    stream = request.stream()
+
+    async def receive() -> Optional[bytes]:
+        return await anext(stream, None)
+
+    while (chunk := from_thread.run(receive)) is not None:
+        yield chunk
+
+
+@router.post("/import", response_model=CampaignImportResult)
+async def import_campaigns(
+    request: Request,
+    import_format: CampaignFileFormat = Query("ndjson", alias="format"),
+    batch_size: Optional[int] = Query(None, ge=1),
     repo: ICampaignRepository = Depends(get_campaign_repository),
     _: DomainUser = Depends(get_current_user),
 ):
-    updated = campaign_services.update_campaign(repo, campaign_id, campaign_in)
+    return await run_in_threadpool(
+        campaign_services.import_campaigns,
+        repo,
+        _iter_body(request),
+        file_format=import_format,
+        batch_size=batch_size or settings.CAMPAIGN_BULK_CHUNK_SIZE,
+        max_errors=settings.CAMPAIGN_IMPORT_MAX_ERRORS,
+    )
+
+
+@router.post("/bulk/activate", response_model=CampaignBulkMutationResult)
+async def activate_campaigns_bulk(
+    selection: CampaignSelection,
+    return_ids: bool = False,
+    campaigns: IAsyncRepository[ICampaignRepository] = Depends(get_async_campaign_repository),
+    _: DomainUser = Depends(get_current_user),
+):
+    return await campaigns.run(
+        campaign_services.set_campaigns_active,
+        selection,
+        active=True,
+        return_ids=return_ids,
+    )
+
+
+@router.post("/bulk/deactivate", response_model=CampaignBulkMutationResult)
+async def deactivate_campaigns_bulk(
+    selection: CampaignSelection,
+    return_ids: bool = False,
+    campaigns: IAsyncRepository[ICampaignRepository] = Depends(get_async_campaign_repository),
+    _: DomainUser = Depends(get_current_user),
+):
+    return await campaigns.run(
+        campaign_services.set_campaigns_active,
+        selection,
+        active=False,
+        return_ids=return_ids,
+    )
+
+
+@router.post("/bulk/delete", response_model=CampaignBulkMutationResult)
+async def delete_campaigns_bulk(
+    selection: CampaignSelection,
+    return_ids: bool = False,
+    campaigns: IAsyncRepository[ICampaignRepository] = Depends(get_async_campaign_repository),
+    _: DomainUser = Depends(get_current_user),
+):
+    return await campaigns.run(
+        campaign_services.delete_campaigns, selection, return_ids=return_ids
+    )
+
+
+async def _updated_campaign(
+    response: Response, write: Awaitable[Optional[DomainCampaign]]
+) -> DomainCampaign:
+    """Awaits a single-campaign write and maps its outcome to HTTP."""
+    try:
+        updated = await write
+    except PreconditionFailedError as e:
+        raise HTTPException(status_code=412, detail=str(e))
     if updated is None:
         raise HTTPException(status_code=404, detail="Campaign not found")
+    response.headers.update(
+        etags.validator_headers(
+            etags.campaign_etag(updated.id, updated.version), updated.updated_at
+        )
+    )
     return updated
 
 
+@router.put("/{campaign_id}", response_model=Campaign)
+@router.patch("/{campaign_id}", response_model=Campaign)
+async def update_campaign(
+    campaign_id: int,
+    campaign_in: CampaignUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    campaigns: IAsyncRepository[ICampaignRepository] = Depends(get_async_campaign_repository),
+    _: DomainUser = Depends(get_current_user),
+):
+    return await _updated_campaign(
+        response,
+        campaigns.run(
+            campaign_services.update_campaign,
+            campaign_id,
+            campaign_in,
+            etags.matched_versions(if_match, campaign_id),
+        ),
+    )
+
+
+@router.post("/{campaign_id}/activate", response_model=Campaign)
+async def activate_campaign(
+    campaign_id: int,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    campaigns: IAsyncRepository[ICampaignRepository] = Depends(get_async_campaign_repository),
+    _: DomainUser = Depends(get_current_user),
+):
+    return await _updated_campaign(
+        response,
+        campaigns.run(
+            campaign_services.set_campaign_active,
+            campaign_id,
+            True,
+            etags.matched_versions(if_match, campaign_id),
+        ),
+    )
+
+
+@router.post("/{campaign_id}/deactivate", response_model=Campaign)
+async def deactivate_campaign(
+    campaign_id: int,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    campaigns: IAsyncRepository[ICampaignRepository] = Depends(get_async_campaign_repository),
+    _: DomainUser = Depends(get_current_user),
+):
+    return await _updated_campaign(
+        response,
+        campaigns.run(
+            campaign_services.set_campaign_active,
+            campaign_id,
+            False,
+            etags.matched_versions(if_match, campaign_id),
+        ),
+    )
+
+
 @router.delete("/{campaign_id}", response_model=Campaign)
-def delete_campaign(
+async def delete_campaign(
     campaign_id: int,
-    repo: ICampaignRepository = Depends(get_campaign_repository),
+    if_match: Optional[str] = Header(None),
+    campaigns: IAsyncRepository[ICampaignRepository] = Depends(get_async_campaign_repository),
     _: DomainUser = Depends(get_current_user),
 ):
-    deleted = campaign_services.delete_campaign(repo, campaign_id)
+    try:
+        deleted = await campaigns.run(
+            campaign_services.delete_campaign,
+            campaign_id,
+            etags.matched_versions(if_match, campaign_id),
+        )
+    except PreconditionFailedError as e:
+        raise HTTPException(status_code=412, detail=str(e))
     if deleted is None:
         raise HTTPException(status_code=404, detail="Campaign not found")
     return deleted
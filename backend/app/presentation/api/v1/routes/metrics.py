@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+
+from app.application.use_cases.campaign.services import (
+    campaign_list_cache,
+    campaign_response_cache,
+)
+from app.domain.entities.user import User as DomainUser
+from app.infrastructure.database.sql_alchemy.pool import pool_stats
+from app.infrastructure.repositories.cached.campaign import campaign_cache
+from app.presentation.api.v1.dependencies.auth import get_current_superuser
+
+router = APIRouter()
+
+
+@router.get("/cache")
+def get_cache_metrics(_: DomainUser = Depends(get_current_superuser)):
+    return {
+        "campaigns": campaign_cache.stats(),
+        "campaign_lists": {
+            **campaign_list_cache.stats(),
+            "top_keys": campaign_list_cache.key_stats(),
+        },
+        "campaign_responses": campaign_response_cache.stats(),
+    }
+
+
+@router.get("/pool")
+def get_pool_metrics(_: DomainUser = Depends(get_current_superuser)):
+    return pool_stats()
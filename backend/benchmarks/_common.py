@@ -0,0 +1,103 @@
+"""
+Shared helpers for the backend benchmark scripts.
+
+Benchmarks are plain scripts, run from the `backend` directory, e.g.:
+
+    python -m benchmarks.bench_keyset_pagination --rows 200000
+"""
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Callable
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("AUTH_SECRET_KEY", "benchmark-secret-key")
+
+# pylint: disable=wrong-import-position
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+
+from app.infrastructure.database.sql_alchemy.models.base import Base
+from app.infrastructure.database.sql_alchemy.models.campaign import Campaign
+
+
+def make_engine(path: str | None = None) -> Engine:
+    """Creates a file-backed SQLite engine with the full schema."""
+    if path is None:
+        fd, path = tempfile.mkstemp(prefix="bench_", suffix=".db")
+        os.close(fd)
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def vocabulary(size: int = 5_000, *, seed: int = 7) -> list:
+    """Returns `size` distinct pronounceable pseudo-words."""
+    rng = random.Random(seed)
+    syllables = [c + v for c in "bcdfghklmnprstvz" for v in "aeiou"]
+    words: set = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def campaign_rows(
+    count: int,
+    *,
+    seed: int = 42,
+    description_size: int = 40,
+    chronological: bool = False,
+    words: list | None = None,
+):
+    """
+    Yields `count` random campaign rows as dictionaries. With `chronological`,
+    start dates grow with insertion order, like a table that accumulated
+    campaigns over ten years. With `words`, names and descriptions are made
+    of random words from that list instead of filler.
+    """
+    rng = random.Random(seed)
+    origin = date(2015, 1, 1)
+    filler = "x" * description_size
+    for i in range(count):
+        offset = i * 3650 // count if chronological else rng.randint(0, 3650)
+        start = origin + timedelta(days=offset)
+        if words:
+            name = " ".join(rng.choices(words, k=2)).title() + f" #{i}"
+            description = " ".join(rng.choices(words, k=8))
+        else:
+            name = f"Advertiser {rng.randint(0, count)} #{i}"
+            description = filler
+        yield {
+            "name": name,
+            "description": description,
+            "start_date": start,
+            "end_date": start + timedelta(days=rng.randint(1, 90)),
+            "budget": round(rng.uniform(100, 100_000), 2),
+            "is_active": rng.random() < 0.7,
+        }
+
+
+def populate(engine: Engine, count: int, *, batch: int = 20_000, **kwargs) -> None:
+    """Bulk-loads `count` campaigns using executemany batches."""
+    rows = []
+    with engine.begin() as conn:
+        for row in campaign_rows(count, **kwargs):
+            rows.append(row)
+            if len(rows) == batch:
+                conn.execute(insert(Campaign), rows)
+                rows = []
+        if rows:
+            conn.execute(insert(Campaign), rows)
+
+
+def timeit(fn: Callable[[], object], *, repeat: int = 7) -> float:
+    """Returns the median wall time of `fn` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
@@ -0,0 +1,78 @@
+"""
+Compares the campaign date-overlap filter with and without the R*Tree index.
+
+The plain plan evaluates `start_date <= end AND end_date >= start` through a
+single-column B-tree (or a scan); the R*Tree plan resolves the overlap in the
+`campaigns_date_rtree` virtual table first. Both the list page and the count
+that GET /campaigns/ runs are timed.
+
+    python -m benchmarks.bench_date_rtree --rows 1000000
+"""
+import argparse
+from datetime import date, timedelta
+
+from benchmarks._common import make_engine, populate, timeit
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.infrastructure.repositories.sql_alchemy.campaign import (
+    CampaignSqlAlchemyRepository,
+)
+
+WINDOWS = {
+    "1 day": 1,
+    "1 week": 7,
+    "1 month": 30,
+    "3 months": 91,
+    "1 year": 365,
+    "5 years": 5 * 365,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=25)
+    parser.add_argument(
+        "--chronological",
+        action="store_true",
+        help="make ids grow with start_date, as in a table filled over time",
+    )
+    args = parser.parse_args()
+
+    engine = make_engine()
+    populate(engine, args.rows, chronological=args.chronological)
+    window_start = date(2019, 6, 1)
+
+    with Session(engine) as db:
+        repo = CampaignSqlAlchemyRepository(db)
+        print(f"{args.rows} rows (median ms)")
+        print(
+            f"{'window':<10}{'matches':>10}{'page plain':>12}{'page rtree':>12}"
+            f"{'count plain':>13}{'count rtree':>13}"
+        )
+        for label, days in WINDOWS.items():
+            window = {
+                "start_date": window_start,
+                "end_date": window_start + timedelta(days=days - 1),
+            }
+            results = {}
+            for mode, max_days in (("plain", 0), ("rtree", days + 1)):
+                settings.CAMPAIGN_DATE_RTREE_MAX_WINDOW_DAYS = max_days
+                results[f"page {mode}"] = timeit(
+                    lambda: repo.get_multi_filtered(limit=args.limit, **window), repeat=5
+                )
+                results[f"count {mode}"] = timeit(
+                    lambda: repo.count_filtered(**window), repeat=5
+                )
+                db.expunge_all()
+            matches = repo.count_filtered(**window)
+            print(
+                f"{label:<10}{matches:>10}{results['page plain']:>12.2f}"
+                f"{results['page rtree']:>12.2f}{results['count plain']:>13.2f}"
+                f"{results['count rtree']:>13.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Measures the peak RSS of exporting the campaign table.
+
+Each measurement runs in a fresh subprocess so `ru_maxrss` only reflects one
+export:
+
+* stream: `export_campaigns` (yield_per batches, one encoded chunk in memory).
+* materialize: the list path, `get_multi_filtered` over the whole table then
+  one JSON document (skipped above --materialize-max rows).
+
+    python -m benchmarks.bench_export_memory --rows 10000 100000 1000000 5000000
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks._common import make_engine, populate
+from sqlalchemy.orm import Session
+
+from app.application.schemas.campaign import Campaign as CampaignSchema
+from app.application.use_cases.campaign import services as campaign_services
+from app.core.config import settings
+from app.infrastructure.repositories.sql_alchemy.campaign import (
+    CampaignSqlAlchemyRepository,
+)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process (Linux reports KiB)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def child(path: str, mode: str, export_format: str) -> None:
+    """Runs one export against the database at `path` and prints its stats."""
+    engine = make_engine(path)
+    baseline = peak_rss_mb()
+    started = time.perf_counter()
+    written = 0
+    with Session(engine) as db:
+        repo = CampaignSqlAlchemyRepository(db)
+        if mode == "stream":
+            for chunk in campaign_services.export_campaigns(
+                repo,
+                export_format=export_format,
+                batch_size=settings.CAMPAIGN_EXPORT_BATCH_SIZE,
+            ):
+                written += len(chunk)
+        else:
+            campaigns = repo.get_multi_filtered(skip=0, limit=sys.maxsize)
+            items = [CampaignSchema.model_validate(c).model_dump(mode="json") for c in campaigns]
+            written = len(json.dumps(items).encode("utf-8"))
+    print(
+        json.dumps(
+            {
+                "baseline_mb": baseline,
+                "peak_mb": peak_rss_mb(),
+                "seconds": time.perf_counter() - started,
+                "bytes": written,
+            }
+        )
+    )
+
+
+def measure(path: str, mode: str, export_format: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_export_memory",
+         "--child", path, mode, export_format],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--format", dest="export_format", default="ndjson",
+                        choices=["ndjson", "csv"])
+    parser.add_argument("--materialize-max", type=int, default=1_000_000)
+    parser.add_argument("--child", nargs=3, metavar=("DB", "MODE", "FORMAT"))
+    args = parser.parse_args()
+
+    if args.child:
+        child(*args.child)
+        return
+
+    print(f"format={args.export_format}, batch={settings.CAMPAIGN_EXPORT_BATCH_SIZE}")
+    print(f"{'rows':>10}{'mode':>13}{'base MB':>10}{'peak MB':>10}{'delta MB':>10}"
+          f"{'seconds':>10}{'out MB':>10}")
+    for rows in args.rows:
+        fd, path = tempfile.mkstemp(prefix="bench_export_", suffix=".db")
+        os.close(fd)
+        try:
+            populate(make_engine(path), rows)
+            modes = ["stream"] + (["materialize"] if rows <= args.materialize_max else [])
+            for mode in modes:
+                stats = measure(path, mode, args.export_format)
+                print(
+                    f"{rows:>10}{mode:>13}{stats['baseline_mb']:>10.1f}"
+                    f"{stats['peak_mb']:>10.1f}"
+                    f"{stats['peak_mb'] - stats['baseline_mb']:>10.1f}"
+                    f"{stats['seconds']:>10.2f}{stats['bytes'] / 2**20:>10.1f}"
+                )
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
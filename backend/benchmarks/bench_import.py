@@ -0,0 +1,91 @@
+"""
+Compares campaign ingest rates (rows/s) on a fresh SQLite file:
+
+* loop: `create_campaign` per row, as `create_campaign_fixtures` does at
+  startup (one validation, INSERT and COMMIT per campaign).
+* ndjson / csv: `import_campaigns` over a generated upload, fed in 64 KiB
+  chunks the way POST /campaigns/import reads the request body.
+
+    python -m benchmarks.bench_import --rows 200000 --loop-rows 20000
+"""
+import argparse
+import csv
+import io
+import json
+import time
+from typing import Iterator
+
+from benchmarks._common import campaign_rows, make_engine
+from sqlalchemy.orm import Session
+
+from app.application.schemas.campaign import CampaignCreate
+from app.application.use_cases.campaign import services as campaign_services
+from app.core.config import settings
+from app.infrastructure.repositories.sql_alchemy.campaign import (
+    CampaignSqlAlchemyRepository,
+)
+
+CHUNK_SIZE = 64 * 1024
+
+
+def upload(rows: int, file_format: str) -> Iterator[bytes]:
+    """Yields an NDJSON or CSV file of `rows` campaigns in CHUNK_SIZE pieces."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    fields = ["name", "description", "start_date", "end_date", "budget", "is_active"]
+    if file_format == "csv":
+        writer.writerow(fields)
+    for row in campaign_rows(rows):
+        if file_format == "csv":
+            writer.writerow([row[field] for field in fields])
+        else:
+            buffer.write(json.dumps(row, default=str) + "\n")
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+
+def run(label: str, rows: int, fn) -> None:
+    engine = make_engine()
+    with Session(engine) as db:
+        repo = CampaignSqlAlchemyRepository(db)
+        started = time.perf_counter()
+        created = fn(repo)
+        elapsed = time.perf_counter() - started
+    print(f"{label:<10}{rows:>10}{created:>10}{elapsed:>10.2f}{rows / elapsed:>12.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--loop-rows", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=settings.CAMPAIGN_BULK_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    def loop(repo) -> int:
+        for row in campaign_rows(args.loop_rows):
+            campaign_services.create_campaign(repo, CampaignCreate(**row))
+        return args.loop_rows
+
+    def importer(file_format: str):
+        def _import(repo) -> int:
+            return campaign_services.import_campaigns(
+                repo,
+                upload(args.rows, file_format),
+                file_format=file_format,
+                batch_size=args.batch_size,
+                max_errors=settings.CAMPAIGN_IMPORT_MAX_ERRORS,
+            )["created"]
+        return _import
+
+    print(f"batch_size={args.batch_size}")
+    print(f"{'strategy':<10}{'rows':>10}{'created':>10}{'seconds':>10}{'rows/s':>12}")
+    run("loop", args.loop_rows, loop)
+    run("ndjson", args.rows, importer("ndjson"))
+    run("csv", args.rows, importer("csv"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compares OFFSET pagination with keyset (cursor) pagination on GET /campaigns.
+
+Offset pages get slower the deeper they are, because the database reads and
+discards every preceding row; keyset pages seek straight to (sort_key, id).
+
+    python -m benchmarks.bench_keyset_pagination --rows 200000 --limit 10
+"""
+import argparse
+
+from benchmarks._common import make_engine, populate, timeit
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.sql_alchemy.models.campaign import Campaign
+from app.infrastructure.repositories.sql_alchemy.campaign import (
+    CampaignSqlAlchemyRepository,
+)
+
+PAGES = (1, 10, 100, 1_000, 10_000)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--sort", default="start_date")
+    args = parser.parse_args()
+
+    engine = make_engine()
+    populate(engine, args.rows)
+
+    with Session(engine) as db:
+        repo = CampaignSqlAlchemyRepository(db)
+        sort_column = getattr(Campaign, args.sort)
+
+        print(f"{args.rows} rows, limit={args.limit}, sort={args.sort}")
+        print(f"{'page':>8} {'offset ms':>12} {'keyset ms':>12}")
+        for page in PAGES:
+            skip = (page - 1) * args.limit
+            if skip >= args.rows:
+                break
+
+            after = None
+            if skip:
+                # Key of the last row of the previous page, as a cursor would carry it.
+                after = tuple(
+                    db.query(sort_column, Campaign.id)
+                    .order_by(sort_column, Campaign.id)
+                    .offset(skip - 1)
+                    .limit(1)
+                    .one()
+                )
+
+            offset_ms = timeit(
+                lambda skip=skip: repo.get_multi_filtered(
+                    skip=skip, limit=args.limit, sort=args.sort
+                )
+            )
+            keyset_ms = timeit(
+                lambda after=after: repo.get_multi_filtered(
+                    limit=args.limit, sort=args.sort, after=after
+                )
+            )
+            db.expunge_all()
+            print(f"{page:>8} {offset_ms:>12.3f} {keyset_ms:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Load test of the GET /campaigns/ page cache.
+
+Simulates `--seconds` seconds of dashboard polling at several request rates,
+with `--writes` campaign updates per second going through the repository. Each
+request runs `get_campaigns` in its own session, cycling over a few dashboard
+queries. SQL statements are counted on the engine, with and without the list
+cache:
+
+    python -m benchmarks.bench_list_cache --rows 100000 --rates 1 10 100 1000
+"""
+import argparse
+import itertools
+import time
+from unittest.mock import patch
+
+from benchmarks._common import make_engine, populate
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.application.use_cases.campaign import services as campaign_services
+from app.core.config import settings
+from app.infrastructure.repositories.cached.campaign import CachedCampaignRepository
+from app.infrastructure.repositories.sql_alchemy.campaign import (
+    CampaignSqlAlchemyRepository,
+)
+
+QUERIES = [
+    {"is_active": True, "skip": 0, "limit": 10},
+    {"is_active": False, "skip": 0, "limit": 10},
+    {"skip": 0, "limit": 25, "sort": "budget"},
+    {"skip": 25, "limit": 25, "sort": "budget"},
+]
+
+
+def simulate(engine, *, rate: int, seconds: int, writes: int, cached: bool) -> dict:
+    statements = itertools.count()
+    listener = lambda *_args: next(statements)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    queries = itertools.cycle(QUERIES)
+    started = time.perf_counter()
+    try:
+        with patch.object(settings, "CAMPAIGN_LIST_CACHE_ENABLED", cached):
+            for second in range(seconds):
+                for write in range(writes):
+                    with Session(engine) as db:
+                        repo = CachedCampaignRepository(CampaignSqlAlchemyRepository(db))
+                        campaign = repo.get(second * writes + write + 1)
+                        campaign.budget += 1
+                        repo.update(id=campaign.id, entity=campaign)
+                for _ in range(rate):
+                    with Session(engine) as db:
+                        repo = CachedCampaignRepository(CampaignSqlAlchemyRepository(db))
+                        campaign_services.get_campaigns(repo, **next(queries))
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    elapsed = time.perf_counter() - started
+    total = next(statements)
+    return {
+        "db_per_s": total / seconds,
+        "db_per_request": total / (rate * seconds),
+        "ms_per_request": elapsed * 1000 / (rate * seconds),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--rates", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--seconds", type=int, default=10)
+    parser.add_argument("--writes", type=int, default=1)
+    args = parser.parse_args()
+
+    engine = make_engine()
+    populate(engine, args.rows)
+
+    print(f"{args.rows} rows, {args.writes} write(s)/s over {args.seconds}s")
+    print(f"{'req/s':>8}{'cache':>7}{'db stmt/s':>12}{'stmt/req':>10}{'ms/req':>10}")
+    for rate in args.rates:
+        for cached in (False, True):
+            campaign_services.campaign_list_cache.clear()
+            result = simulate(
+                engine, rate=rate, seconds=args.seconds, writes=args.writes, cached=cached
+            )
+            print(f"{rate:>8}{'on' if cached else 'off':>7}{result['db_per_s']:>12.1f}"
+                  f"{result['db_per_request']:>10.2f}{result['ms_per_request']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
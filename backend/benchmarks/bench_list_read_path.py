@@ -0,0 +1,83 @@
+"""
+Compares the two ways of reading a page of campaigns into response schemas:
+
+* orm: `Session.query(Campaign)` (identity map, ORM instances and their
+  instance state), `_to_entity`, then `Campaign.model_validate`.
+* core: `get_multi_filtered`, a Core `select()` of the plain columns whose
+  rows are mapped straight to entities, then `Campaign.model_validate`.
+
+Reports rows/s (median of several runs), the allocations still alive once
+a page is read and the peak traced memory while reading it (tracemalloc).
+
+    python -m benchmarks.bench_list_read_path --rows 20000 --pages 100 1000 10000
+"""
+import argparse
+import tracemalloc
+
+from benchmarks._common import make_engine, populate, timeit
+from sqlalchemy.orm import Session
+
+from app.application.schemas.campaign import Campaign as CampaignSchema
+from app.infrastructure.database.sql_alchemy.models.campaign import Campaign
+from app.infrastructure.repositories.sql_alchemy.campaign import (
+    CampaignSqlAlchemyRepository,
+)
+
+
+def allocations(fn) -> tuple:
+    """Live allocations held by the result of `fn`, and the peak KiB during the call."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = fn()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = sum(
+        stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0
+    )
+    del result
+    return count, peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--pages", type=int, nargs="+", default=[100, 1_000, 10_000])
+    args = parser.parse_args()
+
+    engine = make_engine()
+    populate(engine, args.rows)
+
+    print(f"rows={args.rows}")
+    print(f"{'page':>7}{'path':>6}{'ms':>10}{'rows/s':>12}{'allocs':>10}{'peak KiB':>10}")
+    for page in args.pages:
+        def orm():
+            # A fresh session per call, as a request would get.
+            with Session(engine) as db:
+                repo = CampaignSqlAlchemyRepository(db)
+                objs = db.query(Campaign).order_by(Campaign.id).limit(page).all()
+                return [
+                    CampaignSchema.model_validate(repo._to_entity(obj))  # pylint: disable=protected-access
+                    for obj in objs
+                ]
+
+        def core():
+            with Session(engine) as db:
+                repo = CampaignSqlAlchemyRepository(db)
+                return [
+                    CampaignSchema.model_validate(campaign)
+                    for campaign in repo.get_multi_filtered(limit=page)
+                ]
+
+        for label, fn in (("orm", orm), ("core", core)):
+            assert len(fn()) == min(page, args.rows)
+            ms = timeit(fn)
+            count, kib = allocations(fn)
+            print(
+                f"{page:>7}{label:>6}{ms:>10.2f}{page / ms * 1000:>12.0f}"
+                f"{count:>10}{kib:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
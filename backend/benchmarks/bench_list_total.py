@@ -0,0 +1,94 @@
+"""
+Compares the ways GET /campaigns can produce a page plus its total.
+
+* two-query: the former path, a page query followed by `Query.count()`
+  (which wraps the whole filtered SELECT in a subselect).
+* window: the page query with an extra `COUNT(*) OVER ()` column.
+* fused: `get_multi_filtered_with_total`, a one-row count LEFT JOINed to the
+  page in a single statement (used for `total=exact`).
+* estimate: the page plus a count capped at CAMPAIGN_COUNT_ESTIMATE_CAP.
+* none: the page only (`total=none`).
+
+    python -m benchmarks.bench_list_total --rows 1000000
+"""
+import argparse
+from datetime import date
+
+from benchmarks._common import make_engine, populate, timeit
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.infrastructure.repositories.sql_alchemy.campaign import (
+    CampaignSqlAlchemyRepository,
+)
+
+FILTERS = {
+    "unfiltered": {},
+    "is_active": {"is_active": True},
+    "date window": {"start_date": date(2020, 1, 1), "end_date": date(2020, 3, 31)},
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=25)
+    parser.add_argument("--skip", type=int, default=0)
+    args = parser.parse_args()
+
+    engine = make_engine()
+    populate(engine, args.rows)
+
+    with Session(engine) as db:
+        repo = CampaignSqlAlchemyRepository(db)
+
+        def two_query(**filters):
+            query = repo._build_filtered_query(**filters)  # pylint: disable=protected-access
+            query.order_by(repo.model.id).offset(args.skip).limit(args.limit).all()
+            return query.count()
+
+        def window(**filters):
+            query = repo._build_filtered_query(**filters)  # pylint: disable=protected-access
+            return (
+                query.add_columns(func.count().over())
+                .order_by(repo.model.id)
+                .offset(args.skip)
+                .limit(args.limit)
+                .all()
+            )
+
+        def fused(**filters):
+            return repo.get_multi_filtered_with_total(
+                skip=args.skip, limit=args.limit, **filters
+            )
+
+        def estimate(**filters):
+            repo.get_multi_filtered(skip=args.skip, limit=args.limit, **filters)
+            return repo.count_filtered(
+                **filters, max_count=settings.CAMPAIGN_COUNT_ESTIMATE_CAP
+            )
+
+        def page_only(**filters):
+            return repo.get_multi_filtered(skip=args.skip, limit=args.limit, **filters)
+
+        strategies = {
+            "two-query": two_query,
+            "window": window,
+            "fused": fused,
+            "estimate": estimate,
+            "none": page_only,
+        }
+
+        print(f"{args.rows} rows, limit={args.limit}, skip={args.skip} (median ms)")
+        print(f"{'filter':<14}" + "".join(f"{name:>12}" for name in strategies))
+        for label, filters in FILTERS.items():
+            timings = []
+            for strategy in strategies.values():
+                timings.append(timeit(lambda s=strategy: s(**filters), repeat=5))
+                db.expunge_all()
+            print(f"{label:<14}" + "".join(f"{ms:>12.2f}" for ms in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+CPU profile of encoding a GET /campaigns/ page (service call excluded):
+
+* model: FastAPI's response_model path, as the route used to take it:
+  validate the page into PaginatedResponse[Campaign] (one model per item),
+  then `dump_json` it to bytes.
+* direct: `FastJSONResponse`, which encodes the entities once as they are
+  (orjson when installed, pydantic-core otherwise).
+
+Prints the CPU time per page for each page size, then the cProfile top
+functions of both paths for the last size.
+
+    python -m benchmarks.bench_response_encoding --limits 20 100 1000
+"""
+import argparse
+import asyncio
+import cProfile
+import io
+import pstats
+import time
+
+from benchmarks._common import make_engine, populate
+from fastapi.routing import APIRoute, serialize_response
+from sqlalchemy.orm import Session
+
+from app.application.use_cases.campaign import services as campaign_services
+from app.infrastructure.repositories.sql_alchemy.campaign import (
+    CampaignSqlAlchemyRepository,
+)
+from app.presentation.api.v1.responses import FastJSONResponse, orjson
+from app.presentation.api.v1.routes.campaign import router
+
+LIST_ROUTE = next(
+    route for route in router.routes
+    if isinstance(route, APIRoute) and route.name == "list_campaigns"
+)
+LOOP = asyncio.new_event_loop()
+
+
+def model_path(page) -> bytes:
+    return LOOP.run_until_complete(
+        serialize_response(
+            field=LIST_ROUTE.response_field, response_content=page, dump_json=True
+        )
+    )
+
+
+def direct_path(page) -> bytes:
+    return FastJSONResponse(page).body
+
+
+def cpu_ms(fn, page, repeat: int) -> float:
+    started = time.process_time()
+    for _ in range(repeat):
+        fn(page)
+    return (time.process_time() - started) * 1000 / repeat
+
+
+def profile(fn, page, repeat: int) -> str:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in range(repeat):
+        fn(page)
+    profiler.disable()
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("tottime").print_stats(6)
+    return out.getvalue()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000)
+    parser.add_argument("--limits", type=int, nargs="+", default=[20, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=300)
+    args = parser.parse_args()
+
+    engine = make_engine()
+    populate(engine, args.rows)
+
+    print(f"encoder={'orjson' if orjson is not None else 'pydantic-core'}")
+    print(f"{'limit':>6}{'model ms':>10}{'direct ms':>11}{'speedup':>9}")
+    with Session(engine) as db:
+        repo = CampaignSqlAlchemyRepository(db)
+        for limit in args.limits:
+            page = campaign_services.get_campaigns(repo, limit=limit)
+            assert len(model_path(page)) == len(direct_path(page))
+            model = cpu_ms(model_path, page, args.repeat)
+            direct = cpu_ms(direct_path, page, args.repeat)
+            print(f"{limit:>6}{model:>10.3f}{direct:>11.3f}{model / direct:>8.1f}x")
+
+    for label, fn in (("model", model_path), ("direct", direct_path)):
+        print(f"\n--- {label} (limit={args.limits[-1]}, {args.repeat} pages) ---")
+        print(profile(fn, page, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
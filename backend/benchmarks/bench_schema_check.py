@@ -0,0 +1,57 @@
+"""
+Cost of the schema step of a warm boot (tables already created):
+
+* create_all: `Base.metadata.create_all`, which checks every table (and the
+  campaign virtual tables and triggers) through the database.
+* fingerprint: `ensure_schema`, which reads the stored schema fingerprint.
+
+Reports the statements each sends and its median time, with
+`--latency-ms` added to each statement as the round trip to a remote
+database.
+
+    python -m benchmarks.bench_schema_check --latency-ms 0 1 5
+"""
+import argparse
+import time
+
+from benchmarks._common import make_engine, timeit
+from sqlalchemy import event
+
+from app.infrastructure.database.sql_alchemy.models.base import Base
+from app.infrastructure.database.sql_alchemy.schema import ensure_schema
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=21)
+    parser.add_argument("--latency-ms", type=float, nargs="+", default=[0, 1, 5])
+    args = parser.parse_args()
+
+    engine = make_engine()
+    ensure_schema(engine)
+    statements = []
+    latency = [0.0]
+
+    def round_trip(*_args) -> None:
+        statements.append(1)
+        if latency[0]:
+            time.sleep(latency[0])
+
+    event.listen(engine, "before_cursor_execute", round_trip)
+
+    print(f"{'latency':>8}{'step':>13}{'statements':>12}{'ms':>9}")
+    for latency_ms in args.latency_ms:
+        latency[0] = latency_ms / 1000
+        for label, fn in (
+            ("create_all", lambda: Base.metadata.create_all(bind=engine)),
+            ("fingerprint", lambda: ensure_schema(engine)),
+        ):
+            statements.clear()
+            fn()
+            count = len(statements)
+            ms = timeit(fn, repeat=args.repeat)
+            print(f"{latency_ms:>8.0f}{label:>13}{count:>12}{ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
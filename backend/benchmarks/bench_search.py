@@ -0,0 +1,56 @@
+"""
+Compares campaign text search strategies over name and description:
+
+* like: the portable fallback, `LIKE '%term%'` on both columns (full scan).
+* fts: the FTS5 index, prefix terms (what `GET /campaigns/?q=` uses on SQLite).
+
+For each query it times the match count and the first page of 25, sorted by
+relevance for FTS and by id for LIKE.
+
+    python -m benchmarks.bench_search --rows 1000000
+"""
+import argparse
+from unittest.mock import patch
+
+from benchmarks._common import make_engine, populate, timeit, vocabulary
+from sqlalchemy.orm import Session
+
+from app.infrastructure.repositories.sql_alchemy.campaign import (
+    CampaignSqlAlchemyRepository,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=25)
+    args = parser.parse_args()
+
+    words = vocabulary()
+    engine = make_engine()
+    populate(engine, args.rows, words=words)
+    queries = [words[100], words[2000][:3], f"{words[10]} {words[20]}"]
+
+    with Session(engine) as db:
+        repo = CampaignSqlAlchemyRepository(db)
+
+        def page(search: str, sort: str):
+            return repo.get_multi_filtered(limit=args.limit, search=search, sort=sort)
+
+        print(f"{args.rows} rows, limit={args.limit} (median ms)")
+        print(f"{'query':<24}{'matches':>10}{'like count':>12}{'like page':>12}"
+              f"{'fts count':>12}{'fts page':>12}")
+        for search in queries:
+            matches = repo.count_filtered(search=search)
+            fts_count = timeit(lambda s=search: repo.count_filtered(search=s), repeat=5)
+            fts_page = timeit(lambda s=search: page(s, "relevance"), repeat=5)
+            with patch.object(CampaignSqlAlchemyRepository, "_use_fts", return_value=False):
+                like_count = timeit(lambda s=search: repo.count_filtered(search=s), repeat=3)
+                like_page = timeit(lambda s=search: page(s, "id"), repeat=3)
+            db.expunge_all()
+            print(f"{search!r:<24}{matches:>10}{like_count:>12.2f}{like_page:>12.2f}"
+                  f"{fts_count:>12.2f}{fts_page:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
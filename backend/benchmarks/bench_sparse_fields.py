@@ -0,0 +1,62 @@
+"""
+Compares full and sparse (`fields=`) campaign list pages on rows with large
+descriptions: payload size and median latency of the service call plus the
+response encoding each path uses.
+
+* full: every column, Campaign entities validated into
+  PaginatedResponse[Campaign], as the response model does.
+* sparse: `fields=id,name,start_date,end_date,budget,is_active`, column
+  select into dictionaries encoded by pydantic-core, as the route does.
+
+    python -m benchmarks.bench_sparse_fields --rows 50000 --description-size 4096
+"""
+import argparse
+
+from benchmarks._common import make_engine, populate, timeit
+from pydantic_core import to_json
+from sqlalchemy.orm import Session
+
+from app.application.schemas.campaign import Campaign as CampaignSchema
+from app.application.schemas.paginated_response import PaginatedResponse
+from app.application.use_cases.campaign import services as campaign_services
+from app.infrastructure.repositories.sql_alchemy.campaign import (
+    CampaignSqlAlchemyRepository,
+)
+
+TABLE_FIELDS = "id,name,start_date,end_date,budget,is_active"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--description-size", type=int, default=4096)
+    parser.add_argument("--limits", type=int, nargs="+", default=[20, 100, 1000])
+    args = parser.parse_args()
+
+    engine = make_engine()
+    populate(engine, args.rows, description_size=args.description_size)
+    fields = campaign_services.parse_fields(TABLE_FIELDS)
+    response_model = PaginatedResponse[CampaignSchema]
+
+    print(f"rows={args.rows}, description={args.description_size} B")
+    print(f"{'limit':>6}{'mode':>8}{'bytes':>12}{'ms':>10}")
+    with Session(engine) as db:
+        repo = CampaignSqlAlchemyRepository(db)
+        for limit in args.limits:
+            def full():
+                page = campaign_services.get_campaigns(repo, limit=limit, skip=limit)
+                return response_model.model_validate(page).model_dump_json().encode("utf-8")
+
+            def sparse():
+                page = campaign_services.get_campaigns(
+                    repo, limit=limit, skip=limit, fields=fields
+                )
+                return to_json(page)
+
+            for mode, fn in (("full", full), ("sparse", sparse)):
+                size = len(fn())
+                print(f"{limit:>6}{mode:>8}{size:>12}{timeit(fn):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
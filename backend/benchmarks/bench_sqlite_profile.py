@@ -0,0 +1,122 @@
+"""
+Mixed read/write load on a SQLite file, with and without the SQLite profile:
+
+* default: rollback journal, driver defaults, one engine for everything.
+* profile: WAL and the SQLITE_* pragmas (`apply_sqlite_profile`), reads on
+  a second, read-only engine (`read_only_url`), as the API now runs.
+
+`--readers` threads read list pages and single campaigns, while `--writers`
+threads update campaign budgets, one transaction per update, for
+`--seconds`. Reports reads/s, writes/s and the read p50/p99 latencies.
+
+    python -m benchmarks.bench_sqlite_profile --readers 8 --writers 2 --seconds 10
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+
+from benchmarks._common import make_engine, populate
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+
+from app.infrastructure.database.sql_alchemy.models.campaign import Campaign
+from app.infrastructure.database.sql_alchemy.sqlite import (
+    apply_sqlite_profile,
+    read_only_url,
+)
+from app.infrastructure.repositories.sql_alchemy.campaign import (
+    CampaignSqlAlchemyRepository,
+)
+
+
+def engines(path: str, profile: bool, threads: int):
+    url = f"sqlite:///{path}"
+    options = {"connect_args": {"check_same_thread": False}, "pool_size": threads}
+    engine = create_engine(url, **options)
+    if not profile:
+        return engine, engine
+    apply_sqlite_profile(engine)
+    reader = create_engine(read_only_url(url), **options)
+    apply_sqlite_profile(reader, read_only=True)
+    return engine, reader
+
+
+def run(engine, reader, rows: int, readers: int, writers: int, seconds: float) -> dict:
+    latencies, writes = [], []
+    deadline = time.perf_counter() + seconds
+
+    def read(seed: int) -> None:
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            with Session(reader) as db:
+                repo = CampaignSqlAlchemyRepository(db)
+                if rng.random() < 0.5:
+                    repo.get(rng.randint(1, rows))
+                else:
+                    repo.get_multi_filtered(skip=rng.randint(0, 1000), limit=20)
+            latencies.append(time.perf_counter() - started)
+
+    def write(seed: int) -> None:
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            with Session(engine) as db:
+                db.execute(
+                    update(Campaign)
+                    .where(Campaign.id == rng.randint(1, rows))
+                    .values(budget=round(rng.uniform(100, 100_000), 2))
+                )
+                db.commit()
+            writes.append(1)
+
+    threads = [threading.Thread(target=read, args=(i,)) for i in range(readers)]
+    threads += [threading.Thread(target=write, args=(-i - 1,)) for i in range(writers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "reads": len(latencies) / elapsed,
+        "writes": len(writes) / elapsed,
+        "p50": quantiles[49] * 1000,
+        "p99": quantiles[98] * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    print(f"rows={args.rows}, readers={args.readers}, writers={args.writers}")
+    print(f"{'mode':>8}{'reads/s':>10}{'writes/s':>10}{'p50 ms':>9}{'p99 ms':>9}")
+    for mode, profile in (("default", False), ("profile", True)):
+        fd, path = tempfile.mkstemp(prefix="bench_sqlite_", suffix=".db")
+        os.close(fd)
+        populate(make_engine(path), args.rows)
+        engine, reader = engines(path, profile, args.readers + args.writers)
+        result = run(engine, reader, args.rows, args.readers, args.writers, args.seconds)
+        print(
+            f"{mode:>8}{result['reads']:>10.0f}{result['writes']:>10.0f}"
+            f"{result['p50']:>9.2f}{result['p99']:>9.2f}"
+        )
+        engine.dispose()
+        reader.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Times GET /campaigns/stats aggregates as the campaign table grows:
+
+* rollup: `get_campaign_stats` unfiltered, read from campaign_monthly_stats.
+* rollup is_active: filtered on state, still served by the rollup.
+* live: the same aggregates grouped over `campaigns` (what date filters and
+  searches fall back to), here with a window covering every campaign.
+* rebuild: the full recompute of the rollup.
+
+    python -m benchmarks.bench_stats --rows 10000 100000 1000000
+"""
+import argparse
+from datetime import date
+
+from benchmarks._common import make_engine, populate, timeit
+from sqlalchemy.orm import Session
+
+from app.application.use_cases.campaign import services as campaign_services
+from app.infrastructure.repositories.sql_alchemy.campaign import (
+    CampaignSqlAlchemyRepository,
+)
+
+EVERYTHING = {"start_date": date(2000, 1, 1), "end_date": date(2100, 1, 1)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>10}{'rollup':>12}{'is_active':>12}{'live':>12}{'rebuild':>12}  (median ms)")
+    for rows in args.rows:
+        engine = make_engine()
+        populate(engine, rows)
+        with Session(engine) as db:
+            repo = CampaignSqlAlchemyRepository(db)
+            # populate() bypasses the repository, so fill the rollup once.
+            repo.rebuild_stats()
+            timings = [
+                timeit(lambda: campaign_services.get_campaign_stats(repo)),
+                timeit(lambda: campaign_services.get_campaign_stats(repo, is_active=True)),
+                timeit(lambda: campaign_services.get_campaign_stats(repo, **EVERYTHING), repeat=3),
+                timeit(repo.rebuild_stats, repeat=3),
+            ]
+            assert campaign_services.get_campaign_stats(repo)["count"] == rows
+        print(f"{rows:>10}" + "".join(f"{ms:>12.2f}" for ms in timings))
+
+
+if __name__ == "__main__":
+    main()
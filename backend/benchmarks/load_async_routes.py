@@ -0,0 +1,156 @@
+"""
+Load test of the API served on sync sessions in worker threads (default)
+and on AsyncSession repositories (DATABASE_ASYNC=true).
+
+Each mode starts uvicorn on a populated SQLite file, with the in-process
+caches off so every request reaches the database. Then `--clients`
+concurrent clients send GET /campaigns/{id} and GET /campaigns/?limit=20
+requests for `--seconds`. Reports requests/s, p50/p99 latency and errors.
+
+    python -m benchmarks.load_async_routes --clients 500 --seconds 20
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+from benchmarks._common import make_engine, populate
+
+EMAIL, PASSWORD = "load@example.com", "load-password"
+# The app's logging setup would log every client request.
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+def start_server(db_path: str, port: int, use_async: bool) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{db_path}",
+        "DATABASE_ASYNC": "true" if use_async else "false",
+        "LOG_LEVEL": "WARNING",
+        "CAMPAIGN_CACHE_ENABLED": "false",
+        "CAMPAIGN_LIST_CACHE_ENABLED": "false",
+        "FIRST_SUPERUSER_EMAIL": EMAIL,
+        "FIRST_SUPERUSER_PASSWORD": PASSWORD,
+    }
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.presentation.api.v1.main:app",
+            "--port", str(port), "--log-level", "warning", "--no-access-log",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_ready(base_url: str) -> str:
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        for _ in range(200):
+            try:
+                response = await client.post(
+                    "/api/v1/auth/login", json={"email": EMAIL, "password": PASSWORD}
+                )
+                if response.status_code == 200:
+                    return response.json()["access_token"]
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+
+async def fetch(reader, writer, request: bytes) -> int:
+    """Sends one keep-alive GET and reads the response; returns its status."""
+    writer.write(request)
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in head.split(b"\r\n")[1:]:
+        name, _, value = line.partition(b":")
+        if name.lower() == b"content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return int(head.split(b" ", 2)[1])
+
+
+async def load(port: int, token: str, rows: int, clients: int, seconds: float) -> dict:
+    """
+    Runs `clients` keep-alive connections. A bare asyncio client keeps the
+    load generator's own CPU use low next to the server's.
+    """
+    latencies, errors = [], 0
+    deadline = time.perf_counter() + seconds
+    headers = f"Host: 127.0.0.1\r\nAuthorization: Bearer {token}\r\n\r\n"
+
+    async def worker(seed: int) -> None:
+        nonlocal errors
+        rng = random.Random(seed)
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            while time.perf_counter() < deadline:
+                if rng.random() < 0.5:
+                    path = f"/api/v1/campaigns/{rng.randint(1, rows)}"
+                else:
+                    path = f"/api/v1/campaigns/?limit=20&skip={rng.randint(0, 1000)}"
+                started = time.perf_counter()
+                status = await fetch(
+                    reader, writer, f"GET {path} HTTP/1.1\r\n{headers}".encode()
+                )
+                if status == 200:
+                    latencies.append(time.perf_counter() - started)
+                else:
+                    errors += 1
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(seed) for seed in range(clients)))
+    elapsed = time.perf_counter() - started
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": quantiles[49] * 1000,
+        "p99": quantiles[98] * 1000,
+        "errors": errors,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    fd, db_path = tempfile.mkstemp(prefix="load_", suffix=".db")
+    os.close(fd)
+    populate(make_engine(db_path), args.rows)
+
+    print(f"rows={args.rows}, clients={args.clients}, {args.seconds:.0f} s per mode")
+    print(f"{'mode':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for mode, use_async in (("threads", False), ("async", True)):
+        server = start_server(db_path, args.port, use_async)
+        try:
+            token = asyncio.run(wait_ready(f"http://127.0.0.1:{args.port}"))
+            result = asyncio.run(
+                load(args.port, token, args.rows, args.clients, args.seconds)
+            )
+        finally:
+            server.terminate()
+            server.wait()
+        print(
+            f"{mode:>8}{result['rps']:>10.0f}{result['p50']:>10.1f}"
+            f"{result['p99']:>10.1f}{result['errors']:>8}"
+        )
+    os.remove(db_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.application.use_cases.campaign import services as campaign_services
+from app.domain.interfaces.campaign_repository import ICampaignRepository
+
+
+@pytest.fixture
+def mock_campaign_repo():
+    """Fixture for a mocked ICampaignRepository."""
+    return MagicMock(spec=ICampaignRepository)
+
+
+def _payload(name: str, **overrides) -> dict:
+    return {
+        "name": name,
+        "description": None,
+        "start_date": "2024-01-01",
+        "end_date": "2024-01-31",
+        "budget": 100,
+        **overrides,
+    }
+
+
+def _assign_ids(entities):
+    for entity in entities:
+        entity.id = hash(entity.name) % 10_000
+    return entities
+
+
+def test_create_campaigns_reports_invalid_items(mock_campaign_repo):
+    """Invalid payloads are reported by index and the rest are created."""
+    mock_campaign_repo.create_many.side_effect = lambda entities: _assign_ids(entities)
+    payloads = [_payload("A"), _payload("B", budget=-1), "not an object", _payload("C")]
+
+    result = campaign_services.create_campaigns(
+        mock_campaign_repo, payloads, chunk_size=10
+    )
+
+    assert result["created"] == 2
+    assert [error["index"] for error in result["errors"]] == [1, 2]
+    mock_campaign_repo.create_many.assert_called_once()
+
+
+def test_create_campaigns_isolates_failed_chunks(mock_campaign_repo):
+    """A chunk that fails to insert is reported without aborting the others."""
+    calls = []
+
+    def _create_many(entities):
+        calls.append([entity.name for entity in entities])
+        if len(calls) == 2:
+            raise RuntimeError("disk full")
+        return _assign_ids(entities)
+
+    mock_campaign_repo.create_many.side_effect = _create_many
+    payloads = [_payload(name) for name in "ABCDE"]
+
+    result = campaign_services.create_campaigns(mock_campaign_repo, payloads, chunk_size=2)
+
+    assert calls == [["A", "B"], ["C", "D"], ["E"]]
+    assert result["created"] == 3
+    assert [error["index"] for error in result["errors"]] == [2, 3]
+
+
+def test_import_campaigns_caps_reported_errors(mock_campaign_repo):
+    """Only the first `max_errors` rejected lines are listed, all are counted."""
+    mock_campaign_repo.create_many.side_effect = lambda entities: _assign_ids(entities)
+    body = b"\n".join(
+        [json.dumps(_payload("A")).encode()] + [b"[]"] * 5 + [json.dumps(_payload("B")).encode()]
+    )
+
+    result = campaign_services.import_campaigns(
+        mock_campaign_repo, [body], file_format="ndjson", batch_size=10, max_errors=2
+    )
+
+    assert result["received"] == 7
+    assert result["created"] == 2
+    assert result["failed"] == 5
+    assert [error["line"] for error in result["errors"]] == [2, 3]
+    assert result["errors_truncated"] is True
+    mock_campaign_repo.create_many.assert_called_once()
+
+
+def test_get_campaigns_caches_pages_per_generation(mock_campaign_repo):
+    """Pages are reused until the repository reports a new data generation."""
+    mock_campaign_repo.data_generation.return_value = 1
+    mock_campaign_repo.get_multi_filtered_with_total.return_value = ([], 0)
+
+    first = campaign_services.get_campaigns(mock_campaign_repo, is_active=True, limit=10)
+    second = campaign_services.get_campaigns(mock_campaign_repo, is_active=True, limit=10)
+    assert first == second == {
+        "items": [], "total": 0, "total_capped": False, "next_cursor": None
+    }
+    mock_campaign_repo.get_multi_filtered_with_total.assert_called_once()
+
+    campaign_services.get_campaigns(mock_campaign_repo, is_active=False, limit=10)
+    assert mock_campaign_repo.get_multi_filtered_with_total.call_count == 2
+
+    mock_campaign_repo.data_generation.return_value = 2
+    campaign_services.get_campaigns(mock_campaign_repo, is_active=True, limit=10)
+    assert mock_campaign_repo.get_multi_filtered_with_total.call_count == 3
+
+    [top] = campaign_services.campaign_list_cache.key_stats(limit=1)
+    assert (top["hits"], top["misses"]) == (1, 2)
+
+
+def test_get_campaigns_without_generation_is_not_cached(mock_campaign_repo):
+    """Repositories that do not track their writes are always queried."""
+    mock_campaign_repo.data_generation.return_value = None
+    mock_campaign_repo.get_multi_filtered_with_total.return_value = ([], 0)
+
+    campaign_services.get_campaigns(mock_campaign_repo)
+    campaign_services.get_campaigns(mock_campaign_repo)
+
+    assert mock_campaign_repo.get_multi_filtered_with_total.call_count == 2
@@ -1,15 +1,19 @@
 # tests/conftest.py
 
+import os
 from datetime import date
 from typing import Any, Callable, Generator
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
+# Test runs log to the console only: no app.log written by importing app.main.
+os.environ["LOG_FILE"] = ""
+
 from app.core.config import settings
 from app.core.security import get_password_hash
 
@@ -20,8 +24,14 @@ from app.infrastructure.database.sql_alchemy.models.campaign import (
 
 from app.infrastructure.database.sql_alchemy.models.user import User as UserModel
 from app.infrastructure.database.sql_alchemy.session import get_db
+from app.application.use_cases.campaign.services import (
+    campaign_list_cache,
+    campaign_response_cache,
+)
+from app.infrastructure.repositories.cached.campaign import campaign_cache
+from app.presentation.api.v1.dependencies.repositories import get_read_session
 from app.presentation.api.v1.main import lifespan
-from app.presentation.api.v1.routes import auth, campaign, user
+from app.presentation.api.v1.routes import auth, campaign, metrics, user
 
 
 @pytest.fixture(scope="session")
@@ -58,6 +68,30 @@ def db_session(test_engine, TestingSessionLocal) -> Generator[Session, None, Non
         connection.close()
 
 
+@pytest.fixture(scope="function")
+def sql_statements(test_engine) -> Generator[list[str], None, None]:
+    """Records every SQL statement sent to the test database."""
+    statements: list[str] = []
+
+    def _record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(test_engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture(autouse=True)
+def clear_campaign_caches() -> Generator[None, None, None]:
+    """Every test rolls its data back, so nothing cached may outlive it."""
+    for cache in (campaign_cache, campaign_list_cache, campaign_response_cache):
+        cache.clear()
+        cache.reset_stats()
+    yield
+    for cache in (campaign_cache, campaign_list_cache, campaign_response_cache):
+        cache.clear()
+
+
 @pytest.fixture(scope="function")
 def override_get_db(db_session: Session) -> Callable[[], Generator[Session, Any, None]]:
     """
@@ -85,12 +119,16 @@ def test_app(override_get_db: Callable[[], Generator[Session, Any, None]]) -> Fa
     app.include_router(
         auth.router, prefix=f"{api_prefix}/auth", tags=["Authentication"]
     )
+    app.include_router(
+        metrics.router, prefix=f"{api_prefix}/metrics", tags=["Metrics"]
+    )
 
     @app.get("/")
     def read_root_test():
         return {"message": "Test App Root"}
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_session] = override_get_db
     return app
 
 
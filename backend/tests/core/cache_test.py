@@ -0,0 +1,57 @@
+from app.core.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_eviction_and_stats():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" becomes the most recently used entry
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["size"] == 0
+
+
+def test_fill_started_before_an_invalidation_is_dropped():
+    cache = TTLCache(maxsize=10, ttl=60)
+    generation = cache.generation
+    # A writer invalidates the key while the reader is loading it.
+    cache.invalidate("a")
+
+    assert cache.set("a", "stale", generation=generation) is False
+    assert cache.get("a") is None
+    assert cache.set("a", "fresh", generation=cache.generation) is True
+    assert cache.get("a") == "fresh"
+
+
+def test_zero_maxsize_disables_storage():
+    cache = TTLCache(maxsize=0, ttl=60)
+    assert cache.set("a", 1) is False
+    assert cache.get("a") is None
@@ -0,0 +1,20 @@
+import asyncio
+import threading
+
+from sqlalchemy.util import greenlet_spawn
+
+from app.core.concurrency import run_blocking
+
+
+def test_run_blocking_calls_inline_outside_greenlets():
+    assert run_blocking(threading.get_ident) == threading.get_ident()
+
+
+def test_run_blocking_leaves_the_event_loop_inside_greenlets():
+    async def main():
+        loop_thread = threading.get_ident()
+        worker_thread = await greenlet_spawn(run_blocking, threading.get_ident)
+        return loop_thread, worker_thread
+
+    loop_thread, worker_thread = asyncio.run(main())
+    assert worker_thread != loop_thread
@@ -0,0 +1,29 @@
+import copy
+from datetime import date
+
+import pytest
+
+from app.domain.entities.campaign import Campaign
+
+
+def test_campaign_is_slotted_with_id_field():
+    campaign = Campaign("Slots", None, date(2024, 1, 1), date(2024, 1, 31), 10.0, True)
+    assert campaign.id is None
+    assert campaign.version == 1
+    assert not hasattr(campaign, "__dict__")
+    with pytest.raises(AttributeError):
+        campaign.unknown = 1
+
+    campaign.id = 7
+    clone = copy.copy(campaign)
+    assert (clone.id, clone.name) == (7, "Slots")
+    assert clone is not campaign
+
+
+def test_campaign_metadata_is_keyword_only():
+    with pytest.raises(TypeError):
+        Campaign("Slots", None, date(2024, 1, 1), date(2024, 1, 31), 10.0, True, 2)
+    campaign = Campaign(
+        "Slots", None, date(2024, 1, 1), date(2024, 1, 31), 10.0, True, version=2, id=3
+    )
+    assert (campaign.version, campaign.id) == (2, 3)
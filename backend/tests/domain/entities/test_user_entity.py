@@ -20,3 +20,10 @@ def test_user_activate_deactivate():
     assert user.is_active is True
     user.deactivate()
     assert user.is_active is False
+
+
+def test_user_has_id_field():
+    user = User(email="test@example.com", hashed_password="hashed", id=5)
+    assert user.id == 5
+    assert User(email="test@example.com", hashed_password="hashed").id is None
+    assert not hasattr(user, "__dict__")
@@ -0,0 +1,90 @@
+import logging
+import os
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.pool import SingletonThreadPool
+
+from app.infrastructure.database.sql_alchemy.pool import instrumented_engine, pool_stats, warm_up
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    engine = instrumented_engine(
+        create_engine,
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        "test-pool",
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.2,
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_pool_settings_and_counters(file_engine):
+    stats = pool_stats()["test-pool"]
+    assert stats["pool"] == "TimedQueuePool"
+    assert stats["size"] == 1
+    assert stats["checkouts"] == 0
+
+    with file_engine.connect() as first, file_engine.connect() as second:
+        first.execute(text("SELECT 1"))
+        second.execute(text("SELECT 1"))
+        assert pool_stats()["test-pool"]["checked_out"] == 2
+        first.invalidate()
+
+    stats = pool_stats()["test-pool"]
+    assert stats["connects"] == 2
+    assert stats["checkouts"] == stats["checkins"] == 2
+    assert stats["peak_overflow"] == 1
+    assert stats["invalidations"] == 1
+    assert stats["waits"] == 2
+    assert stats["slow_waits"] == 0
+
+
+def test_slow_checkouts_are_counted_and_logged(file_engine, caplog):
+    held = [file_engine.connect(), file_engine.connect()]
+
+    def release() -> None:
+        time.sleep(0.15)
+        held.pop().close()
+
+    threading.Thread(target=release).start()
+    with caplog.at_level(logging.WARNING):
+        held.append(file_engine.connect())
+        with pytest.raises(exc.TimeoutError):
+            file_engine.connect()
+    for connection in held:
+        connection.close()
+
+    stats = pool_stats()["test-pool"]
+    assert stats["slow_waits"] == 2
+    assert stats["wait_max_ms"] >= 150
+    assert "Pool test-pool: checkout waited" in caplog.text
+
+
+def test_memory_database_keeps_its_pool():
+    engine = instrumented_engine(create_engine, "sqlite:///:memory:", "test-memory")
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    assert isinstance(engine.pool, SingletonThreadPool)
+    stats = pool_stats()["test-memory"]
+    assert stats["pool"] == "SingletonThreadPool"
+    assert stats["checkouts"] == 1
+
+
+def test_warm_up_and_fresh_pools_after_fork(file_engine):
+    warm_up(4)
+    stats = pool_stats()["test-pool"]
+    assert stats["connects"] == stats["checked_in"] == 1  # capped to the pool size
+
+    pid = os.fork()
+    if pid == 0:
+        stats = pool_stats()["test-pool"]
+        os._exit(0 if stats["checked_in"] == stats["connects"] == 0 else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert pool_stats()["test-pool"]["checked_in"] == 1
@@ -0,0 +1,34 @@
+from sqlalchemy import create_engine
+
+from app.core.config import settings
+from app.infrastructure.database.sql_alchemy.routing import ReadRouter, ReadTarget, read_targets
+from app.infrastructure.database.sql_alchemy.sqlite import read_only_url
+
+
+def test_read_targets(monkeypatch):
+    monkeypatch.setattr(settings, "DATABASE_READ_REPLICA_URLS", [])
+    assert read_targets("sqlite:///:memory:") == []
+    assert read_targets("postgresql://db/ads") == []
+    assert read_targets("sqlite:///./app.db") == [
+        ReadTarget("read", read_only_url("sqlite:///./app.db"), True)
+    ]
+
+    monkeypatch.setattr(
+        settings, "DATABASE_READ_REPLICA_URLS", ["postgresql://r1/ads", "postgresql://r2/ads"]
+    )
+    assert read_targets("postgresql://db/ads") == [
+        ReadTarget("replica1", "postgresql://r1/ads", False),
+        ReadTarget("replica2", "postgresql://r2/ads", False),
+    ]
+
+
+def test_read_router_prefers_least_busy_engine(tmp_path):
+    engines = [create_engine(f"sqlite:///{tmp_path / f'{i}.db'}") for i in range(3)]
+    router = ReadRouter(engines)
+    # Idle engines are taken in turn.
+    assert [router.pick() for _ in range(4)] == engines + engines[:1]
+
+    with engines[1].connect(), engines[2].connect():
+        assert {router.pick() for _ in range(3)} == {engines[0]}
+    for engine in engines:
+        engine.dispose()
@@ -0,0 +1,45 @@
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, event, text, update
+
+from app.infrastructure.database.sql_alchemy.models.base import Base
+from app.infrastructure.database.sql_alchemy.models.schema_meta import schema_meta
+from app.infrastructure.database.sql_alchemy.schema import ensure_schema, schema_fingerprint
+
+
+def test_warm_boot_skips_create_all(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    statements = []
+    event.listen(
+        engine, "before_cursor_execute", lambda _c, _cur, statement, *_: statements.append(statement)
+    )
+
+    assert ensure_schema(engine) is True
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT count(*) FROM campaigns")).scalar() == 0
+
+    statements.clear()
+    assert ensure_schema(engine) is False
+    # One lookup of the stored fingerprint, no reflection.
+    assert len(statements) == 1 and "schema_meta" in statements[0]
+
+    with engine.begin() as connection:
+        connection.execute(update(schema_meta).values(value="stale"))
+    assert ensure_schema(engine) is True
+    assert ensure_schema(engine) is False
+    engine.dispose()
+
+
+def test_fingerprint_follows_the_schema():
+    dialect = create_engine("sqlite://").dialect
+    metadata = MetaData()
+    Table("items", metadata, Column("id", Integer, primary_key=True))
+    before = schema_fingerprint(metadata, dialect)
+    assert schema_fingerprint(metadata, dialect) == before
+
+    Table("items", metadata, Column("name", String(20), index=True), extend_existing=True)
+    with_column = schema_fingerprint(metadata, dialect)
+    assert with_column != before
+
+    metadata.info["ddl"] = ["CREATE TRIGGER items_ai AFTER INSERT ON items BEGIN SELECT 1; END"]
+    assert schema_fingerprint(metadata, dialect) != with_column
+    # The campaign indexes created by create_all events are part of the app's schema.
+    assert any("campaigns_fts" in statement for statement in Base.metadata.info["ddl"])
@@ -0,0 +1,52 @@
+import pytest
+from sqlalchemy import create_engine, exc, make_url, text
+
+from app.infrastructure.database.sql_alchemy.sqlite import (
+    apply_sqlite_profile,
+    optimize,
+    read_only_url,
+)
+
+
+def test_read_only_url():
+    url = make_url(read_only_url("sqlite:////data/ad campaigns.db"))
+    assert url.database == "file:/data/ad%20campaigns.db"
+    assert dict(url.query) == {"mode": "ro", "uri": "true"}
+    assert make_url(read_only_url("sqlite:///./app.db")).database == "file:./app.db"
+    assert read_only_url("sqlite:///:memory:") is None
+    assert read_only_url("sqlite://") is None
+    assert read_only_url("postgresql://ads:secret@db/ads") is None
+
+
+def test_sqlite_profile_and_read_only_engine(tmp_path):
+    url = f"sqlite:///{tmp_path / 'profile.db'}"
+    engine = create_engine(url)
+    apply_sqlite_profile(engine)
+    reader = create_engine(read_only_url(url))
+    apply_sqlite_profile(reader, read_only=True)
+
+    with engine.begin() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert connection.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+        connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        connection.execute(text("INSERT INTO items DEFAULT VALUES"))
+
+    with reader.connect() as connection:
+        # A reader sees committed rows while a write transaction is open.
+        with engine.begin() as writer:
+            writer.execute(text("INSERT INTO items DEFAULT VALUES"))
+            assert connection.execute(text("SELECT count(*) FROM items")).scalar() == 1
+        with pytest.raises(exc.OperationalError, match="readonly"):
+            connection.execute(text("INSERT INTO items DEFAULT VALUES"))
+
+    optimize(engine)
+    engine.dispose()
+    reader.dispose()
+
+
+def test_sqlite_profile_skips_memory_databases():
+    engine = create_engine("sqlite://")
+    apply_sqlite_profile(engine)
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "memory"
@@ -0,0 +1,71 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.domain.entities.campaign import Campaign as DomainCampaign
+from app.infrastructure.repositories.cached.campaign import CachedCampaignRepository
+from app.infrastructure.repositories.sql_alchemy.campaign import (
+    CampaignSqlAlchemyRepository,
+)
+
+
+@pytest.fixture
+def cache():
+    return TTLCache(maxsize=100, ttl=60)
+
+
+@pytest.fixture
+def cached_repo(db_session: Session, cache: TTLCache):
+    return CachedCampaignRepository(CampaignSqlAlchemyRepository(db=db_session), cache)
+
+
+def _campaign(name: str, is_active: bool = True) -> DomainCampaign:
+    return DomainCampaign(
+        name=name,
+        description=None,
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 1, 31),
+        budget=100,
+        is_active=is_active,
+    )
+
+
+def test_get_is_served_from_cache_as_copies(cached_repo, cache):
+    created = cached_repo.create(entity=_campaign("Cached"))
+
+    first = cached_repo.get(created.id)
+    first.name = "Mutated by caller"
+    second = cached_repo.get(created.id)
+
+    assert second.name == "Cached"
+    assert second is not first
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cached_repo.get(-1) is None  # misses are not cached
+    assert cache.stats()["size"] == 1
+
+
+def test_no_stale_reads_after_writes(cached_repo):
+    created = cached_repo.create(entity=_campaign("Before"))
+    other = cached_repo.create(entity=_campaign("Other"))
+    cached_repo.get(created.id)
+    cached_repo.get(other.id)
+
+    created.name = "After"
+    cached_repo.update(id=created.id, entity=created)
+    assert cached_repo.get(created.id).name == "After"
+
+    cached_repo.set_active_filtered(active=False, ids=[created.id, other.id])
+    assert cached_repo.get(created.id).is_active is False
+    assert cached_repo.get(other.id).is_active is False
+
+    cached_repo.set_active_filtered(active=True, ids=[created.id], returning=True)
+    assert cached_repo.get(created.id).is_active is True
+
+    cached_repo.remove_filtered(ids=[other.id], returning=True)
+    assert cached_repo.get(other.id) is None
+
+    cached_repo.remove(id=created.id)
+    assert cached_repo.get(created.id) is None
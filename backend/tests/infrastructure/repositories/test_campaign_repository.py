@@ -1,9 +1,12 @@
 from datetime import date
 
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
 
+from app.application.use_cases.campaign import services as campaign_services
 from app.domain.entities.campaign import Campaign as DomainCampaign
+from app.infrastructure.database.sql_alchemy.models.base import Base
 from app.infrastructure.database.sql_alchemy.models.campaign import (
     Campaign as ModelCampaign,
 )
@@ -115,3 +118,388 @@ def test_get_multi_filtered(
         start_date=date(2024, 1, 11)
     )
     assert len(campaigns_after_jan_10) == 2
+
+
+def test_get_multi_filtered_keyset_seek(
+    campaign_repo: CampaignSqlAlchemyRepository, db_session: Session
+):
+    created = [
+        campaign_repo.create(
+            entity=DomainCampaign(
+                name=f"Keyset {i}",
+                description=None,
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 1, 31),
+                budget=budget,
+                is_active=True,
+            )
+        )
+        for i, budget in enumerate([300, 100, 200, 100])
+    ]
+
+    by_budget = campaign_repo.get_multi_filtered(sort="budget")
+    assert [c.id for c in by_budget] == [
+        created[1].id, created[3].id, created[2].id, created[0].id
+    ]
+
+    # Ties on the sort key are broken by id, so no row is skipped or repeated.
+    after_first = campaign_repo.get_multi_filtered(
+        sort="budget", after=(100.0, created[1].id)
+    )
+    assert [c.id for c in after_first] == [created[3].id, created[2].id, created[0].id]
+
+    after_id = campaign_repo.get_multi_filtered(after=(None, created[1].id), limit=2)
+    assert [c.id for c in after_id] == [created[2].id, created[3].id]
+
+
+def test_get_multi_filtered_with_total(
+    campaign_repo: CampaignSqlAlchemyRepository, db_session: Session
+):
+    for i in range(5):
+        campaign_repo.create(
+            entity=DomainCampaign(
+                name=f"Total {i}",
+                description=None,
+                start_date=date(2024, 3, 1),
+                end_date=date(2024, 3, 31),
+                budget=100 + i,
+                is_active=i % 2 == 0,
+            )
+        )
+
+    items, total = campaign_repo.get_multi_filtered_with_total(
+        skip=1, limit=2, is_active=True, sort="budget"
+    )
+    assert total == 3
+    assert [c.budget for c in items] == [102, 104]
+
+    # Past the last page the total is still reported.
+    items, total = campaign_repo.get_multi_filtered_with_total(skip=50, limit=2)
+    assert items == []
+    assert total == 5
+
+    assert campaign_repo.count_filtered(max_count=2) == 2
+    assert campaign_repo.count_filtered(is_active=False, max_count=10) == 2
+
+
+def test_date_window_uses_rtree_and_stays_in_sync(
+    campaign_repo: CampaignSqlAlchemyRepository, sql_statements: list
+):
+    window = {"start_date": date(2024, 9, 10), "end_date": date(2024, 9, 12)}
+
+    inside = campaign_repo.create(
+        entity=DomainCampaign(
+            name="In window",
+            description=None,
+            start_date=date(2024, 9, 1),
+            end_date=date(2024, 9, 10),
+            budget=100,
+            is_active=True,
+        )
+    )
+    outside = campaign_repo.create(
+        entity=DomainCampaign(
+            name="Out of window",
+            description=None,
+            start_date=date(2024, 10, 1),
+            end_date=date(2024, 10, 31),
+            budget=100,
+            is_active=True,
+        )
+    )
+
+    sql_statements.clear()
+    assert [c.id for c in campaign_repo.get_multi_filtered(**window)] == [inside.id]
+    assert "campaigns_date_rtree" in sql_statements[-1]
+    assert campaign_repo.count_filtered(**window) == 1
+
+    outside.start_date = date(2024, 9, 12)
+    campaign_repo.update(id=outside.id, entity=outside)
+    assert {c.id for c in campaign_repo.get_multi_filtered(**window)} == {
+        inside.id,
+        outside.id,
+    }
+
+    campaign_repo.remove(id=inside.id)
+    assert campaign_repo.count_filtered(**window) == 1
+
+
+def test_create_many(campaign_repo: CampaignSqlAlchemyRepository, db_session: Session):
+    entities = [
+        DomainCampaign(
+            name=f"Bulk {i}",
+            description=None,
+            start_date=date(2024, 5, 1),
+            end_date=date(2024, 5, 2),
+            budget=10 * (i + 1),
+            is_active=False,
+        )
+        for i in range(3)
+    ]
+
+    created = campaign_repo.create_many(entities=entities)
+
+    assert [c.name for c in created] == ["Bulk 0", "Bulk 1", "Bulk 2"]
+    for entity in created:
+        stored = campaign_repo.get(id=entity.id)
+        assert stored.name == entity.name
+        assert stored.budget == entity.budget
+    assert campaign_repo.create_many(entities=[]) == []
+
+
+def test_search_ranks_and_stays_in_sync(campaign_repo: CampaignSqlAlchemyRepository):
+    def campaign(name: str, description: str, is_active: bool = True) -> DomainCampaign:
+        return campaign_repo.create(
+            entity=DomainCampaign(
+                name=name,
+                description=description,
+                start_date=date(2024, 1, 1),
+                end_date=date(2024, 1, 31),
+                budget=100,
+                is_active=is_active,
+            )
+        )
+
+    in_description = campaign("Spring sale", "Running shoes for everyone")
+    in_name = campaign("Running Shoes Co", "Seasonal offer")
+    inactive = campaign("Shoes outlet", "Running gear", is_active=False)
+    campaign("Coffee", "Morning blend")
+
+    ranked = campaign_repo.get_multi_filtered(search="run sho", sort="relevance")
+    assert [c.id for c in ranked] == [in_name.id, inactive.id, in_description.id]
+    assert campaign_repo.count_filtered(search="run sho", is_active=True) == 2
+    # FTS5 syntax in user input is matched literally, never parsed.
+    assert campaign_repo.count_filtered(search='shoes OR "coffee') == 0
+    assert campaign_repo.count_filtered(search="***") == 0
+
+    in_name.name = "Trail Co"
+    campaign_repo.update(id=in_name.id, entity=in_name)
+    campaign_repo.remove(id=inactive.id)
+    assert campaign_repo.count_filtered(search="shoes") == 1
+    assert campaign_repo.count_filtered(search="trail") == 1
+
+
+def test_monthly_stats_rollup_matches_recompute(campaign_repo: CampaignSqlAlchemyRepository):
+    def campaign(start: date, budget: float, is_active: bool) -> DomainCampaign:
+        return DomainCampaign(
+            name="Stats",
+            description=None,
+            start_date=start,
+            end_date=date(2024, 12, 31),
+            budget=budget,
+            is_active=is_active,
+        )
+
+    first = campaign_repo.create(entity=campaign(date(2024, 1, 5), 100, True))
+    campaign_repo.create_many(
+        entities=[
+            campaign(date(2024, 1, 20), 50, False),
+            campaign(date(2024, 2, 1), 25, True),
+            campaign(date(2024, 3, 9), 10, True),
+        ]
+    )
+    first.start_date = date(2024, 2, 14)
+    first.budget = 300
+    campaign_repo.update(id=first.id, entity=first)
+    campaign_repo.set_active_filtered(active=False, start_date=date(2024, 2, 1), end_date=date(2024, 2, 28))
+    campaign_repo.remove_filtered(start_date=date(2024, 3, 1), end_date=date(2024, 3, 31), is_active=True)
+
+    rollup = sorted(campaign_repo.get_monthly_stats())
+    assert rollup == [
+        (date(2024, 1, 1), False, 1, 50.0),
+        (date(2024, 2, 1), False, 2, 325.0),
+    ]
+    # Filtered by state, still from the rollup.
+    assert campaign_repo.get_monthly_stats(is_active=True) == []
+    # Date filters fall back to a live aggregate over campaigns.
+    assert campaign_repo.get_monthly_stats(
+        start_date=date(2024, 1, 1), end_date=date(2024, 1, 31)
+    ) == [(date(2024, 1, 1), False, 1, 50.0)]
+
+    campaign_repo.rebuild_stats()
+    assert sorted(campaign_repo.get_monthly_stats()) == rollup
+
+
+def test_bulk_writes_take_stats_deltas_from_the_written_rows(
+    campaign_repo: CampaignSqlAlchemyRepository, db_session: Session
+):
+    campaign_repo.create_many(
+        entities=[
+            DomainCampaign(
+                name=f"Bulk {i}",
+                description=None,
+                start_date=date(2024, 5, i + 1),
+                end_date=date(2024, 5, 31),
+                budget=10 * (i + 1),
+                is_active=True,
+            )
+            for i in range(3)
+        ]
+    )
+    statements = []
+    engine = db_session.get_bind()
+
+    def record(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement.split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        assert campaign_repo.set_active_filtered(active=False, is_active=True)[0] == 3
+        assert campaign_repo.remove_filtered(end_date=date(2024, 5, 2))[0] == 2
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    # No separate read of the matching rows: each write, then its rollup upsert.
+    assert statements == ["UPDATE", "INSERT", "DELETE", "INSERT"]
+    assert campaign_repo.get_monthly_stats() == [(date(2024, 5, 1), False, 1, 30.0)]
+    campaign_repo.rebuild_stats()
+    assert campaign_repo.get_monthly_stats() == [(date(2024, 5, 1), False, 1, 30.0)]
+
+
+def test_concurrent_patches_keep_stats_in_sync(tmp_path):
+    """A patch committed between another patch's read and write is not lost."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'patches.db'}")
+    Base.metadata.create_all(bind=engine)
+    Sessions = sessionmaker(bind=engine)
+    with Sessions() as db:
+        created = CampaignSqlAlchemyRepository(db).create(
+            entity=DomainCampaign(
+                name="Patched",
+                description=None,
+                start_date=date(2024, 1, 10),
+                end_date=date(2024, 12, 31),
+                budget=100,
+                is_active=True,
+            )
+        )
+
+    def patch(values: dict) -> None:
+        with Sessions() as db:
+            CampaignSqlAlchemyRepository(db).update_fields(id=created.id, values=values)
+
+    interleaved = []
+
+    def concurrent_patch(_conn, _cursor, statement, *_args) -> None:
+        # Right before the first patch's UPDATE, after it read the old row.
+        if statement.startswith("UPDATE campaigns") and not interleaved:
+            interleaved.append(statement)
+            patch({"start_date": date(2024, 3, 1), "budget": 30})
+
+    event.listen(engine, "before_cursor_execute", concurrent_patch)
+    patch({"budget": 250})
+    event.remove(engine, "before_cursor_execute", concurrent_patch)
+    assert interleaved
+
+    with Sessions() as db:
+        repo = CampaignSqlAlchemyRepository(db)
+        rollup = campaign_services.get_campaign_stats(repo)
+        assert rollup["budget_total"] == 250
+        assert campaign_services.rebuild_campaign_stats(repo) == rollup
+    engine.dispose()
+
+
+def test_row_version_tracks_writes(campaign_repo: CampaignSqlAlchemyRepository):
+    created = campaign_repo.create(
+        entity=DomainCampaign(
+            name="Versioned",
+            description=None,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            budget=10,
+            is_active=True,
+        )
+    )
+    assert created.version == 1
+    assert created.updated_at is not None
+
+    created.budget = 20
+    updated = campaign_repo.update(id=created.id, entity=created)
+    assert updated.version == 2
+    assert campaign_repo.get_version(created.id)[0] == 2
+
+    campaign_repo.set_active_filtered(active=False, ids=[created.id])
+    assert campaign_repo.get_version(created.id)[0] == 3
+    assert campaign_repo.get(id=created.id).version == 3
+    assert campaign_repo.get_version(created.id + 1) is None
+
+
+def test_single_row_writes_use_returning(
+    campaign_repo: CampaignSqlAlchemyRepository, sql_statements: list
+):
+    created = campaign_repo.create(
+        entity=DomainCampaign(
+            name="Patched",
+            description=None,
+            start_date=date(2024, 1, 10),
+            end_date=date(2024, 1, 31),
+            budget=100,
+            is_active=False,
+        )
+    )
+    sql_statements.clear()
+
+    # Columns outside the rollup: one UPDATE ... RETURNING.
+    renamed = campaign_repo.update_fields(id=created.id, values={"name": "Renamed"})
+    assert [renamed.name, renamed.budget, renamed.version] == ["Renamed", 100, 2]
+    assert len(sql_statements) == 1
+    assert sql_statements[0].startswith("UPDATE campaigns SET")
+    assert "RETURNING" in sql_statements[0]
+
+    # Activation toggle: the UPDATE plus the rollup upsert.
+    sql_statements.clear()
+    assert campaign_repo.update_fields(id=created.id, values={"is_active": True}).is_active
+    assert len(sql_statements) == 2
+    sql_statements.clear()
+    unchanged = campaign_repo.update_fields(id=created.id, values={"is_active": True})
+    assert (unchanged.is_active, unchanged.version) == (True, 3)
+    assert len(sql_statements) == 2
+
+    # Moving the budget or start month also reads the previous values.
+    sql_statements.clear()
+    moved = campaign_repo.update_fields(
+        id=created.id, values={"start_date": date(2024, 2, 1), "budget": 40}
+    )
+    assert (moved.start_date, moved.budget, moved.version) == (date(2024, 2, 1), 40, 4)
+    assert len(sql_statements) == 3
+
+    assert campaign_repo.update_fields(
+        id=created.id, values={"name": "Stale"}, expected_versions={1, 2}
+    ) is None
+    assert campaign_repo.update_fields(id=created.id + 1, values={"name": "Missing"}) is None
+    assert campaign_repo.get_monthly_stats() == [(date(2024, 2, 1), True, 1, 40.0)]
+
+    sql_statements.clear()
+    assert campaign_repo.remove(id=created.id, expected_versions={3}) is None
+    removed = campaign_repo.remove(id=created.id, expected_versions={4})
+    assert (removed.id, removed.name) == (created.id, "Renamed")
+    assert len(sql_statements) == 3
+    assert sql_statements[-2].startswith("DELETE FROM campaigns")
+    assert campaign_repo.get(id=created.id) is None
+    assert campaign_repo.get_monthly_stats() == []
+
+
+def test_partial_reads_select_only_requested_columns(
+    campaign_repo: CampaignSqlAlchemyRepository, sql_statements: list
+):
+    created = campaign_repo.create(
+        entity=DomainCampaign(
+            name="Narrow",
+            description="long text",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            budget=10,
+            is_active=True,
+        )
+    )
+    sql_statements.clear()
+
+    items, total = campaign_repo.get_multi_filtered_with_total(fields=("name", "budget"))
+    assert (items, total) == ([{"id": created.id, "name": "Narrow", "budget": 10}], 1)
+    assert "description" not in sql_statements[-1]
+    assert campaign_repo.get_multi_filtered_with_total(is_active=False, fields=("name",)) == ([], 0)
+    assert campaign_repo.get_multi_filtered(
+        search="narrow", sort="relevance", fields=("name",)
+    ) == [{"id": created.id, "name": "Narrow"}]
+    partial = campaign_repo.get_fields(created.id, ("updated_at",))
+    assert partial["updated_at"].tzinfo is not None
+    assert campaign_repo.get_fields(created.id + 1, ("name",)) is None
@@ -0,0 +1,135 @@
+from typing import AsyncGenerator, Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlalchemy.util.concurrency import in_greenlet
+
+from app.core.config import settings
+from app.infrastructure.database.sql_alchemy.async_session import (
+    async_database_url,
+    get_async_db,
+)
+from app.infrastructure.database.sql_alchemy.models.base import Base
+from app.infrastructure.database.sql_alchemy.sqlite import apply_sqlite_profile, read_only_url
+from app.presentation.api.v1.dependencies.auth import (
+    build_auth_service,
+    get_async_auth_service,
+)
+from app.presentation.api.v1.dependencies.repositories import (
+    get_async_campaign_reader,
+    get_async_campaign_repository,
+    get_async_user_reader,
+    get_async_user_repository,
+    get_campaign_repository,
+    get_user_repository,
+    on_async_session,
+)
+from app.presentation.api.v1.routes import auth, campaign, user
+
+
+def test_async_database_url():
+    assert async_database_url("sqlite:///./app.db") == "sqlite+aiosqlite:///./app.db"
+    assert (
+        async_database_url("postgresql://ads:secret@db:5432/ads")
+        == "postgresql+asyncpg://ads:secret@db:5432/ads"
+    )
+    with pytest.raises(ValueError):
+        async_database_url("mssql://db/ads")
+
+
+@pytest.fixture
+def async_client(tmp_path) -> Generator[tuple, None, None]:
+    """
+    App served on AsyncSession repositories, over a SQLite file (aiosqlite),
+    with GET routes on a read-only engine.
+    """
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    sync_engine = create_engine(url)
+    Base.metadata.create_all(bind=sync_engine)
+    sync_engine.dispose()
+
+    in_greenlets = []
+
+    def _record(*_args) -> None:
+        in_greenlets.append(in_greenlet())
+
+    def _sessions(engine_url: str, read_only: bool = False) -> async_sessionmaker:
+        engine = create_async_engine(async_database_url(engine_url), poolclass=NullPool)
+        apply_sqlite_profile(engine, read_only=read_only)
+        event.listen(engine.sync_engine, "before_cursor_execute", _record)
+        return async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+    sessions = _sessions(url)
+    read_sessions = _sessions(read_only_url(url), read_only=True)
+
+    async def _get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with sessions() as db:
+            yield db
+
+    async def _get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+        async with read_sessions() as db:
+            yield db
+
+    app = FastAPI()
+    api_prefix = settings.API_V1_STR
+    app.include_router(user.router, prefix=f"{api_prefix}/users")
+    app.include_router(campaign.router, prefix=f"{api_prefix}/campaigns")
+    app.include_router(auth.router, prefix=f"{api_prefix}/auth")
+    app.dependency_overrides.update(
+        {
+            get_async_db: _get_async_db,
+            get_async_campaign_repository: on_async_session(get_campaign_repository),
+            get_async_campaign_reader: on_async_session(
+                get_campaign_repository, _get_async_read_db
+            ),
+            get_async_user_repository: on_async_session(get_user_repository),
+            get_async_user_reader: on_async_session(get_user_repository, _get_async_read_db),
+            get_async_auth_service: on_async_session(build_auth_service),
+        }
+    )
+    with TestClient(app) as client:
+        yield client, in_greenlets
+
+
+def test_routes_on_async_sessions(async_client):
+    client, in_greenlets = async_client
+    credentials = {"email": "async@example.com", "password": "asyncpassword"}
+
+    assert client.post("/api/v1/users/", json=credentials).status_code == 201
+    token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/api/v1/users/me", headers=headers).json()["email"] == credentials["email"]
+
+    created = client.post(
+        "/api/v1/campaigns/",
+        headers=headers,
+        json={
+            "name": "Async",
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-31",
+            "budget": 10,
+        },
+    )
+    assert created.status_code == 201
+    url = f"/api/v1/campaigns/{created.json()['id']}"
+
+    page = client.get("/api/v1/campaigns/", headers=headers).json()
+    assert [item["name"] for item in page["items"]] == ["Async"]
+
+    item = client.get(url, headers=headers)
+    patched = client.patch(
+        url, headers={**headers, "If-Match": item.headers["etag"]}, json={"name": "Renamed"}
+    )
+    assert patched.json()["name"] == "Renamed"
+    assert client.post(f"{url}/activate", headers=headers).json()["is_active"] is True
+    assert client.get("/api/v1/campaigns/stats", headers=headers).json()["active_count"] == 1
+
+    assert client.delete(url, headers=headers).status_code == 200
+    assert client.get(url, headers=headers).status_code == 404
+
+    # Every statement went through AsyncSession.run_sync on the async driver.
+    assert in_greenlets and all(in_greenlets)
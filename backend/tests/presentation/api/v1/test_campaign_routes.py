@@ -1,7 +1,14 @@
+import csv
+import io
+import json
 from datetime import date
 
 from fastapi.testclient import TestClient
 
+from app.application.use_cases.campaign.services import campaign_response_cache
+from app.core.config import settings
+from app.core.pagination import encode_cursor
+
 def test_create_campaign_success(
     client: TestClient,
     test_auth_headers: dict,
@@ -205,3 +212,764 @@ def test_update_campaign_invalid_payload(
         json=invalid_payload,
     )
     assert response.status_code == 422
+
+
+def test_read_campaigns_cursor_pagination(
+    client: TestClient, test_auth_headers: dict, create_test_campaign
+):
+    """Walking the list with next_cursor visits every campaign exactly once."""
+    for i, day in enumerate([5, 1, 3, 1, 2]):
+        create_test_campaign(
+            name=f"Cursor {i}",
+            start_date=date(2024, 7, day),
+            end_date=date(2024, 7, 31),
+            budget=100,
+        )
+
+    seen = []
+    params = {"limit": 2, "sort": "start_date"}
+    while True:
+        response = client.get(
+            "/api/v1/campaigns/", headers=test_auth_headers, params=params
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        seen.extend(data["items"])
+        if data["next_cursor"] is None:
+            break
+        params = {**params, "cursor": data["next_cursor"]}
+
+    assert len(seen) == 5
+    assert len({c["id"] for c in seen}) == 5
+    assert [c["start_date"] for c in seen] == sorted(c["start_date"] for c in seen)
+
+
+def test_read_campaigns_rejects_empty_pages(client: TestClient, test_auth_headers: dict):
+    response = client.get(
+        "/api/v1/campaigns/", headers=test_auth_headers, params={"limit": 0}
+    )
+    assert response.status_code == 422
+
+
+def test_read_campaigns_invalid_cursor(client: TestClient, test_auth_headers: dict):
+    response = client.get(
+        "/api/v1/campaigns/",
+        headers=test_auth_headers,
+        params={"cursor": "not-a-cursor"},
+    )
+    assert response.status_code == 400
+
+    # Well-formed cursors whose sort value has the wrong type for the sort.
+    for sort, value in (("name", 42), ("name", ["a"]), ("id", "1"), ("budget", [1])):
+        response = client.get(
+            "/api/v1/campaigns/",
+            headers=test_auth_headers,
+            params={"sort": sort, "cursor": encode_cursor([sort, value, 1])},
+        )
+        assert response.status_code == 400, (sort, value)
+
+
+def test_read_campaigns_unsupported_sort(client: TestClient, test_auth_headers: dict):
+    response = client.get(
+        "/api/v1/campaigns/",
+        headers=test_auth_headers,
+        params={"sort": "description"},
+    )
+    assert response.status_code == 422
+
+
+def test_read_campaigns_total_modes(
+    client: TestClient, test_auth_headers: dict, create_test_campaign, monkeypatch
+):
+    for i in range(3):
+        create_test_campaign(
+            name=f"Total mode {i}",
+            start_date=date(2024, 8, 1),
+            end_date=date(2024, 8, 31),
+            budget=100,
+        )
+
+    exact = client.get(
+        "/api/v1/campaigns/", headers=test_auth_headers, params={"limit": 1}
+    ).json()
+    assert exact["total"] == 3
+    assert exact["total_capped"] is False
+    assert len(exact["items"]) == 1
+
+    skipped = client.get(
+        "/api/v1/campaigns/",
+        headers=test_auth_headers,
+        params={"limit": 1, "total": "none"},
+    ).json()
+    assert skipped["total"] is None
+    assert skipped["items"] == exact["items"]
+
+    estimated = client.get(
+        "/api/v1/campaigns/",
+        headers=test_auth_headers,
+        params={"limit": 1, "total": "estimate"},
+    ).json()
+    assert estimated["total"] == 3
+    assert estimated["total_capped"] is False
+
+    monkeypatch.setattr(settings, "CAMPAIGN_COUNT_ESTIMATE_CAP", 2)
+    capped = client.get(
+        "/api/v1/campaigns/",
+        headers=test_auth_headers,
+        params={"limit": 2, "total": "estimate"},
+    ).json()
+    assert capped["total"] == 2
+    assert capped["total_capped"] is True
+
+
+def test_create_campaigns_bulk(client: TestClient, test_auth_headers: dict):
+    payload = {
+        "name": "Bulk",
+        "description": "Bulk created",
+        "start_date": "2024-05-01",
+        "end_date": "2024-05-31",
+        "budget": 10,
+    }
+    items = [payload, {**payload, "budget": "lots"}, payload, payload]
+
+    response = client.post(
+        "/api/v1/campaigns/bulk",
+        headers=test_auth_headers,
+        json=items,
+        params={"chunk_size": 2},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 3
+    assert len(data["ids"]) == 3
+    assert [error["index"] for error in data["errors"]] == [1]
+    assert data["errors"][0]["errors"][0]["loc"] == ["budget"]
+
+    listed = client.get(
+        "/api/v1/campaigns/", headers=test_auth_headers, params={"limit": 10}
+    ).json()
+    assert {c["id"] for c in listed["items"]} >= set(data["ids"])
+
+
+def test_bulk_deactivate_and_delete_by_filter(
+    client: TestClient, test_auth_headers: dict, create_test_campaign
+):
+    ending = [
+        create_test_campaign(
+            name=f"Ending {i}",
+            start_date=date(2024, 9, 1),
+            end_date=date(2024, 9, 6),
+            budget=100,
+            is_active=True,
+        )
+        for i in range(2)
+    ]
+    later = create_test_campaign(
+        name="Later",
+        start_date=date(2024, 10, 1),
+        end_date=date(2024, 10, 31),
+        budget=100,
+        is_active=True,
+    )
+
+    response = client.post(
+        "/api/v1/campaigns/bulk/deactivate",
+        headers=test_auth_headers,
+        params={"return_ids": True},
+        json={"is_active": True, "start_date": "2024-09-02", "end_date": "2024-09-08"},
+    )
+    assert response.status_code == 200
+    assert response.json()["affected"] == 2
+    assert sorted(response.json()["ids"]) == sorted(c.id for c in ending)
+
+    assert client.get(
+        f"/api/v1/campaigns/{ending[0].id}", headers=test_auth_headers
+    ).json()["is_active"] is False
+    assert client.get(
+        f"/api/v1/campaigns/{later.id}", headers=test_auth_headers
+    ).json()["is_active"] is True
+
+    # Already inactive campaigns are not counted again.
+    response = client.post(
+        "/api/v1/campaigns/bulk/deactivate",
+        headers=test_auth_headers,
+        json={"ids": [c.id for c in ending]},
+    )
+    assert response.json() == {"affected": 0, "ids": None}
+
+    response = client.post(
+        "/api/v1/campaigns/bulk/delete",
+        headers=test_auth_headers,
+        json={"ids": [ending[0].id, later.id]},
+    )
+    assert response.json()["affected"] == 2
+    assert client.get(
+        f"/api/v1/campaigns/{later.id}", headers=test_auth_headers
+    ).status_code == 404
+
+
+def test_bulk_mutation_requires_a_criterion(client: TestClient, test_auth_headers: dict):
+    response = client.post(
+        "/api/v1/campaigns/bulk/delete", headers=test_auth_headers, json={}
+    )
+    assert response.status_code == 422
+
+
+def test_export_campaigns_ndjson_and_csv(
+    client: TestClient, test_auth_headers: dict, create_test_campaign
+):
+    active = create_test_campaign(
+        name="Export, \"quoted\"",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 1, 31),
+        budget=250.5,
+        is_active=True,
+    )
+    create_test_campaign(
+        name="Skipped",
+        start_date=date(2024, 1, 1),
+        end_date=date(2024, 1, 31),
+        budget=10,
+        is_active=False,
+    )
+
+    response = client.get(
+        "/api/v1/campaigns/export",
+        headers=test_auth_headers,
+        params={"is_active": True},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert "campaigns.ndjson" in response.headers["content-disposition"]
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == [
+        {
+            "id": active.id,
+            "name": active.name,
+            "description": active.description,
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-31",
+            "budget": 250.5,
+            "is_active": True,
+        }
+    ]
+
+    response = client.get(
+        "/api/v1/campaigns/export",
+        headers=test_auth_headers,
+        params={"format": "csv", "is_active": True},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0] == [
+        "id", "name", "description", "start_date", "end_date", "budget", "is_active"
+    ]
+    assert len(rows) == 2
+    assert rows[1][:2] == [str(active.id), active.name]
+
+
+def test_export_campaigns_rejects_unknown_format(client: TestClient, test_auth_headers: dict):
+    response = client.get(
+        "/api/v1/campaigns/export", headers=test_auth_headers, params={"format": "xml"}
+    )
+    assert response.status_code == 422
+
+
+def test_import_campaigns_ndjson_reports_lines(client: TestClient, test_auth_headers: dict):
+    lines = [
+        json.dumps({"name": "A", "start_date": "2024-01-01", "end_date": "2024-01-31", "budget": 10}),
+        "",
+        "{not json",
+        json.dumps({"name": "B", "start_date": "2024-02-01", "end_date": "2024-02-28", "budget": 0}),
+        json.dumps({"name": "C", "start_date": "2024-03-01", "end_date": "2024-03-31", "budget": 5}),
+    ]
+    body = "\n".join(lines).encode("utf-8")
+
+    def chunks():
+        # Split mid-line to exercise incremental parsing.
+        for start in range(0, len(body), 7):
+            yield body[start:start + 7]
+
+    response = client.post(
+        "/api/v1/campaigns/import",
+        headers=test_auth_headers,
+        params={"batch_size": 1},
+        content=chunks(),
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["received"] == 4
+    assert result["created"] == 2
+    assert result["failed"] == 2
+    assert [error["line"] for error in result["errors"]] == [3, 4]
+    assert result["errors"][0]["errors"][0]["type"] == "json_invalid"
+    assert result["errors_truncated"] is False
+
+    listed = client.get("/api/v1/campaigns/", headers=test_auth_headers).json()
+    assert sorted(item["name"] for item in listed["items"]) == ["A", "C"]
+
+
+def test_import_campaigns_csv_roundtrips_export(
+    client: TestClient, test_auth_headers: dict, create_test_campaign
+):
+    create_test_campaign(
+        name="Multi\nline, \"quoted\"",
+        description="Plain",
+        start_date=date(2024, 5, 1),
+        end_date=date(2024, 5, 31),
+        budget=42,
+        is_active=False,
+    )
+    exported = client.get(
+        "/api/v1/campaigns/export", headers=test_auth_headers, params={"format": "csv"}
+    ).content
+
+    response = client.post(
+        "/api/v1/campaigns/import",
+        headers=test_auth_headers,
+        params={"format": "csv"},
+        content=exported + b"1,too,few\n",
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result["created"] == 1
+    assert result["errors"] == [
+        {"line": 4, "errors": [{"type": "csv_invalid", "msg": "Expected 7 fields, got 3"}]}
+    ]
+
+    listed = client.get(
+        "/api/v1/campaigns/", headers=test_auth_headers, params={"is_active": False}
+    ).json()
+    assert [item["name"] for item in listed["items"]] == ["Multi\nline, \"quoted\""] * 2
+
+
+def test_search_campaigns(client: TestClient, test_auth_headers: dict, create_test_campaign):
+    window = {"start_date": date(2024, 1, 1), "end_date": date(2024, 1, 31), "budget": 100}
+    create_test_campaign(name="Acme summer", description="Beach towels", **window)
+    best = create_test_campaign(name="Acme Acme", description="Acme everywhere", **window)
+    create_test_campaign(name="Other", description="Nothing here", **window)
+
+    response = client.get(
+        "/api/v1/campaigns/", headers=test_auth_headers, params={"q": "acm", "limit": 1}
+    )
+    assert response.status_code == 200
+    page = response.json()
+    assert page["total"] == 2
+    assert [item["id"] for item in page["items"]] == [best.id]
+    assert page["next_cursor"] is None
+
+    response = client.get(
+        "/api/v1/campaigns/",
+        headers=test_auth_headers,
+        params={"q": "acme", "sort": "name"},
+    )
+    assert [item["name"] for item in response.json()["items"]] == ["Acme Acme", "Acme summer"]
+
+    response = client.get(
+        "/api/v1/campaigns/",
+        headers=test_auth_headers,
+        params={"q": "acme", "cursor": "WyJpZCIsMSwxXQ"},
+    )
+    assert response.status_code == 400
+
+
+def test_blank_search_is_ignored(client: TestClient, test_auth_headers: dict):
+    window = {"start_date": "2024-01-01", "end_date": "2024-01-31", "budget": 100}
+    client.post(
+        "/api/v1/campaigns/bulk",
+        headers=test_auth_headers,
+        json=[{"name": "Blank one", **window}, {"name": "Blank two", **window}],
+    )
+
+    for q in ("", "   ", "--"):
+        params = {"q": q}
+        page = client.get("/api/v1/campaigns/", headers=test_auth_headers, params=params)
+        assert page.json()["total"] == 2
+        stats = client.get("/api/v1/campaigns/stats", headers=test_auth_headers, params=params)
+        assert stats.json()["count"] == 2
+        exported = client.get(
+            "/api/v1/campaigns/export", headers=test_auth_headers, params=params
+        )
+        assert len(exported.text.splitlines()) == 2
+
+
+def test_campaign_stats(client: TestClient, test_auth_headers: dict, create_test_user):
+    payloads = [
+        {"name": "A", "start_date": "2024-01-10", "end_date": "2024-02-10", "budget": 100, "is_active": True},
+        {"name": "B", "start_date": "2024-01-20", "end_date": "2024-01-30", "budget": 50},
+        {"name": "C", "start_date": "2024-03-01", "end_date": "2024-03-31", "budget": 30, "is_active": True},
+    ]
+    ids = client.post(
+        "/api/v1/campaigns/bulk", headers=test_auth_headers, json=payloads
+    ).json()["ids"]
+    client.put(
+        f"/api/v1/campaigns/{ids[2]}", headers=test_auth_headers, json={"budget": 60}
+    )
+
+    response = client.get("/api/v1/campaigns/stats", headers=test_auth_headers)
+    assert response.status_code == 200
+    assert response.json() == {
+        "count": 3,
+        "active_count": 2,
+        "inactive_count": 1,
+        "budget_total": 210.0,
+        "budget_average": 70.0,
+        "by_month": [
+            {"month": "2024-01-01", "count": 2, "budget_total": 150.0},
+            {"month": "2024-03-01", "count": 1, "budget_total": 60.0},
+        ],
+    }
+
+    response = client.get(
+        "/api/v1/campaigns/stats",
+        headers=test_auth_headers,
+        params={"is_active": True, "start_date": "2024-02-01", "end_date": "2024-02-28"},
+    )
+    assert response.json()["count"] == 1
+    assert response.json()["budget_total"] == 100.0
+
+    # Rebuilding the rollup is reserved to superusers.
+    response = client.post("/api/v1/campaigns/stats/rebuild", headers=test_auth_headers)
+    assert response.status_code == 403
+
+    create_test_user(email="admin@example.com", password="adminpassword", is_superuser=True)
+    token = client.post(
+        "/api/v1/auth/login", json={"email": "admin@example.com", "password": "adminpassword"}
+    ).json()["access_token"]
+    response = client.post(
+        "/api/v1/campaigns/stats/rebuild", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 200
+    assert response.json()["budget_total"] == 210.0
+
+
+def test_cached_campaign_reads_follow_writes(
+    client: TestClient, test_auth_headers: dict, create_test_user
+):
+    created = client.post(
+        "/api/v1/campaigns/",
+        headers=test_auth_headers,
+        json={"name": "Hot", "start_date": "2024-01-01", "end_date": "2024-01-31", "budget": 10},
+    ).json()
+    url = f"/api/v1/campaigns/{created['id']}"
+
+    assert client.get(url, headers=test_auth_headers).json()["name"] == "Hot"
+    assert client.get(url, headers=test_auth_headers).json()["name"] == "Hot"
+    client.put(url, headers=test_auth_headers, json={"name": "Hotter"})
+    assert client.get(url, headers=test_auth_headers).json()["name"] == "Hotter"
+    client.post(
+        "/api/v1/campaigns/bulk/activate", headers=test_auth_headers, json={"ids": [created["id"]]}
+    )
+    assert client.get(url, headers=test_auth_headers).json()["is_active"] is True
+    client.delete(url, headers=test_auth_headers)
+    assert client.get(url, headers=test_auth_headers).status_code == 404
+
+    assert client.get("/api/v1/metrics/cache", headers=test_auth_headers).status_code == 403
+    create_test_user(email="admin@example.com", password="adminpassword", is_superuser=True)
+    token = client.post(
+        "/api/v1/auth/login", json={"email": "admin@example.com", "password": "adminpassword"}
+    ).json()["access_token"]
+    stats = client.get(
+        "/api/v1/metrics/cache", headers={"Authorization": f"Bearer {token}"}
+    ).json()["campaigns"]
+    assert stats["hits"] >= 1
+    assert stats["misses"] >= 1
+
+    pools = client.get(
+        "/api/v1/metrics/pool", headers={"Authorization": f"Bearer {token}"}
+    ).json()
+    assert {"pool", "checkouts", "checkins", "slow_waits"} <= set(pools["primary"])
+
+
+def test_cached_list_pages_follow_writes(client: TestClient, test_auth_headers: dict):
+    params = {"is_active": True, "limit": 10}
+
+    def names():
+        page = client.get("/api/v1/campaigns/", headers=test_auth_headers, params=params).json()
+        return [item["name"] for item in page["items"]], page["total"]
+
+    assert names() == ([], 0)
+    created = client.post(
+        "/api/v1/campaigns/",
+        headers=test_auth_headers,
+        json={
+            "name": "Polled",
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-31",
+            "budget": 10,
+            "is_active": True,
+        },
+    ).json()
+    assert names() == (["Polled"], 1)
+    assert names() == (["Polled"], 1)
+
+    client.post(
+        "/api/v1/campaigns/bulk/deactivate",
+        headers=test_auth_headers,
+        json={"ids": [created["id"]]},
+    )
+    assert names() == ([], 0)
+
+
+def test_campaign_etag_and_conditional_get(client: TestClient, test_auth_headers: dict):
+    created = client.post(
+        "/api/v1/campaigns/",
+        headers=test_auth_headers,
+        json={
+            "name": "Tagged",
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-31",
+            "budget": 10,
+        },
+    ).json()
+    url = f"/api/v1/campaigns/{created['id']}"
+    assert created["version"] == 1
+
+    response = client.get(url, headers=test_auth_headers)
+    etag = response.headers["etag"]
+    assert etag == f'"campaign-{created["id"]}-v1"'
+    last_modified = response.headers["last-modified"]
+
+    not_modified = client.get(url, headers={**test_auth_headers, "If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+    assert client.get(
+        url, headers={**test_auth_headers, "If-Modified-Since": last_modified}
+    ).status_code == 304
+    assert client.get(
+        url, headers={**test_auth_headers, "If-None-Match": '"campaign-0-v1"'}
+    ).status_code == 200
+    assert client.get(
+        "/api/v1/campaigns/999999", headers={**test_auth_headers, "If-None-Match": etag}
+    ).status_code == 404
+
+    stale = client.put(
+        url, headers={**test_auth_headers, "If-Match": '"campaign-1-v0"'}, json={"budget": 20}
+    )
+    assert stale.status_code == 412
+    updated = client.put(
+        url, headers={**test_auth_headers, "If-Match": etag}, json={"budget": 20}
+    )
+    assert updated.status_code == 200
+    assert updated.json()["version"] == 2
+    new_etag = updated.headers["etag"]
+    assert new_etag != etag
+
+    # The old validator no longer matches: the client gets the new body.
+    refreshed = client.get(url, headers={**test_auth_headers, "If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.json()["budget"] == 20
+
+    assert client.delete(
+        url, headers={**test_auth_headers, "If-Match": etag}
+    ).status_code == 412
+    assert client.delete(
+        url, headers={**test_auth_headers, "If-Match": new_etag}
+    ).status_code == 200
+
+
+def test_campaign_list_etag_changes_with_data(client: TestClient, test_auth_headers: dict):
+    params = {"limit": 10}
+
+    def list_page(etag=None):
+        headers = dict(test_auth_headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        return client.get("/api/v1/campaigns/", headers=headers, params=params)
+
+    first = list_page()
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+    assert list_page(etag).status_code == 304
+    assert client.get(
+        "/api/v1/campaigns/",
+        headers={**test_auth_headers, "If-None-Match": etag},
+        params={"limit": 5},
+    ).status_code == 200
+
+    created = client.post(
+        "/api/v1/campaigns/",
+        headers=test_auth_headers,
+        json={
+            "name": "Listed",
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-31",
+            "budget": 10,
+            "is_active": True,
+        },
+    ).json()
+    second = list_page(etag)
+    assert second.status_code == 200
+    assert second.json()["total"] == 1
+    etag = second.headers["etag"]
+
+    client.put(
+        f"/api/v1/campaigns/{created['id']}", headers=test_auth_headers, json={"budget": 5}
+    )
+    third = list_page(etag)
+    assert third.status_code == 200
+    assert third.json()["items"][0]["budget"] == 5
+
+
+def test_campaign_list_reads_page_and_total_in_one_statement(
+    client: TestClient, test_auth_headers: dict, sql_statements: list, monkeypatch
+):
+    client.post(
+        "/api/v1/campaigns/",
+        headers=test_auth_headers,
+        json={"name": "One", "start_date": "2024-01-01", "end_date": "2024-01-31", "budget": 1},
+    )
+    monkeypatch.setattr(settings, "CAMPAIGN_CACHE_ENABLED", False)
+
+    def campaign_statements(headers: dict) -> list:
+        sql_statements.clear()
+        response = client.get("/api/v1/campaigns/", headers={**test_auth_headers, **headers})
+        return response, [s for s in sql_statements if "FROM campaigns" in s]
+
+    response, statements = campaign_statements({})
+    assert response.status_code == 200
+    assert len(statements) == 1
+    # A revalidation costs the same single statement, with no separate scan.
+    response, statements = campaign_statements({"If-None-Match": response.headers["etag"]})
+    assert response.status_code == 304
+    assert len(statements) == 1
+
+
+def test_patch_and_toggle_campaign(client: TestClient, test_auth_headers: dict):
+    created = client.post(
+        "/api/v1/campaigns/",
+        headers=test_auth_headers,
+        json={
+            "name": "Toggled",
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-31",
+            "budget": 10,
+        },
+    ).json()
+    url = f"/api/v1/campaigns/{created['id']}"
+
+    patched = client.patch(url, headers=test_auth_headers, json={"description": "New"})
+    assert patched.status_code == 200
+    assert patched.json()["description"] == "New"
+    assert patched.json()["name"] == "Toggled"
+    etag = patched.headers["etag"]
+
+    activated = client.post(
+        f"{url}/activate", headers={**test_auth_headers, "If-Match": etag}
+    )
+    assert activated.status_code == 200
+    assert activated.json()["is_active"] is True
+    assert client.post(
+        f"{url}/deactivate", headers={**test_auth_headers, "If-Match": etag}
+    ).status_code == 412
+    assert client.post(
+        f"{url}/deactivate", headers={**test_auth_headers, "If-Match": activated.headers["etag"]}
+    ).json()["is_active"] is False
+    assert client.post(
+        "/api/v1/campaigns/999999/activate", headers=test_auth_headers
+    ).status_code == 404
+    assert client.patch(
+        "/api/v1/campaigns/999999", headers=test_auth_headers, json={"name": "x"}
+    ).status_code == 404
+
+    stats = client.get("/api/v1/campaigns/stats", headers=test_auth_headers).json()
+    assert (stats["count"], stats["active_count"], stats["inactive_count"]) == (1, 0, 1)
+
+
+def test_sparse_fieldsets(client: TestClient, test_auth_headers: dict, create_test_campaign):
+    for name, budget in (("Wide A", 30.0), ("Wide B", 10.0), ("Wide C", 20.0)):
+        create_test_campaign(
+            name=name,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            budget=budget,
+            description="x" * 1000,
+        )
+
+    params = {"fields": "name,budget", "sort": "budget", "limit": 2}
+    page = client.get("/api/v1/campaigns/", headers=test_auth_headers, params=params)
+    assert page.status_code == 200
+    assert page.headers["etag"].startswith('W/"')
+    data = page.json()
+    assert data["total"] == 3
+    assert [item["name"] for item in data["items"]] == ["Wide B", "Wide C"]
+    assert set(data["items"][0]) == {"id", "name", "budget"}
+
+    # The cursor still works although no sort column was requested.
+    params = {"fields": "name", "sort": "budget", "limit": 2, "cursor": data["next_cursor"]}
+    rest = client.get("/api/v1/campaigns/", headers=test_auth_headers, params=params).json()
+    assert rest["items"] == [{"id": rest["items"][0]["id"], "name": "Wide A"}]
+
+    campaign_id = data["items"][0]["id"]
+    item = client.get(
+        f"/api/v1/campaigns/{campaign_id}",
+        headers=test_auth_headers,
+        params={"fields": "name,start_date"},
+    )
+    assert item.json() == {"id": campaign_id, "name": "Wide B", "start_date": "2024-01-01"}
+    assert item.headers["etag"] == f'"campaign-{campaign_id}-v1"'
+
+    assert client.get(
+        "/api/v1/campaigns/", headers=test_auth_headers, params={"fields": "name,secret"}
+    ).status_code == 400
+    assert client.get(
+        "/api/v1/campaigns/999999", headers=test_auth_headers, params={"fields": "name"}
+    ).status_code == 404
+
+
+def test_list_responses_are_cached_compressed_and_invalidated(
+    client: TestClient, test_auth_headers: dict, create_test_campaign
+):
+    for index in range(3):
+        create_test_campaign(
+            name=f"Hot {index}",
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            budget=10 + index,
+            description="x" * 1000,
+        )
+
+    def list_page(encoding="gzip", **params):
+        return client.get(
+            "/api/v1/campaigns/",
+            headers={**test_auth_headers, "Accept-Encoding": encoding},
+            params={"limit": 10, **params},
+        )
+
+    first = list_page()
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["vary"] == "Accept-Encoding"
+    assert first.json()["total"] == 3
+    assert campaign_response_cache.stats()["size"] == 2  # plain + gzip bodies
+
+    again = list_page()
+    assert again.content == first.content
+    assert campaign_response_cache.stats()["hits"] == 2
+
+    plain = list_page("identity")
+    assert "content-encoding" not in plain.headers
+    assert plain.content == first.content
+    assert campaign_response_cache.stats()["hits"] == 3
+
+    # Writes make every cached body unreachable.
+    campaign_id = first.json()["items"][0]["id"]
+    client.patch(
+        f"/api/v1/campaigns/{campaign_id}", headers=test_auth_headers, json={"name": "Renamed"}
+    )
+    assert list_page().json()["items"][0]["name"] == "Renamed"
+    client.delete(f"/api/v1/campaigns/{campaign_id}", headers=test_auth_headers)
+    assert list_page().json()["total"] == 2
+
+    # Later pages are not cached, but still compressed when large enough.
+    campaign_response_cache.clear()
+    later = list_page(skip=1)
+    assert later.headers["content-encoding"] == "gzip"
+    assert later.json()["total"] == 2
+    assert campaign_response_cache.stats()["size"] == 0
+
+    small = list_page(fields="name")
+    assert "content-encoding" not in small.headers
+    assert small.headers["vary"] == "Accept-Encoding"
@@ -1,8 +1,12 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
-
+from sqlalchemy import create_engine, text
 
 from app.presentation.api.v1.main import app as fastapi_app
 
@@ -31,3 +35,51 @@ def test_lifespan_startup_calls_init_db(mocker):
             mock_init_db.assert_called_once()
     finally:
         pass
+
+
+def test_ready_after_startup():
+    assert TestClient(fastapi_app).get("/ready").status_code == 503
+    with TestClient(fastapi_app) as client:
+        response = client.get("/ready")
+    assert response.status_code == 200
+    assert {"schema", "init_db", "warm_up", "total"} <= response.json()["startup_seconds"].keys()
+
+
+WORKER = """
+import asyncio
+from fastapi import FastAPI
+from app.presentation.api.v1.lifespan import lifespan
+
+async def main():
+    async with lifespan(FastAPI()):
+        pass
+
+asyncio.run(main())
+"""
+
+
+def test_concurrent_workers_bootstrap_once(tmp_path):
+    """Eight workers starting at once on a new database all start, and seed it once."""
+    url = f"sqlite:///{tmp_path / 'workers.db'}"
+    env = {
+        **os.environ,
+        "DATABASE_URL": url,
+        "LOG_LEVEL": "WARNING",
+        "SEED_DEMO_DATA": "true",
+        "PYTHONPATH": str(Path(__file__).parents[4]),
+    }
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-c", WORKER], env=env, cwd=tmp_path, stderr=subprocess.PIPE
+        )
+        for _ in range(8)
+    ]
+    for worker in workers:
+        _, stderr = worker.communicate(timeout=300)
+        assert worker.returncode == 0, stderr.decode()
+
+    engine = create_engine(url)
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT count(*) FROM users")).scalar() == 1
+        assert connection.execute(text("SELECT count(*) FROM campaigns")).scalar() == 50
+    engine.dispose()
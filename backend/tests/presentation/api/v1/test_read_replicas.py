@@ -0,0 +1,120 @@
+import sqlite3
+from collections import Counter
+from contextlib import closing
+from typing import Generator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.infrastructure.database.sql_alchemy import session
+from app.infrastructure.database.sql_alchemy.models.base import Base
+from app.infrastructure.database.sql_alchemy.routing import ReadRouter
+from app.infrastructure.database.sql_alchemy.sqlite import read_only_url
+from app.presentation.api.v1.consistency import READ_PRIMARY_COOKIE, ReadYourWritesMiddleware
+from app.presentation.api.v1.routes import auth, campaign, user
+
+
+@pytest.fixture
+def replicated(tmp_path, monkeypatch) -> Generator[tuple, None, None]:
+    """
+    App writing to a SQLite file and reading from two copies of it, which
+    `sync()` brings up to date.
+    """
+    primary_path = tmp_path / "primary.db"
+    replica_paths = [tmp_path / "replica1.db", tmp_path / "replica2.db"]
+    primary = create_engine(f"sqlite:///{primary_path}", poolclass=NullPool)
+    Base.metadata.create_all(bind=primary)
+    replicas = [
+        create_engine(read_only_url(f"sqlite:///{path}"), poolclass=NullPool)
+        for path in replica_paths
+    ]
+    reads = Counter()
+    for name, engine in zip(("replica1", "replica2"), replicas):
+        event.listen(engine, "checkout", lambda *_, name=name: reads.update([name]))
+
+    def sync() -> None:
+        with closing(sqlite3.connect(primary_path)) as source:
+            for path in replica_paths:
+                with closing(sqlite3.connect(path)) as target:
+                    source.backup(target)
+
+    sync()
+    monkeypatch.setattr(session, "SessionLocal", sessionmaker(bind=primary, autoflush=False))
+    monkeypatch.setattr(session, "read_router", ReadRouter(replicas))
+    monkeypatch.setattr(
+        settings, "DATABASE_READ_REPLICA_URLS", [str(engine.url) for engine in replicas]
+    )
+    app = FastAPI()
+    app.include_router(user.router, prefix=f"{settings.API_V1_STR}/users")
+    app.include_router(campaign.router, prefix=f"{settings.API_V1_STR}/campaigns")
+    app.include_router(auth.router, prefix=f"{settings.API_V1_STR}/auth")
+    app.add_middleware(ReadYourWritesMiddleware)
+    with TestClient(app) as client:
+        yield client, sync, reads
+    for engine in (primary, *replicas):
+        engine.dispose()
+
+
+def test_reads_go_to_replicas_except_right_after_a_write(replicated):
+    client, sync, reads = replicated
+    credentials = {"email": "replica@example.com", "password": "replicapassword"}
+    created_user = client.post("/api/v1/users/", json=credentials)
+    assert READ_PRIMARY_COOKIE in created_user.cookies
+    sync()
+    token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    created = client.post(
+        "/api/v1/campaigns/",
+        headers=headers,
+        json={"name": "Replicated", "start_date": "2024-01-01", "end_date": "2024-01-31",
+              "budget": 10},
+    )
+    url = f"/api/v1/campaigns/{created.json()['id']}"
+    # The client's own write is visible: its reads go to the primary...
+    reads.clear()
+    assert client.get(url, headers=headers).status_code == 200
+    assert not reads
+
+    # ...while other clients read from the replicas, not synced yet.
+    client.cookies.clear()
+    assert client.get(url, headers=headers).status_code == 404
+    sync()
+    for _ in range(4):
+        assert client.get(url, headers=headers).status_code == 200
+    assert reads["replica1"] and reads["replica2"]
+
+
+def test_cached_reads_do_not_hide_own_writes(replicated):
+    """Replica reads do not fill the shared caches that primary reads would hit."""
+    client, sync, _ = replicated
+    credentials = {"email": "cached@example.com", "password": "cachedpassword"}
+    client.post("/api/v1/users/", json=credentials)
+    sync()
+    token = client.post("/api/v1/auth/login", json=credentials).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    payload = {
+        "name": "Before", "start_date": "2024-01-01", "end_date": "2024-01-31", "budget": 10
+    }
+    created = client.post("/api/v1/campaigns/", headers=headers, json=payload)
+    url = f"/api/v1/campaigns/{created.json()['id']}"
+    sync()
+
+    updated = client.put(url, headers=headers, json={**payload, "name": "After"})
+    assert updated.status_code == 200
+    read_primary = updated.cookies[READ_PRIMARY_COOKIE]
+
+    # Another client reads the campaign and the list from the lagging replicas...
+    client.cookies.clear()
+    assert client.get(url, headers=headers).json()["name"] == "Before"
+    assert client.get("/api/v1/campaigns/", headers=headers).json()["items"][0]["name"] == "Before"
+
+    # ...which must not answer the writer's reads, made on the primary.
+    client.cookies.set(READ_PRIMARY_COOKIE, read_primary)
+    assert client.get(url, headers=headers).json()["name"] == "After"
+    assert client.get("/api/v1/campaigns/", headers=headers).json()["items"][0]["name"] == "After"
@@ -0,0 +1,61 @@
+import dataclasses
+import gzip
+from datetime import date, datetime, timezone
+
+from app.application.schemas.campaign import Campaign as CampaignSchema
+from app.domain.entities.campaign import Campaign
+from app.presentation.api.v1.responses import (
+    FastJSONResponse,
+    compress,
+    dumps,
+    negotiate_encoding,
+    supported_encodings,
+)
+
+
+def test_campaign_entity_mirrors_read_schema():
+    # Campaign routes encode entities without building the response model.
+    assert [field.name for field in dataclasses.fields(Campaign)] == list(
+        CampaignSchema.model_fields
+    )
+
+
+def test_dumps_matches_pydantic_encoding():
+    campaign = Campaign(
+        "Encoded",
+        None,
+        date(2024, 1, 1),
+        date(2024, 1, 31),
+        1234.5,
+        True,
+        id=3,
+        version=2,
+        updated_at=datetime(2024, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc),
+    )
+    schema = CampaignSchema.model_validate(campaign)
+    assert dumps(campaign) == schema.model_dump_json().encode("utf-8")
+    assert dumps({"items": [schema], "total": 1}) == (
+        b'{"items":[' + schema.model_dump_json().encode("utf-8") + b'],"total":1}'
+    )
+
+    response = FastJSONResponse({"items": [campaign]})
+    assert response.media_type == "application/json"
+    assert response.body == b'{"items":[' + dumps(campaign) + b"]}"
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding(None) is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip, deflate, br") == "gzip"
+    assert negotiate_encoding("GZIP;q=0.5") == "gzip"
+    assert negotiate_encoding("gzip;q=0") is None
+    zstd = "zstd" if "zstd" in supported_encodings() else None
+    assert negotiate_encoding("*;q=0.1, gzip;q=0") == zstd
+    assert negotiate_encoding("*") == supported_encodings()[0]
+    assert negotiate_encoding("br, zstd;q=0.9, gzip") == "gzip"
+
+
+def test_compress_is_deterministic():
+    body = dumps({"items": ["x" * 100] * 10})
+    assert gzip.decompress(compress(body, "gzip")) == body
+    assert compress(body, "gzip") == compress(body, "gzip")
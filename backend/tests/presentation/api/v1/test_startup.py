@@ -0,0 +1,86 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Wall time allowed from process start to the first response, import
+# profiling (-X importtime) included.
+STARTUP_BUDGET_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", "5"))
+
+FIRST_REQUEST = """
+import asyncio
+from app.presentation.api.v1.main import app
+
+async def main():
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": "/", "raw_path": b"/",
+        "query_string": b"", "root_path": "", "headers": [],
+        "client": ("127.0.0.1", 1), "server": ("127.0.0.1", 80),
+    }
+    async with app.router.lifespan_context(app):
+        await app(scope, receive, send)
+    assert sent[0]["status"] == 200, sent
+
+asyncio.run(main())
+"""
+
+
+def import_profile(stderr: str) -> list:
+    """(module, cumulative µs, top-level) entries of an -X importtime profile."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            entries.append((name.strip(), int(cumulative), not name.startswith("  ")))
+    return entries
+
+
+def test_startup_to_first_request_within_budget(tmp_path):
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{tmp_path / 'startup.db'}",
+        "LOG_LEVEL": "WARNING",
+        "LOG_FILE": "",
+        "PYTHONPATH": str(Path(__file__).parents[4]),
+    }
+    env.pop("SEED_DEMO_DATA", None)
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", FIRST_REQUEST],
+        env=env,
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=False,
+    )
+    elapsed = time.perf_counter() - started
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    profile = import_profile(result.stderr)
+    packages = {name.split(".")[0] for name, _, _ in profile}
+    assert "app" in packages
+    # Development-only dependencies stay out of the serving path.
+    assert "faker" not in packages
+    slowest = sorted(
+        ((name, us) for name, us, top_level in profile if top_level),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:10]
+    assert elapsed <= STARTUP_BUDGET_SECONDS, (
+        f"first response after {elapsed:.2f} s (budget {STARTUP_BUDGET_SECONDS} s); "
+        "slowest imports (ms): "
+        + ", ".join(f"{name} {us / 1000:.0f}" for name, us in slowest)
+    )